@@ -0,0 +1,50 @@
+"""Compare the size and decoding time of the cache codecs.
+
+Usage::
+
+    python benchmarks/cache_codecs.py [number of loads]
+"""
+
+import os
+import sys
+import time
+
+from project_config.cache import CACHE_CODECS
+from project_config.serializers import serialize_for_url
+
+
+ROOTDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FILES = (
+    "pyproject.toml",
+    ".pre-commit-config.yaml",
+    os.path.join("contrib", "npm", "package.json"),
+)
+
+
+def main():
+    n_loads = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    for fname in FILES:
+        fpath = os.path.join(ROOTDIR, fname)
+        with open(fpath, encoding="utf-8") as f:
+            tree = serialize_for_url(fpath, f.read())
+
+        sys.stdout.write(f"{fname}\n")
+        for codec_name, encoder, decoder in CACHE_CODECS:
+            try:
+                encoded = encoder(tree)
+            except (ValueError, TypeError):
+                sys.stdout.write(f"{codec_name:>10}: unsupported\n")
+                continue
+            start = time.perf_counter()
+            for _ in range(n_loads):
+                decoder(encoded)
+            elapsed = time.perf_counter() - start
+            sys.stdout.write(
+                f"{codec_name:>10}: {len(encoded)} bytes,"
+                f" {n_loads} loads in {elapsed:.3f}s\n",
+            )
+
+
+if __name__ == "__main__":
+    main()
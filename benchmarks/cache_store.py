@@ -0,0 +1,97 @@
+"""Compare the cache store against the directory of pickles layout.
+
+Usage::
+
+    python benchmarks/cache_store.py [number of entries]
+"""
+
+import base64
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+from project_config.cache import CacheStore
+
+
+def _legacy_key(tree_entry):
+    return base64.urlsafe_b64encode(
+        hashlib.md5(tree_entry.encode()).digest(),
+    ).decode("utf-8")
+
+
+def legacy_set(dirpath, tree_entry, value):
+    fpath = os.path.join(dirpath, _legacy_key(tree_entry))
+    with open(fpath, "wb") as f:
+        f.write(str(int(time.time())).encode())
+        f.write(b"\n")
+        f.write(pickle.dumps(value))
+
+
+def legacy_get(dirpath, tree_entry):
+    fpath = os.path.join(dirpath, _legacy_key(tree_entry))
+    if os.path.isfile(fpath):
+        with open(fpath, "rb") as f:
+            int(f.readline())
+        with open(fpath, "rb") as f:
+            _, content = f.read().split(b"\n", 1)
+        return pickle.loads(content)
+    return None
+
+
+def store_set(store, tree_entry, value):
+    store.set(
+        _legacy_key(tree_entry),
+        "remote",
+        int(time.time()),
+        "pickle",
+        pickle.dumps(value),
+    )
+
+
+def store_get(store, tree_entry):
+    entry = store.get(_legacy_key(tree_entry))
+    return None if entry is None else pickle.loads(entry[2])
+
+
+def _timeit(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    n_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    keys = [f"https://example.com/style-{i}.json5" for i in range(n_entries)]
+    value = {"_plain": "x" * 512, "json5": {"rules": [{"files": ["foo"]}]}}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        legacy_dir = os.path.join(tmpdir, "legacy")
+        os.makedirs(legacy_dir)
+        store = CacheStore(os.path.join(tmpdir, "store"))
+
+        results = {
+            "directory of pickles": (
+                _timeit(
+                    lambda: [legacy_set(legacy_dir, k, value) for k in keys],
+                ),
+                _timeit(lambda: [legacy_get(legacy_dir, k) for k in keys]),
+            ),
+            "single file store": (
+                _timeit(lambda: [store_set(store, k, value) for k in keys]),
+                _timeit(lambda: [store_get(store, k) for k in keys]),
+            ),
+        }
+        store.close()
+
+    sys.stdout.write(f"{n_entries} entries\n")
+    for name, (write_time, read_time) in results.items():
+        sys.stdout.write(
+            f"{name:>22}: write {write_time:.3f}s, read {read_time:.3f}s\n",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measure the time spent importing the modules of the command line.
+
+The slowest modules reported by ``python -X importtime`` are printed
+for each measured statement.
+
+Usage::
+
+    python benchmarks/import_time.py [number of runs]
+"""
+
+import subprocess
+import sys
+import time
+
+
+STATEMENTS = (
+    # executed by `project-config --version`
+    "import project_config.__main__",
+    # executed by `project-config show file`
+    "import project_config.commands.show",
+    "import project_config.serializers",
+)
+N_SLOWEST_MODULES = 5
+
+
+def _import_times(statement):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # lines formatted as "import time: self [us] | cumulative | module"
+    times = []
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, module = line.split("|")
+        times.append((int(cumulative), module.strip()))
+    return sorted(times, reverse=True)
+
+
+def main():
+    n_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    for statement in STATEMENTS:
+        start = time.perf_counter()
+        for _ in range(n_runs):
+            subprocess.run([sys.executable, "-c", statement], check=True)
+        elapsed = (time.perf_counter() - start) / n_runs
+
+        sys.stdout.write(f"{statement}: {elapsed * 1000:.1f}ms\n")
+        for cumulative, module in _import_times(statement)[:N_SLOWEST_MODULES]:
+            sys.stdout.write(f"{cumulative / 1000:>10.1f}ms {module}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compare the TOML read path against parsing with tomlkit.
+
+The inputs are a big ``pyproject.toml`` and a ``Cargo.lock`` of
+thousands of packages.
+
+Usage::
+
+    python benchmarks/toml_loads.py [number of loads]
+"""
+
+import sys
+import time
+
+import tomlkit
+
+from project_config.serializers.toml import loads
+
+
+def _pyproject_toml():
+    lines = [
+        "[project]",
+        'name = "foo"',
+        'version = "1.0.0"',
+        "dependencies = [",
+        *(f'  "dependency-{i}>={i}.0",' for i in range(300)),
+        "]",
+    ]
+    for i in range(200):
+        lines.extend(
+            (
+                f"[tool.tool-{i}]",
+                f'option = "value-{i}"',
+                f"numbers = [{i}, {i + 1}, {i + 2}]",
+                f"inline = {{ enabled = true, level = {i} }}",
+            ),
+        )
+    return "\n".join(lines)
+
+
+def _cargo_lock():
+    lines = ["version = 3"]
+    for i in range(5_000):
+        lines.extend(
+            (
+                "",
+                "[[package]]",
+                f'name = "crate-{i}"',
+                f'version = "0.{i}.0"',
+                'source = "registry+https://github.com/rust-lang/crates.io-index"',
+                f'checksum = "{i:064x}"',
+                "dependencies = [",
+                f' "crate-{i + 1}",',
+                f' "crate-{i + 2}",',
+                "]",
+            ),
+        )
+    return "\n".join(lines)
+
+
+def _tomlkit_loads(string):
+    return tomlkit.loads(string).unwrap()
+
+
+def main():
+    n_loads = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    for name, string in (
+        ("pyproject.toml", _pyproject_toml()),
+        ("Cargo.lock", _cargo_lock()),
+    ):
+        sys.stdout.write(f"{name} ({len(string)} bytes)\n")
+        for parser_name, parser in (
+            ("tomlkit", _tomlkit_loads),
+            ("tomllib", loads),
+        ):
+            start = time.perf_counter()
+            for _ in range(n_loads):
+                parser(string)
+            elapsed = time.perf_counter() - start
+            sys.stdout.write(
+                f"{parser_name:>10}: {n_loads} loads in {elapsed:.3f}s\n",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare the YAML loaders on a directory of GitHub workflows.
+
+Usage::
+
+    PROJECT_CONFIG_YAML_LIBYAML=true python benchmarks/yaml_loads.py [number of files]
+"""  # noqa: E501
+
+import os
+import sys
+import time
+
+import ruamel.yaml
+
+from project_config.serializers.yaml import LIBYAML_ENVVAR, loads
+
+
+WORKFLOW = """name: CI{i}
+
+on:
+  push:
+    branches:
+      - master
+  pull_request:
+
+jobs:
+  test:
+    name: Test
+    runs-on: ${{{{ matrix.platform }}}}
+    strategy:
+      fail-fast: false
+      matrix:
+        include:
+          - platform: ubuntu-latest
+            python-version: "3.8"
+          - platform: macos-latest
+            python-version: "3.12"
+    steps:
+      - uses: actions/checkout@v4
+      - uses: actions/setup-python@v5
+        with:
+          python-version: ${{{{ matrix.python-version }}}}
+      - run: pip install -e .
+      - run: pytest -n {i}
+"""
+
+
+def _ruamel_new_instance_loads(string):
+    return ruamel.yaml.YAML(typ="safe", pure=True).load(string)
+
+
+def main():
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    workflows = [WORKFLOW.format(i=i) for i in range(n_files)]
+
+    loaders = [
+        ("ruamel.yaml (instance by call)", _ruamel_new_instance_loads),
+        ("ruamel.yaml (instance by thread)", loads),
+    ]
+    if os.environ.get(LIBYAML_ENVVAR) == "true":
+        loaders.append(("libyaml", loads))
+        # the previous loaders must not use libyaml
+        os.environ[LIBYAML_ENVVAR] = "false"
+
+    for loader_name, loader in loaders:
+        if loader_name == "libyaml":
+            os.environ[LIBYAML_ENVVAR] = "true"
+        start = time.perf_counter()
+        for workflow in workflows:
+            loader(workflow)
+        elapsed = time.perf_counter() - start
+        sys.stdout.write(
+            f"{loader_name:>32}: {n_files} files in {elapsed:.3f}s\n",
+        )
+
+
+if __name__ == "__main__":
+    main()
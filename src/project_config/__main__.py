@@ -51,6 +51,18 @@ class ReporterAction(argparse.Action):
         namespace.reporter = reporter
 
 
+def _positive_integer(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"'{value}' is not a positive integer",
+        )
+    return number
+
+
 def _controlled_error(
     show_traceback: bool,  # noqa: FBT001
     exc: Exception,
@@ -161,9 +173,37 @@ def build_main_parser() -> argparse.ArgumentParser:  # noqa: D103
         action="store_true",
         help=("Only show the hint messages rather than complete errors."),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_integer,
+        help=(
+            "Number of rules checked in parallel. Rules are always"
+            " executed one after another in fix mode."
+        ),
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help=(
+            "Send check and fix commands to a running daemon started with"
+            " 'project-config daemon', which keeps styles, plugins and"
+            " parsed files in memory between executions. If no daemon is"
+            " listening, the command is executed as usual."
+        ),
+    )
+    parser.add_argument(
+        "--frozen",
+        action="store_true",
+        help=(
+            "Serve remote resources only from the lock file of the"
+            " project created by 'project-config lock', without network"
+            " access. Fails if a resource is not in the lock file."
+        ),
+    )
     parser.add_argument(
         "command",
-        choices=["check", "fix", "show", "clean", "init"],
+        choices=["check", "fix", "show", "clean", "init", "daemon", "lock"],
         help="Command to execute.",
     )
 
@@ -174,7 +214,7 @@ def _parse_command_args(
     command: str,
     subcommand_args: list[str],
 ) -> tuple[argparse.Namespace, list[str]]:
-    if command in ("show", "clean"):
+    if command in ("show", "clean", "daemon", "check"):
         if command == "show":
             parser = argparse.ArgumentParser(prog="project-config show")
             parser.add_argument(
@@ -211,6 +251,69 @@ def _parse_command_args(
                 )
                 subargs, remaining = parser.parse_known_args(remaining)
                 args.__dict__.update(subargs.__dict__)
+            elif args.data == "cache":
+                parser = argparse.ArgumentParser(
+                    prog="project-config show cache",
+                )
+                parser.add_argument(
+                    "--stats",
+                    action="store_true",
+                    help=(
+                        "Show hits, misses, bytes read and written, decoding"
+                        " time, evictions and size by namespace of the"
+                        " cache as a JSON object instead of its location."
+                    ),
+                )
+                subargs, remaining = parser.parse_known_args(remaining)
+                args.__dict__.update(subargs.__dict__)
+            elif args.data == "style":
+                parser = argparse.ArgumentParser(
+                    prog="project-config show style",
+                )
+                parser.add_argument(
+                    "--graph",
+                    action="store_true",
+                    help=(
+                        "Show the graph of styles extended by the project"
+                        " as a JSON object, with the time spent fetching"
+                        " each style and the errors found, instead of the"
+                        " final style."
+                    ),
+                )
+                subargs, remaining = parser.parse_known_args(remaining)
+                args.__dict__.update(subargs.__dict__)
+        elif command == "check":
+            parser = argparse.ArgumentParser(prog="project-config check")
+            parser.add_argument(
+                "--incremental",
+                action="store_true",
+                help=(
+                    "Only execute rules whose inputs have changed since"
+                    " the last incremental check, reporting the errors"
+                    " recorded for the rest."
+                ),
+            )
+            parser.add_argument(
+                "--files",
+                nargs="+",
+                metavar="FILE",
+                help=(
+                    "Files changed since the last incremental check, like"
+                    " the ones listed by 'git diff --name-only'. Implies"
+                    " --incremental and only executes rules that read"
+                    " some of them, without checking the content of the"
+                    " inputs of the rest."
+                ),
+            )
+            args, remaining = parser.parse_known_args(subcommand_args)
+        elif command == "daemon":
+            parser = argparse.ArgumentParser(prog="project-config daemon")
+            parser.add_argument(
+                "--stop",
+                action="store_true",
+                help="Stop the running daemon instead of starting one.",
+            )
+            args, remaining = parser.parse_known_args(subcommand_args)
         else:  # command == "clean"
             parser = argparse.ArgumentParser(prog="project-config clean")
             parser.add_argument(
@@ -221,6 +324,15 @@ def _parse_command_args(
                     " 'cache' is the possible data to clean."
                 ),
             )
+            parser.add_argument(
+                "--prune",
+                action="store_true",
+                help=(
+                    "Only evict stale entries and the least recently used"
+                    " ones if the cache exceeds its maximum size, instead"
+                    " of removing the whole cache."
+                ),
+            )
             args, remaining = parser.parse_known_args(subcommand_args)
 
     else:
@@ -253,6 +365,9 @@ def parse_args(argv: list[str]) -> argparse.Namespace:  # noqa: D103
         args.config = os.path.abspath(
             os.path.relpath(args.config, os.getcwd()),
         )
+    # changed files are relative to the working directory, not to rootdir
+    if getattr(subargs, "files", None) is not None:
+        subargs.files = [os.path.abspath(fpath) for fpath in subargs.files]
 
     return argparse.Namespace(**vars(args), **vars(subargs))
 
@@ -264,6 +379,17 @@ def run(argv: list[str]) -> int:  # noqa: D103
     try:
         args = parse_args(argv)
         show_traceback = args.traceback
+        if args.daemon:
+            from project_config.daemon import DAEMON_COMMANDS, send_command
+
+            if args.command in DAEMON_COMMANDS:
+                response = send_command(
+                    [arg for arg in argv if arg != "--daemon"],
+                )
+                if response is not None:
+                    sys.stdout.write(response["stdout"])
+                    sys.stderr.write(response["stderr"])
+                    return response["exit_code"]
         command_module = importlib.import_module(
             f"project_config.commands.{args.command}",
         )
@@ -276,6 +402,11 @@ def run(argv: list[str]) -> int:  # noqa: D103
             exc,
             f"{exc.args[1]} '{exc.filename}'",
         )
+    finally:
+        # store the statistics of the cache if used by the command
+        cache_module = sys.modules.get("project_config.cache")
+        if cache_module is not None:
+            cache_module.Cache.flush_stats()
     return 0
 
 
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import base64
+import contextlib
+import functools
 import hashlib
+import marshal
 import os
 import pickle
 import re
 import shutil
+import sqlite3
 import sys
+import threading
 import time
-from typing import Any, Iterator
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Iterator, TypeVar
 
 import appdirs
 
@@ -31,6 +38,116 @@ CACHE_DIR = appdirs.user_data_dir(
     ),
 )
 
+CACHE_DB_FILENAME = "cache.sqlite3"
+# Increment it when the layout of the database or of the stored values
+# changes. Databases created with other versions are discarded when opened.
+CACHE_SCHEMA_VERSION = 5
+
+# Namespaces of cache entries, which can be configured with different
+# expiration times
+CACHE_NAMESPACES = (
+    "remote",
+    "jmespath",
+    "jmespath-evaluation",
+    "local-file",
+    "fingerprint",
+    "incremental",
+    "rule-result",
+    "http-validation",
+)
+
+# Namespaces whose expired entries are retained while the entries of
+# other namespace don't expire. Remote responses are kept while their
+# validators live to reuse them if the server responds that they have
+# not been modified.
+CACHE_NAMESPACES_RETAINED_BY = {"remote": "http-validation"}
+
+# Prefixes of tree entries stored in namespaces other than remote and
+# local files, more specific prefixes first
+CACHE_NAMESPACES_PREFIXES = (
+    ("jm://E?", "jmespath-evaluation"),
+    ("jm://", "jmespath"),
+    ("fp://", "fingerprint"),
+    ("ic://", "incremental"),
+    ("rr://", "rule-result"),
+    ("hv://", "http-validation"),
+)
+
+# Minimum time in seconds between automatic prunes of the cache
+CACHE_PRUNE_INTERVAL = 60 * 60
+
+# Statistics recorded by namespace of the cache
+CACHE_STATS_FIELDS = (
+    "hits",
+    "misses",
+    "bytes_read",
+    "bytes_written",
+    "decode_time",
+    "evictions",
+)
+
+# Codecs used to store the values of the cache as
+# (name, encoder, decoder), tried in order to encode them.
+#
+# marshal is faster and more compact than pickle, but it only supports
+# builtin types, so it can encode JSON-compatible trees returned by
+# most serializers. Other objects fall back to pickle.
+#
+# The encoders of the codecs different to the last one must raise
+# ``ValueError`` or ``TypeError`` for unsupported values.
+CACHE_CODECS: list[
+    tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]
+] = [
+    ("marshal", marshal.dumps, marshal.loads),
+    ("pickle", pickle.dumps, pickle.loads),
+]
+
+
+def encode_cache_value(value: Any) -> tuple[str, bytes]:
+    """Encode a value of the cache with the first codec that supports it.
+
+    Args:
+        value (Any): Value to encode.
+
+    Returns:
+        tuple: Name of the codec used and encoded value.
+    """
+    for codec_name, encoder, _ in CACHE_CODECS[:-1]:
+        try:
+            return codec_name, encoder(value)
+        except (ValueError, TypeError):
+            continue
+    codec_name, encoder, _ = CACHE_CODECS[-1]
+    return codec_name, encoder(value)
+
+
+# Errors raised by the decoders of the codecs for corrupted values
+CACHE_DECODE_ERRORS = (
+    EOFError,
+    ValueError,
+    TypeError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    pickle.UnpicklingError,
+)
+
+
+def decode_cache_value(codec_name: str, encoded_value: bytes) -> Any:
+    """Decode a value of the cache.
+
+    Args:
+        codec_name (str): Name of the codec used to encode the value.
+        encoded_value (bytes): Encoded value.
+
+    Returns:
+        Any: Decoded value.
+    """
+    for name, _, decoder in CACHE_CODECS:
+        if name == codec_name:
+            return decoder(encoded_value)
+    raise ValueError(f"Unknown cache codec '{codec_name}'")
+
 
 def generate_possible_cache_dirs() -> Iterator[str]:
     """Generate the possible cache directories."""
@@ -48,43 +165,582 @@ def generate_possible_cache_dirs() -> Iterator[str]:
         )
 
 
-def get_creation_time_from_fpath(fpath: str) -> int:
-    """Get creation time of an entry in the cache given its path."""
-    with open(fpath, "rb") as file:
-        return int(file.readline())
+def namespace_from_tree_entry(tree_entry: str) -> str:
+    """Get the namespace of a cache entry given its tree entry.
+
+    Args:
+        tree_entry (str): Tree entry used as the key of the entry.
+
+    Returns:
+        str: One of the :py:data:`CACHE_NAMESPACES`.
+    """
+    for prefix, namespace in CACHE_NAMESPACES_PREFIXES:
+        if tree_entry.startswith(prefix):
+            return namespace
+    if "://" in tree_entry:
+        return "remote"
+    # local files are cached by the digest of their content
+    return "local-file"
+
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+
+def _synchronized(method: T) -> T:
+    """Execute a method holding the lock of its instance."""
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
+class CacheStore:
+    """Single-file indexed storage for cache entries.
+
+    All the entries are stored in one SQLite database inside the cache
+    directory, indexed by key, so a lookup is a single indexed query
+    instead of several file opens in the cache directory.
+
+    Every write is an atomic transaction, so several processes can share
+    the same cache directory: readers never observe partial writes and
+    concurrent writers wait for the database lock up to ``timeout``
+    seconds.
+
+    Args:
+        dirpath (str): Directory where the database will be stored.
+        timeout (float): Seconds to wait for the lock of the database
+            before raising :py:class:`sqlite3.OperationalError`.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        dirpath: str,
+        timeout: float = 30,
+    ) -> None:
+        self.dirpath = dirpath
+        self.path = os.path.join(dirpath, CACHE_DB_FILENAME)
+        self.timeout = timeout
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        # the connection is shared by the threads of the process
+        self._lock = threading.RLock()
+
+    @property
+    @_synchronized
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the database, opened on demand.
+
+        A new connection is opened if the process has been forked
+        because SQLite connections can't be shared between processes.
+        If the database file is corrupted, it is replaced by a new one.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(self.dirpath, exist_ok=True)
+            try:
+                connection = self._connect()
+            except sqlite3.OperationalError:
+                raise
+            except sqlite3.DatabaseError:
+                self._remove_files()
+                connection = self._connect()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._prepare_schema(connection)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def _remove_files(self) -> None:
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(f"{self.path}{suffix}")
+
+    @_synchronized
+    def recover(self) -> None:
+        """Replace a corrupted database by a new empty one.
+
+        Other processes with the corrupted database opened keep using it
+        until they reopen their connections.
+        """
+        self.close()
+        self._remove_files()
+
+    @staticmethod
+    def _prepare_schema(connection: sqlite3.Connection) -> None:
+        schema_version = connection.execute("PRAGMA user_version").fetchone()
+        if schema_version[0] == CACHE_SCHEMA_VERSION:
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        # another process could have prepared it while waiting for the lock
+        schema_version = connection.execute("PRAGMA user_version").fetchone()
+        if schema_version[0] != CACHE_SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS entries")
+            connection.execute("DROP TABLE IF EXISTS meta")
+            connection.execute("DROP TABLE IF EXISTS stats")
+            connection.execute(
+                "CREATE TABLE entries ("
+                " key TEXT PRIMARY KEY,"
+                " namespace TEXT NOT NULL,"
+                " created INTEGER NOT NULL,"
+                " accessed INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " codec TEXT NOT NULL,"
+                " value BLOB NOT NULL"
+                ")",
+            )
+            connection.execute(
+                "CREATE INDEX entries_namespace_created"
+                " ON entries (namespace, created)",
+            )
+            connection.execute(
+                "CREATE INDEX entries_accessed ON entries (accessed)",
+            )
+            connection.execute(
+                "CREATE TABLE meta (name TEXT PRIMARY KEY, value)",
+            )
+            connection.execute(
+                "CREATE TABLE stats (namespace TEXT PRIMARY KEY, "
+                + ", ".join(
+                    f"{field} NOT NULL DEFAULT 0"
+                    for field in CACHE_STATS_FIELDS
+                )
+                + ")",
+            )
+            connection.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+        connection.execute("COMMIT")
+
+    @_synchronized
+    def get(self, key: str) -> tuple[int, str, bytes] | None:
+        """Get the creation time, the codec and the value of an entry.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            tuple: Creation time, codec name and encoded value of the
+                entry or ``None`` if the entry does not exist.
+        """
+        row = self.connection.execute(
+            "SELECT created, codec, value FROM entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        return None if row is None else (row[0], row[1], row[2])
+
+    @_synchronized
+    def set(  # noqa: PLR0913
+        self,
+        key: str,
+        namespace: str,
+        created: int,
+        codec: str,
+        value: bytes,
+    ) -> None:
+        """Insert or replace an entry.
+
+        Args:
+            key (str): Key of the entry.
+            namespace (str): Namespace of the entry.
+            created (int): Creation time of the entry.
+            codec (str): Name of the codec used to encode the value.
+            value (bytes): Encoded value of the entry.
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO entries"
+            " (key, namespace, created, accessed, size, codec, value)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                namespace,
+                created,
+                created,
+                len(key) + len(value),
+                codec,
+                value,
+            ),
+        )
+
+    @_synchronized
+    def touch(self, key: str, accessed: int) -> None:
+        """Update the last access time of an entry.
+
+        Args:
+            key (str): Key of the entry.
+            accessed (int): Access time.
+        """
+        self.connection.execute(
+            "UPDATE entries SET accessed = ? WHERE key = ?",
+            (accessed, key),
+        )
+
+    @_synchronized
+    def delete(self, key: str) -> None:
+        """Delete an entry.
+
+        Args:
+            key (str): Key of the entry.
+        """
+        self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    @_synchronized
+    def size(self) -> int:
+        """Total size in bytes of the stored entries."""
+        return self.connection.execute(  # type: ignore
+            "SELECT COALESCE(SUM(size), 0) FROM entries",
+        ).fetchone()[0]
+
+    @_synchronized
+    def get_meta(self, name: str) -> Any:
+        """Get a metadata value of the store.
+
+        Args:
+            name (str): Name of the metadata value.
+        """
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE name = ?",
+            (name,),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    @_synchronized
+    def set_meta(self, name: str, value: Any) -> None:
+        """Set a metadata value of the store.
+
+        Args:
+            name (str): Name of the metadata value.
+            value (Any): Value to store.
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+            (name, value),
+        )
+
+    @_synchronized
+    def add_stats(self, stats: dict[str, dict[str, float | int]]) -> None:
+        """Add statistics to the stored ones.
+
+        Args:
+            stats (dict): Amounts to add for each field of
+                :py:data:`CACHE_STATS_FIELDS` by namespace.
+        """
+        fields = ", ".join(CACHE_STATS_FIELDS)
+        placeholders = ", ".join("?" for _ in CACHE_STATS_FIELDS)
+        updates = ", ".join(
+            f"{field} = {field} + excluded.{field}"
+            for field in CACHE_STATS_FIELDS
+        )
+        self.connection.executemany(
+            f"INSERT INTO stats (namespace, {fields})"  # noqa: S608
+            f" VALUES (?, {placeholders})"
+            f" ON CONFLICT (namespace) DO UPDATE SET {updates}",
+            [
+                (
+                    namespace,
+                    *(
+                        namespace_stats.get(field, 0)
+                        for field in CACHE_STATS_FIELDS
+                    ),
+                )
+                for namespace, namespace_stats in stats.items()
+            ],
+        )
+
+    @_synchronized
+    def get_stats(self) -> dict[str, dict[str, float | int]]:
+        """Get the stored statistics and the current usage by namespace.
+
+        Returns:
+            dict: Fields of :py:data:`CACHE_STATS_FIELDS` plus the
+                number of ``entries`` and their ``size`` in bytes by
+                namespace.
+        """
+        stats: dict[str, dict[str, float | int]] = {
+            namespace: {
+                **dict.fromkeys(CACHE_STATS_FIELDS, 0),
+                "entries": 0,
+                "size": 0,
+            }
+            for namespace in CACHE_NAMESPACES
+        }
+        for namespace, *values in self.connection.execute(
+            f"SELECT namespace, {', '.join(CACHE_STATS_FIELDS)}"  # noqa: S608
+            " FROM stats",
+        ):
+            stats.setdefault(namespace, {}).update(
+                zip(CACHE_STATS_FIELDS, values),
+            )
+        for namespace, entries, size in self.connection.execute(
+            "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0)"
+            " FROM entries GROUP BY namespace",
+        ):
+            stats.setdefault(namespace, {}).update(entries=entries, size=size)
+        return stats
+
+    @_synchronized
+    def prune(
+        self,
+        expiration_times: dict[str, float | int],
+        max_size: int | None = None,
+    ) -> dict[str, int]:
+        """Evict stale entries and the least recently used if overweight.
+
+        Args:
+            expiration_times (dict): Expiration time in seconds by namespace.
+            max_size (int): Maximum size in bytes of the entries. If the
+                store exceeds it after removing stale entries, the least
+                recently used ones are removed until it fits.
+
+        Returns:
+            dict: Number of entries evicted by namespace.
+        """
+        now = int(time.time())
+        evicted: dict[str, int] = {}
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for namespace, expiration_time in expiration_times.items():
+                evicted[namespace] = connection.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND created <= ?",
+                    (namespace, now - expiration_time),
+                ).rowcount
+
+            if max_size is not None:
+                overweight = self.size() - max_size
+                if overweight > 0:
+                    keys = []
+                    for key, namespace, size in connection.execute(
+                        "SELECT key, namespace, size FROM entries"
+                        " ORDER BY accessed",
+                    ):
+                        keys.append((key,))
+                        evicted[namespace] = evicted.get(namespace, 0) + 1
+                        overweight -= size
+                        if overweight <= 0:
+                            break
+                    connection.executemany(
+                        "DELETE FROM entries WHERE key = ?",
+                        keys,
+                    )
+            self.set_meta("last_prune", now)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return evicted
+
+    @_synchronized
+    def vacuum(self) -> None:
+        """Rebuild the database file to release the space of removed entries."""
+        self.connection.execute("VACUUM")
 
+    @_synchronized
+    def close(self) -> None:
+        """Close the connection to the database if opened."""
+        if self._connection is not None:
+            if self._pid == os.getpid():
+                with contextlib.suppress(sqlite3.Error):
+                    self._connection.close()
+            self._connection = None
+            self._pid = None
 
-def read_file(fpath: str) -> bytes:  # noqa: D102
-    """Read a file from the cache."""
-    with open(fpath, "rb") as f:
-        fcontent = f.read()
-        _, content = fcontent.split(b"\n", 1)
-        return content
 
+class MemoryCacheTier:
+    """Bounded in-process LRU tier in front of the persistent store.
 
-def write_file(fpath: str, value: Any) -> None:  # noqa: D102
-    """Write a file to the cache."""
-    with open(fpath, "wb") as f:
-        f.write(str(int(time.time())).encode())
-        f.write(b"\n")
-        f.write(pickle.dumps(value))
+    Values are stored as objects, so a hit doesn't need to unpickle them.
+
+    Args:
+        maxsize (int): Maximum number of entries stored. When exceeded,
+            the least recently used entry is discarded.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:  # noqa: D107
+        self.maxsize = maxsize
+        self.entries: OrderedDict[str, tuple[int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @_synchronized
+    def get(self, key: str) -> tuple[int, Any] | None:
+        """Get the creation time and the value of an entry.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            tuple: Creation time and value of the entry or ``None``
+                if the entry does not exist.
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    @_synchronized
+    def set(self, key: str, created: int, value: Any) -> None:
+        """Insert or replace an entry.
+
+        Args:
+            key (str): Key of the entry.
+            created (int): Creation time of the entry.
+            value (Any): Value of the entry.
+        """
+        self.entries[key] = (created, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    @_synchronized
+    def delete(self, key: str) -> None:
+        """Delete an entry if exists.
+
+        Args:
+            key (str): Key of the entry.
+        """
+        self.entries.pop(key, None)
+
+    @_synchronized
+    def clear(self) -> None:
+        """Delete all the entries."""
+        self.entries.clear()
 
 
 class Cache:
-    """Global cache to avoid recomputing expensive intermediate objects."""
+    """Global cache to avoid recomputing expensive intermediate objects.
+
+    Lookups are served first by an in-process memory tier and then by the
+    persistent store. Writes go through both tiers.
+
+    Values returned by the memory tier are shared between all the
+    callers, so they must not be mutated. Copy them before if needed.
+    """
 
     _expiration_time: float | int | None = 30
+    _namespaces_expiration_times: dict[str, float | int] = {}
+    _max_size: int | None = None
+    _store = CacheStore(CACHE_DIR)
+    _memory = MemoryCacheTier()
+
+    # hit and miss counters by tier
+    hits = {"memory": 0, "disk": 0}
+    misses = {"memory": 0, "disk": 0}
+
+    # statistics by namespace recorded since the last flush
+    _stats: dict[str, dict[str, float | int]] = {}
+    _stats_lock = threading.Lock()
 
     def __init__(self) -> None:  # noqa: D107 pragma: no cover
         raise NotImplementedError("Cache is a not instanceable interface.")
 
-    @staticmethod
-    def clean() -> None:  # pragma: no cover
+    @classmethod
+    def clean(cls) -> None:  # pragma: no cover
         """Remove the cache directory."""
+        cls._store.close()
+        cls._memory.clear()
+        cls._stats = {}
         for possible_cache_dirpath in generate_possible_cache_dirs():
             if os.path.isdir(possible_cache_dirpath):
                 shutil.rmtree(possible_cache_dirpath)
 
+    @classmethod
+    def prune(cls, vacuum: bool = False) -> int:  # noqa: FBT001, FBT002
+        """Evict stale entries and the least recently used if overweight.
+
+        Args:
+            vacuum (bool): Release the disk space of the evicted entries.
+
+        Returns:
+            int: Number of entries evicted.
+        """
+        evicted = cls._store.prune(
+            {
+                namespace: cls._get_retention_time(namespace)
+                for namespace in CACHE_NAMESPACES
+            },
+            max_size=cls._max_size,
+        )
+        cls._memory.clear()
+        for namespace, namespace_evicted in evicted.items():
+            cls._record_stats(namespace, evictions=namespace_evicted)
+        if vacuum:
+            cls._store.vacuum()
+        return sum(evicted.values())
+
+    @classmethod
+    def _record_stats(cls, namespace: str, **amounts: float | int) -> None:
+        with cls._stats_lock:
+            stats = cls._stats.get(namespace)
+            if stats is None:
+                stats = cls._stats[namespace] = dict.fromkeys(
+                    CACHE_STATS_FIELDS,
+                    0,
+                )
+            for field, amount in amounts.items():
+                stats[field] += amount
+
+    @classmethod
+    def _record_lookup(cls, namespace: str, tier: str, *, hit: bool) -> None:
+        with cls._stats_lock:
+            (cls.hits if hit else cls.misses)[tier] += 1
+        if hit:
+            cls._record_stats(namespace, hits=1)
+        elif tier == "disk":
+            cls._record_stats(namespace, misses=1)
+
+    @classmethod
+    def flush_stats(cls) -> None:
+        """Store the statistics recorded since the last flush."""
+        if not cls._stats:
+            return
+        with cls._stats_lock:
+            stats, cls._stats = cls._stats, {}
+        try:
+            cls._store.add_stats(stats)
+        except sqlite3.DatabaseError as error:
+            cls._handle_store_error(error)
+
+    @classmethod
+    def get_stats(cls) -> dict[str, dict[str, float | int]]:
+        """Get the statistics of the cache by namespace.
+
+        The statistics are accumulated between executions until the
+        cache is cleaned.
+
+        Returns:
+            dict: Hits, misses, bytes read and written, time spent
+                decoding values in seconds, evictions, number of entries
+                and size in bytes by namespace.
+        """
+        cls.flush_stats()
+        return cls._store.get_stats()
+
+    @classmethod
+    def prune_if_due(cls) -> None:
+        """Prune the cache if it has not been pruned recently."""
+        try:
+            last_prune = cls._store.get_meta("last_prune")
+            if (
+                last_prune is None
+                or time.time() > last_prune + CACHE_PRUNE_INTERVAL
+            ):
+                cls.prune()
+        except sqlite3.DatabaseError as error:
+            cls._handle_store_error(error)
+
     @classmethod
     def generate_unique_key_from_tree_entry(cls, tree_entry: str) -> str:
         """Generate a unique key."""
@@ -93,27 +749,135 @@ class Cache:
         ).decode("utf-8")
 
     @classmethod
-    def get(cls, tree_entry: str) -> Any:  # noqa: D102
+    def _get_expiration_time(cls, namespace: str) -> float | int:
+        return cls._namespaces_expiration_times.get(
+            namespace,
+            cls._expiration_time or 0,
+        )
+
+    @classmethod
+    def _get_retention_time(cls, namespace: str) -> float | int:
+        expiration_time = cls._get_expiration_time(namespace)
+        if namespace in CACHE_NAMESPACES_RETAINED_BY:
+            return max(
+                expiration_time,
+                cls._get_expiration_time(
+                    CACHE_NAMESPACES_RETAINED_BY[namespace],
+                ),
+            )
+        return expiration_time
+
+    @classmethod
+    def _is_expired(cls, creation_time: int, namespace: str) -> bool:
+        return time.time() >= creation_time + cls._get_expiration_time(
+            namespace,
+        )
+
+    @classmethod
+    def _is_retained(cls, creation_time: int, namespace: str) -> bool:
+        return time.time() < creation_time + cls._get_retention_time(
+            namespace,
+        )
+
+    @classmethod
+    def _handle_store_error(cls, error: sqlite3.DatabaseError) -> None:
+        # operational errors, like a lock timeout in a busy cache shared
+        # between processes, only make the current operation a no-op
+        if not isinstance(error, sqlite3.OperationalError):
+            cls._store.recover()
+            cls._memory.clear()
+
+    @classmethod
+    def _get_from_store(
+        cls,
+        key: str,
+        namespace: str,
+        *,
+        expired: bool,
+    ) -> tuple[bool, Any]:
+        entry = cls._store.get(key)
+        if entry is None:
+            return False, None
+        creation_time, codec_name, encoded_value = entry
+        if not cls._is_retained(creation_time, namespace):
+            cls._store.delete(key)
+            return False, None
+        if not expired and cls._is_expired(creation_time, namespace):
+            return False, None
+        start = time.perf_counter()
+        try:
+            value = decode_cache_value(codec_name, encoded_value)
+        except CACHE_DECODE_ERRORS:
+            # corrupted entry, will be written again by the caller
+            cls._store.delete(key)
+            return False, None
+        cls._record_stats(
+            namespace,
+            bytes_read=len(encoded_value),
+            decode_time=time.perf_counter() - start,
+        )
+        cls._store.touch(key, int(time.time()))
+        cls._memory.set(key, creation_time, value)
+        return True, value
+
+    @classmethod
+    def get(cls, tree_entry: str, *, expired: bool = False) -> Any:
+        """Get the value of an entry of the cache.
+
+        Args:
+            tree_entry (str): Key of the entry.
+            expired (bool): Whether to return expired entries that are
+                still retained, see :py:data:`CACHE_NAMESPACES_RETAINED_BY`.
+
+        Returns:
+            Any: Value of the entry or ``None`` if not found.
+        """
         key = cls.generate_unique_key_from_tree_entry(tree_entry)
-        fpath = os.path.join(CACHE_DIR, key)
-        if os.path.isfile(fpath):
-            creation_time = get_creation_time_from_fpath(fpath)
-            if time.time() < creation_time + (cls._expiration_time or 0):
-                return pickle.loads(read_file(fpath))
-            os.remove(fpath)
-        return None
+        namespace = namespace_from_tree_entry(tree_entry)
+
+        memory_entry = cls._memory.get(key)
+        if memory_entry is not None:
+            creation_time, value = memory_entry
+            if not cls._is_expired(creation_time, namespace):
+                cls._record_lookup(namespace, "memory", hit=True)
+                return value
+            cls._memory.delete(key)
+        cls._record_lookup(namespace, "memory", hit=False)
+
+        try:
+            found, value = cls._get_from_store(
+                key,
+                namespace,
+                expired=expired,
+            )
+        except sqlite3.DatabaseError as error:
+            cls._handle_store_error(error)
+            found, value = False, None
+        cls._record_lookup(namespace, "disk", hit=found)
+        return value if found else None
 
     @classmethod
     def set(cls, tree_entry: str, value: Any) -> None:  # noqa: D102
         key = cls.generate_unique_key_from_tree_entry(tree_entry)
-        fpath = os.path.join(CACHE_DIR, key)
-        if not os.path.isfile(fpath):
-            write_file(fpath, value)
-        elif time.time() > get_creation_time_from_fpath(fpath) + (
-            cls._expiration_time or 0
-        ):
-            os.remove(fpath)
-            write_file(fpath, value)
+        namespace = namespace_from_tree_entry(tree_entry)
+        creation_time = int(time.time())
+        try:
+            entry = cls._memory.get(key) or cls._store.get(key)
+            if entry is not None and not cls._is_expired(entry[0], namespace):
+                # updating a living entry must not extend its expiration
+                creation_time = entry[0]
+            codec_name, encoded_value = encode_cache_value(value)
+            cls._record_stats(namespace, bytes_written=len(encoded_value))
+            cls._store.set(
+                key,
+                namespace,
+                creation_time,
+                codec_name,
+                encoded_value,
+            )
+        except sqlite3.DatabaseError as error:
+            cls._handle_store_error(error)
+        cls._memory.set(key, creation_time, value)
 
     @classmethod
     def ensure_dir(cls) -> None:
@@ -133,3 +897,72 @@ class Cache:
                 objects.
         """
         cls._expiration_time = expiration_time
+
+    @classmethod
+    def set_namespaces_expiration_times(
+        cls,
+        expiration_times: dict[str, float | int],
+    ) -> None:
+        """Configure expiration times for namespaces of the cache.
+
+        Namespaces not configured use the global expiration time.
+
+        Args:
+            expiration_times (dict): Expiration times in seconds by
+                namespace.
+        """
+        cls._namespaces_expiration_times = expiration_times
+
+    @classmethod
+    def get_settings(cls) -> dict[str, Any]:
+        """Get the configuration of the cache.
+
+        Used to configure the cache in other processes with
+        :py:meth:`Cache.set_settings`.
+
+        Returns:
+            dict: Expiration times and maximum size of the cache.
+        """
+        return {
+            "expiration_time": cls._expiration_time,
+            "namespaces_expiration_times": cls._namespaces_expiration_times,
+            "max_size": cls._max_size,
+        }
+
+    @classmethod
+    def set_settings(cls, settings: dict[str, Any]) -> None:
+        """Configure the cache.
+
+        Args:
+            settings (dict): Configuration returned by
+                :py:meth:`Cache.get_settings`.
+        """
+        cls.set_expiration_time(settings["expiration_time"])
+        cls.set_namespaces_expiration_times(
+            settings["namespaces_expiration_times"],
+        )
+        cls.set_max_size(settings["max_size"])
+
+    @classmethod
+    def set_max_size(cls, max_size: int | None = None) -> None:
+        """Configure the maximum size of the cache.
+
+        Args:
+            max_size (int): Maximum size in bytes. If ``None``, the size of
+                the cache is not limited.
+        """
+        cls._max_size = max_size
+
+
+def _reset_cache_after_fork() -> None:
+    # locks held by other threads of the parent process would never be
+    # released in the child
+    Cache._store._lock = threading.RLock()
+    Cache._memory._lock = threading.Lock()
+    Cache._stats_lock = threading.Lock()
+    # statistics recorded by the parent are flushed by the parent
+    Cache._stats = {}
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_cache_after_fork)
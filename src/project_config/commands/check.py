@@ -3,25 +3,48 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import os
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from contextlib_chdir import chdir as chdir_ctx
 
 from project_config import tree
+from project_config.cache import Cache
 from project_config.config import Config, reporter_from_config
-from project_config.constants import Error, InterruptingError, ResultValue
+from project_config.constants import (
+    PARALLEL_FILES_THRESHOLD,
+    Error,
+    InterruptingError,
+    ResultValue,
+)
+from project_config.incremental import (
+    action_results_key,
+    create_rule_record,
+    rule_is_recordable,
+    rule_JMESPath_functions,
+    rule_paths,
+    rule_record_is_valid,
+    rule_record_key,
+)
 from project_config.plugins import InvalidPluginFunction
 from project_config.serializers import (
     EMPTY_CONTENT_BY_SERIALIZER,
     guess_preferred_serializer,
 )
 from project_config.types_ import ActionsContext
+from project_config.utils.jmespath import SIDE_EFFECTS_JMESPATH_FUNCTIONS
 
 
 if TYPE_CHECKING:
-    from project_config.types_ import Rule
+    from project_config.compat import TypeAlias
+    from project_config.incremental import RuleRecord
+    from project_config.plugins import PluginMethod
+    from project_config.types_ import ErrorDict, Results, Rule
+
+    RuleResult: TypeAlias = tuple[list[ErrorDict], Exception | None]
 
 
 class InterruptCheck(Exception):
@@ -35,13 +58,38 @@ class ConditionalsFalseResult(InterruptCheck):
     """A conditional must skip a rule."""
 
 
+class _BufferedReporter:
+    """Stores the errors reported by a rule to report them later."""
+
+    def __init__(self) -> None:
+        self.errors: list[ErrorDict] = []
+
+    def report_error(self, error: ErrorDict) -> None:
+        self.errors.append(error)
+
+
+def _rule_must_run_alone(rule: Rule) -> bool:
+    # rules with side effects can't be executed along other rules and
+    # rules with a lot of files use all the jobs to process them
+    files = rule.get("files", [])
+    if isinstance(files, list) and len(files) >= PARALLEL_FILES_THRESHOLD:
+        return True
+    return not SIDE_EFFECTS_JMESPATH_FUNCTIONS.isdisjoint(
+        rule_JMESPath_functions(rule),
+    )
+
+
 class ProjectConfigChecker:
     """Project configuration checker."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         config: Config,
         fix_mode: bool = False,  # noqa: FBT001, FBT002
+        incremental: bool = False,  # noqa: FBT001, FBT002
+        changed_files: list[str] | None = None,
+        cache_results: bool = True,  # noqa: FBT001, FBT002
+        record_mode: bool = False,  # noqa: FBT001, FBT002
     ):
         """Initialize the checker.
 
@@ -49,11 +97,33 @@ class ProjectConfigChecker:
             config (:py:class:`project_config.config.Config`):
                 Configuration to use.
             fix_mode (bool): Whether to fix the errors or not.
+            incremental (bool): Whether to report the recorded errors of
+                rules whose inputs have not changed instead of executing
+                them. Ignored in fix mode.
+            changed_files (list): Files changed since the last execution.
+                If defined, only rules reading some of them are executed
+                in incremental mode.
+            cache_results (bool): Whether to reuse the cached results of
+                actions of rules whose files have not changed.
+            record_mode (bool): Whether to execute all the conditionals
+                and verbs of all the rules, even if conditionals are false
+                or the check is interrupted, so all the resources that
+                they could read are requested. Used to create lock files.
         """
         self.config = config
+        self.incremental = (
+            incremental or changed_files is not None
+        ) and not fix_mode
+        self.changed_files = changed_files
+        self.cache_results = cache_results
+        self.record_mode = record_mode
         self.reporter = reporter_from_config(config)
         self.config.load_style()
-        self.actions_context = ActionsContext(fix=fix_mode, files=[])
+        self.actions_context = ActionsContext(
+            fix=fix_mode,
+            files=[],
+            jobs=config.dict_["cli"].get("jobs", 1),
+        )
 
     def _check_files_existence(
         self,
@@ -159,6 +229,88 @@ class ProjectConfigChecker:
                     },
                 )
 
+    def _action_results_key(
+        self,
+        action: str,
+        rule: Rule,
+    ) -> tuple[str, set[str]] | None:
+        if (
+            self.actions_context.fix
+            or not self.cache_results
+            or not rule_is_recordable(rule)
+        ):
+            return None
+        plugins = self.config.style.plugins
+        plugin_name = plugins.actions_plugin_names[action]
+        # third party plugins could read files without passing through
+        # the tree, so their reads can't be tracked
+        if plugin_name not in plugins.builtin_plugin_names:
+            return None
+        plugin_version = plugins.plugins_versions.get(plugin_name)
+        if plugin_version is None:
+            return None
+        paths = rule_paths(rule) | set(self.actions_context.files)
+        key = action_results_key(
+            action,
+            plugin_name,
+            plugin_version,
+            rule,
+            list(self.actions_context.files),
+            paths,
+        )
+        return key, paths
+
+    def _action_results(
+        self,
+        action: str,
+        action_function: PluginMethod,
+        rule: Rule,
+    ) -> Results:
+        """Execute an action, caching its results in check mode.
+
+        Results are cached by the definition of the rule, the version of
+        the plugin and the state of the files of the rule. Only results
+        of built-in plugins are cached and not if they read other files
+        or remote resources.
+        """
+        key_and_paths = self._action_results_key(action, rule)
+        if key_and_paths is None:
+            yield from action_function(
+                # typed dict with dinamic key, this type must be ignored
+                # until some literal quirk comes, see:
+                # https://stackoverflow.com/a/59583427/9167585
+                rule[action],  # type: ignore
+                rule,
+                self.actions_context,
+            )
+            return
+        key, paths = key_and_paths
+
+        cached_results = Cache.get(key)
+        if cached_results is not None:
+            # the checker mutates results, don't touch the cached ones
+            yield from copy.deepcopy(cached_results)
+            return
+
+        results = []
+        try:
+            with tree.record_inputs() as inputs:
+                for result in action_function(
+                    rule[action],  # type: ignore
+                    rule,
+                    self.actions_context,
+                ):
+                    results.append(result)
+                    # the checker doesn't consume more results after these
+                    if result[0] in (InterruptingError, ResultValue):
+                        break
+        except Exception:
+            yield from results
+            raise
+        if not inputs["urls"] and inputs["files"] <= paths:
+            Cache.set(key, copy.deepcopy(results))
+        yield from results
+
     def _process_conditionals_for_rule(
         self,
         conditionals: list[tuple[str, Any]],
@@ -167,22 +319,20 @@ class ProjectConfigChecker:
     ) -> None:
         conditional_failed = False
         for conditional, action_function in conditionals:
-            for breakage_type, breakage_value in action_function(
-                # typed dict with dinamic key, this type must be ignored
-                # until some literal quirk comes, see:
-                # https://stackoverflow.com/a/59583427/9167585
-                rule[conditional],  # type: ignore
+            for breakage_type, breakage_value in self._action_results(
+                conditional,
+                action_function,
                 rule,
-                self.actions_context,
             ):
                 if breakage_type in (InterruptingError, Error):
-                    breakage_value["definition"] = (
-                        f"rules[{rule_index}]" + breakage_value["definition"]
+                    breakage_value["definition"] = (  # type: ignore
+                        f"rules[{rule_index}]"
+                        + breakage_value["definition"]  # type: ignore
                     )
                     self.reporter.report_error(breakage_value)
                     conditional_failed = True
                 elif breakage_type == ResultValue:
-                    if breakage_value is False:
+                    if breakage_value is False and not self.record_mode:
                         raise ConditionalsFalseResult()
                     break
                 else:
@@ -190,114 +340,239 @@ class ProjectConfigChecker:
                         f"Breakage type '{breakage_type}' is not implemented"
                         " for conditionals checking",
                     )
-        if conditional_failed:
+        if conditional_failed and not self.record_mode:
             raise InterruptCheck()
 
-    def _run_check(self) -> None:  # noqa: PLR0912
-        for r, rule in enumerate(self.config.dict_["style"]["rules"]):
-            hint = rule.pop("hint", None)
-            files = rule.pop("files", [])
-
-            verbs, conditionals_functions = [], []
-            for action in rule:
-                if action.startswith("if"):
-                    try:
-                        action_function = (
-                            self.config.style.plugins.get_function_for_action(
-                                action,
-                            )
-                        )
-                    except InvalidPluginFunction as exc:
-                        self.reporter.report_error(
-                            {
-                                "message": exc.message,
-                                "definition": f"rules[{r}].{action}",
-                            },
-                        )
-                        raise InterruptCheck() from exc
-                    conditionals_functions.append((action, action_function))
-                else:
-                    verbs.append(action)
+    def _run_rule(self, r: int, rule: Rule) -> None:  # noqa: PLR0912
+        hint = rule.pop("hint", None)
+        files = rule.pop("files", [])
 
-            try:
-                self._process_conditionals_for_rule(
-                    conditionals_functions,
-                    rule,
-                    r,
-                )
-            except ConditionalsFalseResult:
-                # conditionals skipping the rule, next...
-                continue
-
-            if isinstance(files, list):
-                for file in files:
-                    tree.cache_file(
-                        file,
-                        forbid_serializers=("py",),
-                        ignore_serialization_errors=True,
-                    )
-                # check if files exists
-                self._check_files_existence(files, r)
-            else:
-                # requiring absent of files
-                self._check_files_absence(files["not"], r)
-                continue  # no other verb can be used in the rule
-
-            self.actions_context.files = files
-
-            # handle verbs
-            for verb in verbs:
+        verbs, conditionals_functions = [], []
+        for action in rule:
+            if action.startswith("if"):
                 try:
                     action_function = (
                         self.config.style.plugins.get_function_for_action(
-                            verb,
+                            action,
                         )
                     )
                 except InvalidPluginFunction as exc:
                     self.reporter.report_error(
                         {
                             "message": exc.message,
-                            "definition": f"rules[{r}].{verb}",
+                            "definition": f"rules[{r}].{action}",
                         },
                     )
+                    if self.record_mode:
+                        continue
                     raise InterruptCheck() from exc
+                conditionals_functions.append((action, action_function))
+            else:
+                verbs.append(action)
+
+        try:
+            self._process_conditionals_for_rule(
+                conditionals_functions,
+                rule,
+                r,
+            )
+        except ConditionalsFalseResult:
+            # conditionals skipping the rule, next...
+            return
+
+        if isinstance(files, list):
+            # files are loaded by actions on demand, which is not needed
+            # if their results are cached
+            #
+            # check if files exists
+            self._check_files_existence(files, r)
+        else:
+            # requiring absent of files
+            self._check_files_absence(files["not"], r)
+            return  # no other verb can be used in the rule
+
+        self.actions_context.files = files
+
+        # handle verbs
+        for verb in verbs:
+            try:
+                action_function = (
+                    self.config.style.plugins.get_function_for_action(
+                        verb,
+                    )
+                )
+            except InvalidPluginFunction as exc:
+                self.reporter.report_error(
+                    {
+                        "message": exc.message,
+                        "definition": f"rules[{r}].{verb}",
+                    },
+                )
+                if self.record_mode:
+                    continue
+                raise InterruptCheck() from exc
+                # TODO: show 'INTERRUPTED' in report?
+            for breakage_type, breakage_value in self._action_results(
+                verb,
+                action_function,
+                rule,
+            ):
+                if breakage_type == Error:
+                    # prepend rule index to definition, so plugins do not
+                    # need to specify them
+                    #
+                    # TODO: Currently the cast to ErrorDict is not available
+                    # at runtime without installing typing_extensions,
+                    # so we need to ignore the type here.
+                    breakage_value["definition"] = f"rules[{r}]" + (  # type: ignore
+                        breakage_value["definition"]  # type: ignore
+                    )
+
+                    if not self.actions_context.fix:
+                        breakage_value["fixed"] = False  # type: ignore
+
+                    # show hint if defined in the rule
+                    if hint:
+                        breakage_value["hint"] = hint  # type: ignore
+                    self.reporter.report_error(breakage_value)
+
+                elif breakage_type == InterruptingError:
+                    breakage_value["definition"] = f"rules[{r}]" + (  # type: ignore
+                        breakage_value["definition"]  # type: ignore
+                    )
+                    self.reporter.report_error(breakage_value)
+                    if self.record_mode:
+                        # the next verbs could read other resources
+                        break
+                    raise InterruptCheck()
                     # TODO: show 'INTERRUPTED' in report?
-                for breakage_type, breakage_value in action_function(
-                    rule[verb],  # type: ignore
-                    rule,
-                    self.actions_context,
-                ):
-                    if breakage_type == Error:
-                        # prepend rule index to definition, so plugins do not
-                        # need to specify them
-                        #
-                        # TODO: Currently the cast to ErrorDict is not available
-                        # at runtime without installing typing_extensions,
-                        # so we need to ignore the type here.
-                        breakage_value["definition"] = f"rules[{r}]" + (  # type: ignore
-                            breakage_value["definition"]  # type: ignore
-                        )
+                else:
+                    raise NotImplementedError(
+                        f"Breakage type '{breakage_type}' is not"
+                        " implemented for verbal checking",
+                    )
 
-                        if not self.actions_context.fix:
-                            breakage_value["fixed"] = False  # type: ignore
+    def _run_buffered_rule(self, r: int, rule: Rule) -> RuleResult:
+        # run the rule with its own reporter and context, so it can be
+        # executed in other thread
+        checker = copy.copy(self)
+        checker.reporter = _BufferedReporter()
+        checker.actions_context = ActionsContext(
+            fix=self.actions_context.fix,
+            files=[],
+            jobs=self.actions_context.jobs,
+        )
+        try:
+            checker._run_rule(r, rule)
+        except Exception as exc:
+            # raised when the errors of the rule are reported
+            return checker.reporter.errors, exc
+        return checker.reporter.errors, None
+
+    def _run_recorded_rule(self, r: int, rule: Rule) -> RuleResult:
+        """Run a rule unless its inputs have not changed since the last run.
+
+        The errors of the last run are returned if the record of the
+        rule is valid. Otherwise, the rule is executed recording its
+        inputs.
+        """
+        key = rule_record_key(self.config.dict_["cli"]["rootdir"], r, rule)
+        record: RuleRecord | None = Cache.get(key)
+        if record is not None and rule_record_is_valid(
+            record,
+            self.changed_files,
+        ):
+            # the reporter mutates errors, don't touch the cached ones
+            return (
+                copy.deepcopy(record["errors"]),
+                InterruptCheck() if record["interrupted"] else None,
+            )
 
-                        # show hint if defined in the rule
-                        if hint:
-                            breakage_value["hint"] = hint  # type: ignore
-                        self.reporter.report_error(breakage_value)
+        # collected before executing the rule because it is mutated
+        paths = rule_paths(rule)
+        with tree.record_inputs() as inputs:
+            errors, exception = self._run_buffered_rule(r, rule)
+        if exception is None or isinstance(exception, InterruptCheck):
+            Cache.set(
+                key,
+                create_rule_record(
+                    paths | inputs["files"],
+                    inputs["urls"],
+                    copy.deepcopy(errors),
+                    interrupted=exception is not None,
+                ),
+            )
+        return errors, exception
 
-                    elif breakage_type == InterruptingError:
-                        breakage_value["definition"] = f"rules[{r}]" + (  # type: ignore
-                            breakage_value["definition"]  # type: ignore
-                        )
-                        self.reporter.report_error(breakage_value)
-                        raise InterruptCheck()
-                        # TODO: show 'INTERRUPTED' in report?
-                    else:
-                        raise NotImplementedError(
-                            f"Breakage type '{breakage_type}' is not"
-                            " implemented for verbal checking",
-                        )
+    def _check_rule(self, r: int, rule: Rule) -> RuleResult:
+        if self.incremental and rule_is_recordable(rule):
+            return self._run_recorded_rule(r, rule)
+        return self._run_buffered_rule(r, rule)
+
+    def _report_rule_result(self, result: RuleResult) -> None:
+        errors, exception = result
+        for error in errors:
+            self.reporter.report_error(error)
+        if exception is not None:
+            raise exception
+
+    def _report_buffered_rules(
+        self,
+        futures: list[Future[RuleResult]],
+    ) -> None:
+        for future in futures:
+            self._report_rule_result(future.result())
+
+    def _run_rules_in_parallel(self, rules: list[Rule], jobs: int) -> None:
+        """Run rules in a pool of threads.
+
+        Rules are read-only in check mode, so they are executed in
+        parallel and their errors are reported in the order of the rules,
+        until one of them interrupts the check, like in a serial
+        execution. Rules with side effects or with a lot of files are
+        executed alone after the previous ones have been reported, the
+        latter processing their files with all the jobs.
+        """
+        futures: list[Future[RuleResult]] = []
+        executor: ThreadPoolExecutor | None = None
+        try:
+            for r, rule in enumerate(rules):
+                if _rule_must_run_alone(rule):
+                    self._report_buffered_rules(futures)
+                    futures = []
+                    # stop the threads, so actions can fork safely
+                    if executor is not None:
+                        executor.shutdown(wait=True)
+                        executor = None
+                    self._report_rule_result(self._check_rule(r, rule))
+                else:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=jobs)
+                    futures.append(
+                        executor.submit(self._check_rule, r, rule),
+                    )
+            self._report_buffered_rules(futures)
+        finally:
+            # rules after an interruption must not be executed
+            for future in futures:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def _run_check(self) -> None:
+        rules = self.config.dict_["style"]["rules"]
+        jobs = self.config.dict_["cli"].get("jobs", 1)
+        # inputs are recorded by thread, so rules are executed serially
+        # in record mode
+        if jobs > 1 and not (self.actions_context.fix or self.record_mode):
+            self._run_rules_in_parallel(rules, jobs)
+        else:
+            for r, rule in enumerate(rules):
+                try:
+                    self._report_rule_result(self._check_rule(r, rule))
+                except InterruptCheck:
+                    if not self.record_mode:
+                        raise
 
     def run(self) -> None:
         """Run the checker."""
@@ -318,4 +593,6 @@ def check(args: argparse.Namespace) -> None:
         ProjectConfigChecker(
             Config(args),
             fix_mode=args.command == "fix",
+            incremental=getattr(args, "incremental", False),
+            changed_files=getattr(args, "files", None),
         ).run()
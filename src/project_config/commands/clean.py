@@ -3,12 +3,32 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import sys
 
 from project_config.cache import Cache
 
 
-def clean(_args: argparse.Namespace) -> None:
+def clean(args: argparse.Namespace) -> None:
     """Cache cleaning command."""
-    Cache.clean()
-    sys.stdout.write("Cache removed successfully!\n")
+    if args.prune:
+        from project_config.config import FileConfig
+        from project_config.config.exceptions import (
+            ConfigurationFilesNotFound,
+            PyprojectTomlFoundButHasNoConfig,
+        )
+
+        # use the expiration times of the configuration if found
+        with contextlib.suppress(
+            ConfigurationFilesNotFound,
+            PyprojectTomlFoundButHasNoConfig,
+        ):
+            FileConfig(args.rootdir, args.config)
+
+        evicted = Cache.prune(vacuum=True)
+        sys.stdout.write(
+            f"Cache pruned successfully! {evicted} entries evicted.\n",
+        )
+    else:
+        Cache.clean()
+        sys.stdout.write("Cache removed successfully!\n")
@@ -0,0 +1,25 @@
+"""project-config daemon command."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from project_config.daemon import daemon_socket_path, serve, stop_daemon
+
+
+def daemon(args: argparse.Namespace) -> None:
+    """Start a daemon to execute commands with a warm state or stop it."""
+    socket_path = daemon_socket_path()
+    if args.stop:
+        if stop_daemon(socket_path):
+            sys.stdout.write("Daemon stopped successfully!\n")
+        else:
+            sys.stdout.write(f"No daemon is listening at '{socket_path}'\n")
+    else:
+
+        def on_ready() -> None:
+            sys.stdout.write(f"Daemon listening at '{socket_path}'\n")
+            sys.stdout.flush()
+
+        serve(socket_path, on_ready=on_ready)
@@ -0,0 +1,58 @@
+"""project-config lock command."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+
+from contextlib_chdir import chdir as chdir_ctx
+
+from project_config import tree
+from project_config.commands.check import ProjectConfigChecker
+from project_config.config import Config
+from project_config.exceptions import ProjectConfigCheckFailed
+from project_config.fetchers import (
+    download_file_from_urlsplit_scheme,
+    urlsplit_with_scheme,
+)
+from project_config.lock import (
+    lock_file_path,
+    record_responses,
+    write_lock_file,
+)
+
+
+def lock(args: argparse.Namespace) -> None:
+    """Write the remote resources used by a project to its lock file.
+
+    All the conditionals and verbs of the rules of the styles are
+    executed, even if conditionals are false or the check is interrupted,
+    to discover the remote files and repository tags that they could read.
+    Errors reported by the rules don't prevent the lock file from being
+    written.
+    """
+    args.frozen = False
+    with chdir_ctx(args.rootdir), record_responses() as responses:
+        config = Config(args)
+        with tree.record_inputs() as inputs, contextlib.suppress(
+            ProjectConfigCheckFailed,
+        ):
+            ProjectConfigChecker(
+                config,
+                cache_results=False,
+                record_mode=True,
+            ).run()
+
+        # remote files served by the cache of the tree must be
+        # requested again to record their responses
+        for url in sorted(inputs["urls"]):
+            url_parts, scheme = urlsplit_with_scheme(url)
+            download_file_from_urlsplit_scheme(url, url_parts, scheme)
+
+        fpath = lock_file_path(config.dict_["cli"]["rootdir"])
+        write_lock_file(fpath, responses)
+    sys.stdout.write(
+        f"Lock file written successfully! {len(responses)} resources"
+        f" locked in '{fpath}'.\n",
+    )
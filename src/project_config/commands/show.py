@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from typing import cast
 
 
 def show(args: argparse.Namespace) -> None:
@@ -13,7 +14,16 @@ def show(args: argparse.Namespace) -> None:
     It will depend in the ``args.data`` property.
     """
     if args.data == "cache":
-        from project_config.cache import CACHE_DIR as report
+        if args.stats:
+            from project_config.cache import Cache
+
+            fmt = args.reporter.get("kwargs", {}).get("fmt", {})
+            indent = (
+                None if "pretty" not in fmt else (2 if fmt == "pretty" else 4)
+            )
+            report = json.dumps(Cache.get_stats(), indent=indent)
+        else:
+            from project_config.cache import CACHE_DIR as report
     elif args.data == "reporters":
         # TODO: Add tests for this
         from project_config.reporters import ThirdPartyReporters, reporters
@@ -44,6 +54,25 @@ def show(args: argparse.Namespace) -> None:
                 from project_config.plugins import Plugins
 
                 data = Plugins(prepare_all=True).plugin_action_names
+            elif getattr(args, "graph", False):
+                from project_config.config.style.graph import (
+                    resolve_style_graph,
+                )
+
+                # the style is not loaded, so it contains the URLs
+                style_urls = cast("str | list[str]", config.dict_["style"])
+                graph = resolve_style_graph(
+                    [style_urls] if isinstance(style_urls, str) else style_urls,
+                    config.dict_["cli"]["rootdir"],
+                )
+                fmt = args.reporter.get("kwargs", {}).get("fmt", {})
+                indent = (
+                    None
+                    if "pretty" not in fmt
+                    else (2 if fmt == "pretty" else 4)
+                )
+                sys.stdout.write(f"{json.dumps(graph, indent=indent)}\n")
+                return
             else:  # style
                 config.load_style()
                 data = config.dict_.pop("style")
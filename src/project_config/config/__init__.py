@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import os
 import re
 from typing import TYPE_CHECKING, Any
 
 from project_config import tree
-from project_config.cache import Cache
+from project_config.cache import CACHE_NAMESPACES, Cache
 from project_config.config.exceptions import (
     ConfigurationFilesNotFound,
     CustomConfigFileNotFound,
@@ -18,12 +19,14 @@ from project_config.config.exceptions import (
     PyprojectTomlFoundButHasNoConfig,
 )
 from project_config.config.style import Style
+from project_config.lock import freeze, lock_file_path, read_lock_file
 from project_config.reporters import DEFAULT_REPORTER, get_reporter, reporters
 
 
 CONFIG_CACHE_REGEX = (
     r"^(\d+ ((seconds?)|(minutes?)|(hours?)|(days?)|(weeks?)))|(never)$"
 )
+CONFIG_CACHE_MAX_SIZE_REGEX = r"^\d+ ?(B|KB|MB|GB)$"
 
 if TYPE_CHECKING:
     from project_config.compat import NotRequired, TypedDict
@@ -35,6 +38,7 @@ if TYPE_CHECKING:
         color: bool
         colors: dict[str, str]
         only_hints: bool
+        jobs: int
         _reporter_definition: dict[str, Any]
 
     class BaseConfigType(TypedDict):  # noqa: D101
@@ -43,9 +47,13 @@ if TYPE_CHECKING:
 
     class RawConfigType(BaseConfigType):  # noqa: D101
         cache: str
+        cache_expirations: NotRequired[dict[str, str]]
+        cache_max_size: NotRequired[str]
 
     class ConfigType(BaseConfigType):  # noqa: D101
         cache: int
+        cache_expirations: NotRequired[dict[str, int]]
+        cache_max_size: NotRequired[int]
 
 
 def read_config_from_pyproject_toml(fpath: str) -> Any:
@@ -171,8 +179,15 @@ def _cache_string_to_seconds(cache_string: str) -> int:
     raise ValueError(cache_string)
 
 
-def validate_config_cache(config: Any) -> list[str]:
-    """Validate the ``cache`` field of a configuration object.
+def _cache_size_string_to_bytes(size_string: str) -> int:
+    units = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+    size_string = size_string.replace(" ", "")
+    unit = size_string.lstrip("0123456789")
+    return int(size_string[: -len(unit)]) * units[unit]
+
+
+def validate_config_cache(config: Any) -> list[str]:  # noqa: PLR0912
+    """Validate the ``cache*`` fields of a configuration object.
 
     Args:
         config (object): Configuration data to validate.
@@ -193,6 +208,39 @@ def validate_config_cache(config: Any) -> list[str]:
     else:
         # 5 minutes as default cache
         config["cache"] = "5 minutes"
+
+    if "cache_expirations" in config:
+        if not isinstance(config["cache_expirations"], dict):
+            error_messages.append("cache_expirations -> must be of type object")
+        else:
+            for namespace, value in config["cache_expirations"].items():
+                if namespace not in CACHE_NAMESPACES:
+                    error_messages.append(
+                        f"cache_expirations.{namespace} -> must be one of"
+                        f" {', '.join(CACHE_NAMESPACES)}",
+                    )
+                elif not isinstance(value, str):
+                    error_messages.append(
+                        f"cache_expirations.{namespace} -> must be of"
+                        " type string",
+                    )
+                elif not re.match(CONFIG_CACHE_REGEX, value):
+                    error_messages.append(
+                        f"cache_expirations.{namespace} -> must match the"
+                        f" regex {CONFIG_CACHE_REGEX}",
+                    )
+
+    if "cache_max_size" in config:
+        if not isinstance(config["cache_max_size"], str):
+            error_messages.append("cache_max_size -> must be of type string")
+        elif not re.match(
+            CONFIG_CACHE_MAX_SIZE_REGEX,
+            config["cache_max_size"],
+        ):
+            error_messages.append(
+                "cache_max_size -> must match the regex"
+                f" {CONFIG_CACHE_MAX_SIZE_REGEX}",
+            )
     return error_messages
 
 
@@ -215,7 +263,9 @@ def validate_config(config_path: str, config: Any) -> None:
         )
 
 
-def _validate_cli_config(config: dict[str, Any]) -> list[str]:
+def _validate_cli_config(  # noqa: PLR0912
+    config: dict[str, Any],
+) -> list[str]:
     errors: list[str] = []
     if "reporter" in config:
         if not isinstance(config["reporter"], str):
@@ -238,6 +288,13 @@ def _validate_cli_config(config: dict[str, Any]) -> list[str]:
 
         # colors are validated in the reporter
 
+    if "jobs" in config and (
+        not isinstance(config["jobs"], int)
+        or isinstance(config["jobs"], bool)
+        or config["jobs"] < 1
+    ):
+        errors.append("cli.jobs -> must be a positive integer")
+
     if "rootdir" in config:
         if not isinstance(config["rootdir"], str):
             errors.append("cli.rootdir -> must be of type string")
@@ -297,9 +354,11 @@ class FileConfig:
 
         self.path, config = read_config(rootdir, path)
 
-        if store_raw_config:
-            import copy
+        # the configuration is mutated below, so don't touch the
+        # object shared by the cache
+        config = copy.deepcopy(config)
 
+        if store_raw_config:
             self.raw_: RawConfigType = copy.deepcopy(config)
 
         # Temporally store configuration path to use in validation
@@ -307,6 +366,15 @@ class FileConfig:
 
         validate_config(self.path, config)
         config["cache"] = _cache_string_to_seconds(config["cache"])
+        if "cache_expirations" in config:
+            config["cache_expirations"] = {
+                namespace: _cache_string_to_seconds(value)
+                for namespace, value in config["cache_expirations"].items()
+            }
+        if "cache_max_size" in config:
+            config["cache_max_size"] = _cache_size_string_to_bytes(
+                config["cache_max_size"],
+            )
 
         # cli configuration in file
         config["cli"] = validate_cli_config(self.path, config.get("cli", {}))
@@ -315,6 +383,11 @@ class FileConfig:
 
         # set the cache expiration time globally
         Cache.set_expiration_time(config["cache"])
+        Cache.set_namespaces_expiration_times(
+            config.get("cache_expirations", {}),
+        )
+        Cache.set_max_size(config.get("cache_max_size"))
+        Cache.prune_if_due()
 
         # configuration
         self.dict_: ConfigType = config
@@ -394,6 +467,21 @@ class Config(FileConfig):
             or args.only_hints is True
         )
 
+        # number of rules executed in parallel
+        jobs = getattr(args, "jobs", None)
+        self.dict_["cli"]["jobs"] = (
+            self.dict_["cli"].get("jobs", 1) if jobs is None else jobs
+        )
+
+        # serve remote resources only from the lock file
+        freeze(
+            (
+                read_lock_file(lock_file_path(self.dict_["cli"]["rootdir"]))
+                if getattr(args, "frozen", False)
+                else None
+            ),
+        )
+
 
 def reporter_from_config(config: Config) -> Any:
     """Instanciate a reporter from a configuration object.
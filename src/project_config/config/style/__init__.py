@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import contextlib
-import os
+import copy
 from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 from project_config import tree
-from project_config.cache import Cache
 from project_config.config.exceptions import ProjectConfigInvalidConfigSchema
-from project_config.fetchers import resolve_maybe_relative_url, resolve_url
+from project_config.config.style.graph import resolve_style_graph
+from project_config.fetchers import resolve_maybe_relative_url
 from project_config.plugins import Plugins
-from project_config.serializers import serialize_for_url
 
 
 class ProjectConfigInvalidStyle(ProjectConfigInvalidConfigSchema):
@@ -21,7 +20,6 @@ class ProjectConfigInvalidStyle(ProjectConfigInvalidConfigSchema):
 
 if TYPE_CHECKING:
     from project_config.compat import NotRequired, TypeAlias, TypedDict
-    from project_config.config import ConfigType
     from project_config.types_ import Rule
 
     class StyleType(TypedDict):
@@ -35,6 +33,12 @@ if TYPE_CHECKING:
     StyleLoaderIterator: TypeAlias = Iterator[StyleType | str]
 
 
+def _fetch_style(url: str) -> Any:
+    # styles are mutated while they are validated and blended,
+    # so don't touch the objects shared by the cache
+    return copy.deepcopy(tree.fetch_remote_file(url))
+
+
 class Style:
     """Wrapper for style loader, blender and checker."""
 
@@ -50,17 +54,15 @@ class Style:
     @classmethod
     def from_config(cls, config: Any) -> Style:
         """Loads styles to the configuration passed as argument."""
-        if (  # pragma: no cover
-            isinstance(config.dict_["style"], str)
-            and not os.path.isfile(config.dict_["style"])
-        ) or (
-            isinstance(config.dict_["style"], list)
-            and not all(os.path.isfile(url) for url in config.dict_["style"])
-        ):
-            with contextlib.suppress(Exception):
-                # if an exception is raised, will be raised again
-                # in the synchronous style loader
-                _prefetch_urls(config)
+        style_urls = config.dict_["style"]
+        with contextlib.suppress(Exception):
+            # prefetch the whole graph of styles concurrently, if an
+            # exception is raised, will be raised again in the
+            # synchronous style loader
+            resolve_style_graph(
+                [style_urls] if isinstance(style_urls, str) else style_urls,
+                config.dict_["cli"]["rootdir"],
+            )
 
         style = cls(config)
 
@@ -92,7 +94,7 @@ class Style:
         style_urls = self.config.dict_["style"]
         if isinstance(style_urls, str):
             try:
-                style = tree.fetch_remote_file(style_urls)
+                style = _fetch_style(style_urls)
             except FileNotFoundError:
                 yield f"style -> '{style_urls}' file not found"
             else:
@@ -121,7 +123,7 @@ class Style:
             style = {"rules": [], "plugins": []}
             for s, partial_style_url in enumerate(style_urls):
                 try:
-                    partial_style = tree.fetch_remote_file(partial_style_url)
+                    partial_style = _fetch_style(partial_style_url)
                 except FileNotFoundError:
                     yield f"style[{s}] -> '{partial_style_url}' file not found"
                     continue
@@ -161,7 +163,7 @@ class Style:
     ) -> StyleLoaderIterator:
         for s, extend_url in enumerate(style.pop("extends", [])):
             try:
-                partial_style = tree.fetch_remote_file(extend_url)
+                partial_style = _fetch_style(extend_url)
             except FileNotFoundError:
                 yield (
                     f"{parent_style_url}: .extends[{s}]"
@@ -395,71 +397,3 @@ class Style:
                             " defined plugins:"
                             f" {', '.join(self.plugins.plugin_names)}"
                         )
-
-
-def _prefetch_urls(config_dict: ConfigType) -> None:
-    """Prefetch urls concurrently and store them in cache.
-
-    This function is used to store urls in cache before they are used,
-    so the network calls are speedup a lot.
-
-    Args:
-        config_dict: The config_dict object.
-    """
-    from concurrent.futures import as_completed
-
-    from requests_futures.sessions import FuturesSession
-
-    session = FuturesSession()
-
-    style_urls_ = config_dict["style"]
-    if isinstance(style_urls_, str):
-        style_urls_ = [style_urls_]
-
-    def prefetch_partial_style(
-        parent_style_url: str,
-        extend_urls: list[str],
-    ) -> None:
-        urls = {}
-        for extend_url in extend_urls:
-            resolved_extend_url = resolve_maybe_relative_url(
-                extend_url,
-                parent_style_url,
-                config_dict["cli"]["rootdir"],
-            )
-            url, _ = resolve_url(resolved_extend_url)
-            if Cache.get(url) is not None:
-                continue
-            urls[url] = resolved_extend_url
-        if not urls:
-            return
-
-        futures = [session.get(url) for url in urls]
-
-        for future in as_completed(futures):
-            resp = future.result()
-            Cache.set(resp.url, resp.text)
-            style_obj = serialize_for_url(resp.url, resp.text)
-            if isinstance(style_obj.get("extends"), list):
-                prefetch_partial_style(urls[resp.url], style_obj["extends"])
-
-    def prefetch_style(style_urls: StyleType) -> None:
-        urls = {}
-        for style_url in style_urls:
-            url, scheme = resolve_url(style_url)
-            if scheme == "file" or Cache.get(url) is not None:
-                continue
-            urls[url] = style_url
-        if not urls:
-            return
-
-        futures = [session.get(url) for url in urls]
-
-        for future in as_completed(futures):
-            resp = future.result()
-            Cache.set(resp.url, resp.text)
-            style_obj = serialize_for_url(resp.url, resp.text)
-            if isinstance(style_obj.get("extends"), list):
-                prefetch_partial_style(urls[resp.url], style_obj["extends"])
-
-    prefetch_style(style_urls_)
@@ -0,0 +1,126 @@
+"""Resolver of the graph of styles extended by a project.
+
+Styles extend other styles, which can be local files or remote resources
+of any scheme, forming a directed acyclic graph. The graph is resolved
+breadth-first: all the styles of a level are fetched at the same time,
+so a deep graph of remote styles costs one round trip per level instead
+of one per style.
+
+The styles are fetched through :py:func:`project_config.tree.fetch_remote_file`,
+so they are stored in the cache under the same keys used by the style
+loader, which reads them later without performing more requests.
+Levels of local styles are read in the calling thread, threads are only
+started when there are remote styles to fetch.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from project_config import tree
+from project_config.exceptions import ProjectConfigException
+from project_config.fetchers import (
+    resolve_maybe_relative_url,
+    uri_is_pointing_to_local_file,
+)
+from project_config.utils.http import MAX_CONCURRENT_REQUESTS
+
+
+if TYPE_CHECKING:
+    from project_config.compat import TypedDict
+
+    class StyleNode(TypedDict):  # noqa: D101
+        extends: list[str]
+        time: float
+        error: str | None
+
+
+def _extends_urls(style: Any, style_url: str, rootdir: str) -> list[str]:
+    # the style has not been validated yet, so ignore invalid values
+    # that will be reported by the style loader
+    if not isinstance(style, dict) or not isinstance(
+        style.get("extends"),
+        list,
+    ):
+        return []
+    urls = []
+    for extend_url in style["extends"]:
+        if not isinstance(extend_url, str) or not extend_url:
+            continue
+        with contextlib.suppress(ProjectConfigException):
+            urls.append(
+                resolve_maybe_relative_url(extend_url, style_url, rootdir),
+            )
+    return urls
+
+
+def _resolve_node(style_url: str, rootdir: str) -> StyleNode:
+    start = time.perf_counter()
+    try:
+        style = tree.fetch_remote_file(style_url)
+    except Exception as exc:
+        return {
+            "extends": [],
+            "time": time.perf_counter() - start,
+            "error": getattr(exc, "message", None) or str(exc),
+        }
+    return {
+        "extends": _extends_urls(style, style_url, rootdir),
+        "time": time.perf_counter() - start,
+        "error": None,
+    }
+
+
+def resolve_style_graph(
+    style_urls: list[str],
+    rootdir: str,
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+) -> dict[str, StyleNode]:
+    """Fetch all the styles of a project, level by level.
+
+    Args:
+        style_urls (list): URIs of the styles of the project.
+        rootdir (str): Root directory of the project.
+        max_workers (int): Maximum number of styles fetched at the
+            same time.
+
+    Returns:
+        dict: Nodes of the graph by URI of the style in breadth-first
+            order. Each node contains the resolved URIs of the styles
+            that it extends, the time spent fetching it in seconds and
+            the error raised fetching it, if any.
+    """
+    graph: dict[str, StyleNode] = {}
+    level = list(dict.fromkeys(style_urls))
+    seen = set(level)
+    executor: ThreadPoolExecutor | None = None
+    try:
+        while level:
+            nodes: Iterator[StyleNode]
+            if all(map(uri_is_pointing_to_local_file, level)):
+                nodes = map(_resolve_node, level, itertools.repeat(rootdir))
+            else:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=max_workers)
+                nodes = executor.map(
+                    _resolve_node,
+                    level,
+                    itertools.repeat(rootdir),
+                )
+            next_level = []
+            for style_url, node in zip(level, nodes):
+                graph[style_url] = node
+                for extend_url in node["extends"]:
+                    if extend_url not in seen:
+                        seen.add(extend_url)
+                        next_level.append(extend_url)
+            level = next_level
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return graph
@@ -7,3 +7,11 @@ Error = "E"
 Fix = "F"
 InterruptingError = "I"
 ResultValue = "R"
+
+# Minimum number of files of a rule to process them in parallel, below
+# it starting the workers is slower than a serial processing
+PARALLEL_FILES_THRESHOLD = 32
+
+# Minimum size in bytes of the files whose JMESPath queries parse only
+# the top level keys that they read, below it a complete parse is cheap
+PARTIAL_PARSING_MIN_SIZE = 1024 * 1024
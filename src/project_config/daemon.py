@@ -0,0 +1,278 @@
+"""Long-lived server that executes commands with a warm in-memory state.
+
+The daemon keeps imported modules, discovered plugins and the memory
+tier of the cache (fetched styles, parsed files and compiled JMESPath
+expressions) between executions, so commands sent by clients don't pay
+for interpreter startup and disk cache lookups.
+
+Requests are executed one after another because the working directory
+and the environment are global to the process.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import stat
+import traceback
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from project_config.exceptions import ProjectConfigException
+
+
+if TYPE_CHECKING:
+    from project_config.compat import TypedDict
+
+    class DaemonRequest(TypedDict, total=False):  # noqa: D101
+        argv: list[str]
+        cwd: str
+        env: dict[str, str]
+        stop: bool
+
+    class DaemonResponse(TypedDict):  # noqa: D101
+        exit_code: int
+        stdout: str
+        stderr: str
+
+
+DAEMON_SOCKET_FILENAME = "daemon.sock"
+
+# Commands that can be executed by the daemon
+DAEMON_COMMANDS = ("check", "fix")
+
+# Seconds to wait for the request of a client, so clients that don't
+# finish sending it don't block the daemon
+DAEMON_REQUEST_TIMEOUT = 10
+
+
+class DaemonError(ProjectConfigException):
+    """The daemon can't be started."""
+
+
+def daemon_socket_path() -> str:
+    """Path to the Unix socket where the daemon listens.
+
+    It can be defined in the environment variable
+    ``PROJECT_CONFIG_DAEMON_SOCKET``.
+
+    Returns:
+        str: Path to the socket.
+    """
+    socket_path = os.environ.get("PROJECT_CONFIG_DAEMON_SOCKET")
+    if socket_path:
+        return socket_path
+
+    import appdirs
+
+    # not inside the cache directory, which can be removed by clients
+    return os.path.join(
+        appdirs.user_data_dir(appname="project-config"),
+        DAEMON_SOCKET_FILENAME,
+    )
+
+
+def _is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            return False
+        return True
+
+
+def _send(socket_path: str, request: DaemonRequest) -> DaemonResponse | None:
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            return None
+        client.sendall(json.dumps(request).encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        return json.loads(_recv_all(client))  # type: ignore
+
+
+def _recv_all(connection: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def send_command(
+    argv: list[str],
+    socket_path: str | None = None,
+) -> DaemonResponse | None:
+    """Execute a command in the daemon.
+
+    Args:
+        argv (list): Command line arguments of the command.
+        socket_path (str): Path to the socket of the daemon. By default,
+            the one returned by :py:func:`daemon_socket_path`.
+
+    Returns:
+        dict: Exit code and outputs of the command or ``None`` if there
+            is not a daemon listening.
+    """
+    return _send(
+        socket_path or daemon_socket_path(),
+        {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)},
+    )
+
+
+def stop_daemon(socket_path: str | None = None) -> bool:
+    """Stop the daemon.
+
+    Args:
+        socket_path (str): Path to the socket of the daemon. By default,
+            the one returned by :py:func:`daemon_socket_path`.
+
+    Returns:
+        bool: If a daemon was listening.
+    """
+    return (
+        _send(socket_path or daemon_socket_path(), {"stop": True}) is not None
+    )
+
+
+@contextlib.contextmanager
+def _environ(env: dict[str, str]) -> Any:
+    previous_env = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(previous_env)
+
+
+def execute_request(request: DaemonRequest) -> DaemonResponse:
+    """Execute a command requested to the daemon.
+
+    Args:
+        request (dict): Command line arguments, working directory and
+            environment of the client.
+
+    Returns:
+        dict: Exit code and outputs of the command.
+    """
+    from contextlib_chdir import chdir as chdir_ctx
+
+    from project_config.__main__ import run
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+        stderr,
+    ), _environ(request["env"]), chdir_ctx(request["cwd"]):
+        try:
+            exit_code = run(request["argv"])
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _parse_request(data: bytes) -> DaemonRequest:
+    request = json.loads(data)
+    if not isinstance(request, dict):
+        raise ValueError("the request must be an object")
+    if not request.get("stop"):
+        for key in ("argv", "cwd", "env"):
+            if key not in request:
+                raise ValueError(f"missing '{key}' in the request")
+    return request  # type: ignore
+
+
+def _bind(socket_path: str) -> socket.socket:
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        raise DaemonError("The daemon requires support for Unix sockets")
+
+    if os.path.exists(socket_path):
+        if _is_listening(socket_path):
+            raise DaemonError(
+                f"A daemon is already listening at '{socket_path}'",
+            )
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            raise DaemonError(f"'{socket_path}' is not a socket")
+        # stale socket of a daemon that has not been stopped gracefully
+        os.remove(socket_path)
+
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # only the owner can send commands
+    previous_umask = os.umask(0o177)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(previous_umask)
+    server.listen()
+    return server
+
+
+def serve(
+    socket_path: str | None = None,
+    on_ready: Callable[[], Any] | None = None,
+) -> None:
+    """Listen for commands until a stop request is received.
+
+    Args:
+        socket_path (str): Path to the socket. By default, the one
+            returned by :py:func:`daemon_socket_path`.
+        on_ready (Callable): Function called when the daemon starts
+            listening.
+    """
+    if socket_path is None:
+        socket_path = daemon_socket_path()
+    server = _bind(socket_path)
+    if on_ready is not None:
+        on_ready()
+    try:
+        while True:
+            connection, _ = server.accept()
+            with connection:
+                connection.settimeout(DAEMON_REQUEST_TIMEOUT)
+                try:
+                    data = _recv_all(connection)
+                except OSError:
+                    # the client has not sent its request in time
+                    continue
+                if not data:
+                    # probe of other daemon starting
+                    continue
+                try:
+                    request = _parse_request(data)
+                except ValueError as exc:
+                    request = {}
+                    response: DaemonResponse = {
+                        "exit_code": 1,
+                        "stdout": "",
+                        "stderr": f"Invalid request to the daemon: {exc}\n",
+                    }
+                else:
+                    if request.get("stop"):
+                        response = {"exit_code": 0, "stdout": "", "stderr": ""}
+                    else:
+                        response = execute_request(request)
+                # the client could have disconnected
+                with contextlib.suppress(OSError):
+                    connection.sendall(json.dumps(response).encode("utf-8"))
+            if request.get("stop"):
+                break
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(socket_path)
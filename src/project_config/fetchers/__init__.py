@@ -5,18 +5,35 @@ from __future__ import annotations
 import importlib
 import os
 import urllib.parse
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from project_config.compat import cached_function, importlib_metadata
 from project_config.exceptions import (
     ProjectConfigException,
     ProjectConfigNotImplementedError,
 )
+from project_config.fetchers import mirror
 from project_config.serializers import (
     SerializerError,
     guess_preferred_serializer,
     serialize_for_url,
 )
-from project_config.utils.http import ProjectConfigTimeoutError
+from project_config.utils.http import ProjectConfigHTTPError
+
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+PROJECT_CONFIG_FETCHERS_ENTRYPOINTS_GROUP = "project_config.fetchers"
+
+#: Modules of the fetchers included with project-config by scheme.
+BUILTIN_FETCHERS = {
+    "file": "project_config.fetchers.file",
+    "github": "project_config.fetchers.github",
+    "https": "project_config.fetchers.https",
+    "mirror": "project_config.fetchers.mirror",
+}
 
 
 class FetchError(ProjectConfigException):
@@ -40,6 +57,51 @@ schemes_to_modnames = {
 }
 
 
+@cached_function
+def _fetchers_entry_points() -> dict[str, importlib_metadata.EntryPoint]:
+    # discovering entry points requires to read the metadata of all
+    # installed distributions, so is done once per process
+    entry_points: dict[str, importlib_metadata.EntryPoint] = {}
+    for entry_point in importlib_metadata.entry_points(
+        group=PROJECT_CONFIG_FETCHERS_ENTRYPOINTS_GROUP,
+    ):
+        # fetchers of other distributions always replace the built-in
+        # ones, whatever the order of the distributions is
+        if entry_point.name in entry_points and entry_point.value.startswith(
+            f"{__name__}.",
+        ):
+            continue
+        entry_points[entry_point.name] = entry_point
+    return entry_points
+
+
+@cached_function
+def get_fetcher(scheme: str) -> ModuleType:
+    """Get the fetcher module for a scheme.
+
+    Fetchers are modules that define a function ``fetch``, which
+    receives the URL parts of an URI and returns the content of the
+    resource, and optionally a function ``resolve_url``. They are
+    registered by scheme in the entry point group
+    ``project_config.fetchers``, which can override the built-in
+    fetchers. Each fetcher is resolved once per process.
+
+    Args:
+        scheme (str): Scheme of the URIs handled by the fetcher.
+
+    Returns:
+        ModuleType: Fetcher module.
+    """
+    entry_point = _fetchers_entry_points().get(scheme)
+    if entry_point is not None:
+        return entry_point.load()  # type: ignore
+
+    modname = BUILTIN_FETCHERS.get(scheme)
+    if modname is None:
+        raise SchemeProtocolNotImplementedError(scheme)
+    return importlib.import_module(modname)
+
+
 def _get_scheme_from_urlparts(url_parts: urllib.parse.SplitResult) -> str:
     return (
         "file"
@@ -78,18 +140,20 @@ def download_file_from_urlsplit_scheme(
     scheme: str,
     **kwargs: Any,
 ) -> str:
-    """Download a file from a URL knowing its scheme."""
-    try:
-        module = importlib.import_module(f"project_config.fetchers.{scheme}")
-    except ImportError:
-        raise SchemeProtocolNotImplementedError(scheme) from None
+    """Download a file from a URL knowing its scheme.
+
+    If a mirror is defined, remote resources are downloaded from it.
+    """
+    if scheme in mirror.MIRRORED_SCHEMES and mirror.mirror_location():
+        url_parts = urllib.parse.urlsplit(mirror.mirrored_url(url_parts))
+        scheme = "mirror"
+    module = get_fetcher(scheme)
 
     try:
-        # TODO: ModuleType with protocol here?
         return module.fetch(url_parts, **kwargs)  # type: ignore
     except FileNotFoundError:
         raise FetchError(f"'{url}' file not found") from None
-    except ProjectConfigTimeoutError as exc:
+    except ProjectConfigHTTPError as exc:
         raise FetchError(exc.message) from exc
 
 
@@ -134,8 +198,8 @@ def resolve_url(url: str) -> tuple[str, str]:
     url_parts = urllib.parse.urlsplit(url)
     scheme = _get_scheme_from_urlparts(url_parts)
     try:
-        module = importlib.import_module(f"project_config.fetchers.{scheme}")
-    except ImportError:  # pragma: no cover
+        module = get_fetcher(scheme)
+    except SchemeProtocolNotImplementedError:  # pragma: no cover
         raise SchemeProtocolNotImplementedError(
             scheme,
             action="Resolving",
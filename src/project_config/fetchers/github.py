@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-import base64
 import json
 import os
 import re
+import time
 import urllib.parse
 from enum import Enum
 from typing import Any
 
 from project_config import __version__
-from project_config.utils.http import GET
+from project_config.cache import Cache
+from project_config.lock import is_frozen
+from project_config.utils.http import GET, ProjectConfigHTTPError
 
 
 SEMVER_REGEX = r"\d+\.\d+\.\d+"
@@ -37,16 +39,49 @@ def _github_headers(accept: AcceptHeader | None = None) -> dict[str, str]:
     return headers
 
 
-def _build_github_api_url(
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_RAW_URL = "https://raw.githubusercontent.com"
+
+# tags requested to the GitHub API by page and maximum number of pages
+TAGS_PER_PAGE = 100
+MAX_TAGS_PAGES = 10
+
+# trees of mutable references, like branches, are not stored in the
+# cache, but reused by the process during this number of seconds
+MUTABLE_TREE_EXPIRATION = 60
+
+_mutable_trees: dict[str, tuple[float, dict[str, str]]] = {}
+
+
+def _split_url(
+    url_parts: urllib.parse.SplitResult,
+) -> tuple[str, str, str | None, str]:
+    """Split a ``gh:`` scheme URI in its parts.
+
+    Returns:
+        tuple: Repository owner, repository name, git reference (if
+            defined) and path of the file inside the repository.
+    """
+    project_maybe_with_gitref, fpath = url_parts.path.lstrip("/").split(
+        "/",
+        maxsplit=1,
+    )
+    if "@" in project_maybe_with_gitref:
+        project, git_reference = project_maybe_with_gitref.split("@")
+    else:
+        project, git_reference = (project_maybe_with_gitref, None)
+    return url_parts.netloc, project, git_reference, fpath
+
+
+def _build_github_raw_url(
     repo_owner: str,
     repo_name: str,
     git_reference: str | None,
     fpath: str,
 ) -> str:
-    query_parameters = "" if not git_reference else f"?ref={git_reference}"
     return (
-        f"https://api.github.com/repos/{repo_owner}/{repo_name}"
-        f"/contents/{fpath}{query_parameters}"
+        f"{GITHUB_RAW_URL}/{repo_owner}/{repo_name}/{git_reference or 'HEAD'}"
+        f"/{urllib.parse.quote(fpath)}"
     )
 
 
@@ -57,43 +92,138 @@ def resolve_url(url_parts: urllib.parse.SplitResult) -> str:
         url_parts (urllib.parse.SplitResult): The URL parts of the URI.
 
     Returns:
-        str: The real ``https:`` scheme URL.
+        str: The real ``https:`` scheme URL of the raw content of the file.
     """
-    # extract project, filepath and git reference
-    project_maybe_with_gitref, fpath = url_parts.path.lstrip("/").split(
-        "/",
-        maxsplit=1,
+    return _build_github_raw_url(*_split_url(url_parts))
+
+
+def _is_immutable_reference(git_reference: str | None) -> bool:
+    """Whether a git reference is a commit SHA or a version tag."""
+    if git_reference is None:
+        return False
+    return bool(
+        re.fullmatch(r"[0-9a-f]{40}", git_reference)
+        or re.fullmatch(rf"[a-zA-Z-]*{SEMVER_REGEX}\S*", git_reference),
     )
-    if "@" in project_maybe_with_gitref:
-        project, git_reference = project_maybe_with_gitref.split("@")
-    else:
-        project, git_reference = (project_maybe_with_gitref, None)
 
-    return _build_github_api_url(
-        url_parts.netloc,
-        project,
-        git_reference,
-        fpath,
+
+def repository_tree(
+    repo_owner: str,
+    repo_name: str,
+    git_reference: str | None,
+    **kwargs: Any,
+) -> dict[str, str] | None:
+    """Get the paths of all the files of a repository at a reference.
+
+    The tree is requested once to the GitHub API, so fetching several
+    files of the same repository doesn't require a request to the API
+    for each one. Only trees of commit SHAs and version tags are stored
+    in the cache. Trees of branches are reused during
+    :py:data:`MUTABLE_TREE_EXPIRATION` seconds by the process.
+
+    Args:
+        repo_owner (str): The Github repository owner.
+        repo_name (str): The Github repository name.
+        git_reference (str): Branch, tag or commit. If not defined, the
+            default branch.
+        **kwargs (Any): The keyword arguments to pass to the ``GET``
+            function.
+
+    Returns:
+        dict: Types of the entries (``blob`` for files and ``tree`` for
+            directories) by path or ``None`` if the tree can't be
+            obtained or is too big to be listed in a request.
+    """
+    url = (
+        f"{GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/git/trees"
+        f"/{git_reference or 'HEAD'}?recursive=1"
     )
+    immutable = _is_immutable_reference(git_reference)
+    cache_key = f"{url}#paths"
+    paths: dict[str, str] | None
+    if immutable:
+        paths = Cache.get(cache_key)
+    else:
+        requested_at, paths = _mutable_trees.get(cache_key, (0, None))
+        if time.monotonic() - requested_at > MUTABLE_TREE_EXPIRATION:
+            paths = None
+    if paths is not None:
+        return paths
+
+    try:
+        response = json.loads(
+            GET(
+                url,
+                use_cache=immutable,
+                headers=_github_headers(accept=AcceptHeader.JSON),
+                **kwargs,
+            ),
+        )
+    except ProjectConfigHTTPError:
+        return None
+    if response.get("truncated") or "tree" not in response:
+        return None
+    paths = {entry["path"]: entry["type"] for entry in response["tree"]}
+    if immutable:
+        Cache.set(cache_key, paths)
+    else:
+        _mutable_trees[cache_key] = (time.monotonic(), paths)
+    return paths
+
+
+def _directory_entries(
+    paths: dict[str, str],
+    dirpath: str,
+) -> list[dict[str, str]]:
+    prefix = f"{dirpath}/" if dirpath else ""
+    return [
+        {
+            "name": path[len(prefix) :],
+            "path": path,
+            "type": "dir" if entry_type == "tree" else "file",
+        }
+        for path, entry_type in paths.items()
+        if path.startswith(prefix) and "/" not in path[len(prefix) :]
+    ]
 
 
 def fetch(url_parts: urllib.parse.SplitResult, **kwargs: Any) -> Any:
     """Fetch a resource through HTTPs protocol for a Github URI.
 
+    The files are downloaded from the raw content endpoint of GitHub,
+    which is not limited by the rate limit of its API. Directories are
+    listed with the tree of the repository.
+
     Args:
         url_parts (urllib.parse.SplitResult): The URL parts of the URI.
         **kwargs (Any): The keyword arguments to pass to the ``GET`` function.
 
     Returns:
-        str: The fetched resource content.
+        str: The fetched resource content. For directories, a list with
+            the name, path and type of their entries.
     """
-    if "headers" not in kwargs:
-        kwargs["headers"] = {}
-    kwargs["headers"].update(_github_headers(accept=AcceptHeader.JSON))
-    response = json.loads(GET(resolve_url(url_parts), **kwargs))
-    if "content" in response:
-        return base64.b64decode(response["content"]).decode("utf-8")
-    return response
+    repo_owner, repo_name, git_reference, fpath = _split_url(url_parts)
+    headers = {**kwargs.pop("headers", {}), **_github_headers()}
+    # in frozen mode the files are served from the lock file
+    paths = (
+        None
+        if is_frozen()
+        else repository_tree(repo_owner, repo_name, git_reference, **kwargs)
+    )
+    # files missing in the tree are requested anyway, the tree could
+    # be outdated
+    if paths is not None and paths.get(fpath.rstrip("/")) == "tree":
+        return _directory_entries(paths, fpath.rstrip("/"))
+
+    return GET(
+        _build_github_raw_url(repo_owner, repo_name, git_reference, fpath),
+        headers=headers,
+        **kwargs,
+    )
+
+
+def _version_key(tag: str) -> tuple[int, ...]:
+    return tuple(int(number) for number in re.findall(r"\d+", tag))
 
 
 def get_latest_release_tags(
@@ -101,7 +231,11 @@ def get_latest_release_tags(
     repo_name: str,
     only_semver: bool = False,  # noqa: FBT001, FBT002
 ) -> list[str]:
-    """Get the latest release tag of a Github repository.
+    """Get the latest release tags of a Github repository.
+
+    The tags are requested to the GitHub API by pages and sorted
+    by version from latest to oldest. Tags without numbers are placed
+    at the end.
 
     Args:
         repo_owner (str): The Github repository owner.
@@ -109,18 +243,22 @@ def get_latest_release_tags(
         only_semver (bool): If True, only return a tag if it is a semver tag.
 
     Returns:
-        str: The latest release tag.
+        list: The tags, from latest to oldest.
     """
-    result = GET(
-        f"https://github.com/{repo_owner}/{repo_name}/tags",
-        headers=_github_headers(),
-    )
-    regex = (
-        rf'/{re.escape(repo_owner)}/{re.escape(repo_name)}/releases/tag/([^"]+)'
-    )
+    tags: list[str] = []
+    for page in range(1, MAX_TAGS_PAGES + 1):
+        page_tags = json.loads(
+            GET(
+                f"{GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/tags"
+                f"?per_page={TAGS_PER_PAGE}&page={page}",
+                headers=_github_headers(accept=AcceptHeader.JSON),
+            ),
+        )
+        tags.extend(tag["name"] for tag in page_tags)
+        if len(page_tags) < TAGS_PER_PAGE:
+            break
 
     response = []
-    tags = re.findall(regex, result)
     for tag in tags:
         if tag in response:
             continue
@@ -134,4 +272,9 @@ def get_latest_release_tags(
             continue
 
         response.append(tag)
-    return response
+    # stable sort, tags with the same version keep the order of the API
+    return sorted(
+        response,
+        key=lambda tag: (bool(_version_key(tag)), _version_key(tag)),
+        reverse=True,
+    )
@@ -0,0 +1,83 @@
+"""Mirror resources URIs fetcher.
+
+A mirror is a local directory or the base URL of an HTTP/s server that
+stores copies of remote resources. The copies are placed in paths
+formed by the scheme, the host and the path of the original URIs.
+For example, the file ``gh://mondeja/project-config-styles@v5.4/base.json5``
+is stored in ``<mirror>/gh/mondeja/project-config-styles@v5.4/base.json5``.
+
+The mirror is defined by the environment variable
+``PROJECT_CONFIG_MIRROR``. When it is defined, all the resources of the
+mirrored schemes are fetched from it instead of from their servers.
+Resources of the mirror can be fetched explicitly too with
+``mirror://<scheme>/<host>/<path>`` URIs.
+"""
+
+from __future__ import annotations
+
+import os
+import urllib.parse
+from typing import Any
+
+from project_config.utils.http import GET
+
+
+#: Environment variable that defines the location of the mirror.
+MIRROR_ENVVAR = "PROJECT_CONFIG_MIRROR"
+
+#: Schemes of URIs whose resources are fetched from the mirror.
+MIRRORED_SCHEMES = {"gh", "github", "http", "https"}
+
+# schemes whose resources are stored in the directory of other scheme
+_canonical_schemes = {"github": "gh", "http": "https"}
+
+
+def mirror_location() -> str | None:
+    """Return the location of the mirror, if it is defined."""
+    return os.environ.get(MIRROR_ENVVAR) or None
+
+
+def mirrored_url(url_parts: urllib.parse.SplitResult) -> str:
+    """Return the ``mirror:`` scheme URI of a remote resource.
+
+    Args:
+        url_parts (urllib.parse.SplitResult): The URL parts of the URI
+            of the remote resource.
+
+    Returns:
+        str: URI of the copy of the resource in the mirror.
+    """
+    scheme = _canonical_schemes.get(url_parts.scheme, url_parts.scheme)
+    return f"mirror://{scheme}/{_mirror_path(url_parts)}"
+
+
+def _mirror_path(url_parts: urllib.parse.SplitResult) -> str:
+    return f"{url_parts.netloc}/{url_parts.path.lstrip('/')}"
+
+
+def fetch(url_parts: urllib.parse.SplitResult, **kwargs: Any) -> Any:
+    """Fetch a resource from the mirror.
+
+    Args:
+        url_parts (urllib.parse.SplitResult): The URL parts of a
+            ``mirror:`` scheme URI.
+        **kwargs (Any): The keyword arguments to pass to the ``GET``
+            function if the mirror is served through HTTP/s.
+
+    Returns:
+        str: The content of the resource in the mirror.
+    """
+    location = mirror_location()
+    if location is None:
+        raise FileNotFoundError(url_parts.geturl())
+
+    path = _mirror_path(url_parts)
+    if urllib.parse.urlsplit(location).scheme in ("http", "https"):
+        return GET(
+            f"{location.rstrip('/')}/{urllib.parse.quote(path)}",
+            **kwargs,
+        )
+
+    fpath = os.path.join(os.path.expanduser(location), *path.split("/"))
+    with open(fpath, encoding="utf-8") as f:
+        return f.read()
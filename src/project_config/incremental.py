@@ -0,0 +1,247 @@
+"""Records of rules used to check projects incrementally.
+
+When checking incrementally, the inputs read by each rule are recorded
+along with the errors that it reported. In the next executions, rules
+whose inputs have not changed are not executed again, their errors are
+reported from the record instead. Results of actions are also cached by
+the state of the inputs of their rules.
+
+The inputs of a rule are the local files and remote resources read
+through :py:mod:`project_config.tree` and every string of the rule
+definition that could be a path, like files checked by conditionals.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from jmespath.exceptions import JMESPathError
+
+from project_config import __version__, tree
+from project_config.utils.jmespath import (
+    IMPURE_JMESPATH_FUNCTIONS,
+    analyze_JMESPath_expression,
+)
+
+
+if TYPE_CHECKING:
+    from project_config.compat import TypedDict
+    from project_config.types_ import ErrorDict, Rule
+
+    class RuleRecord(TypedDict):  # noqa: D101
+        files: dict[str, str | None]
+        urls: dict[str, str | None]
+        errors: list[ErrorDict]
+        interrupted: bool
+
+
+def rule_record_key(rootdir: str, rule_index: int, rule: Rule) -> str:
+    """Get the cache key of the record of a rule.
+
+    Args:
+        rootdir (str): Root directory of the project.
+        rule_index (int): Position of the rule in the style.
+        rule (dict): Definition of the rule.
+
+    Returns:
+        str: Key of the record, which changes if the definition of the
+            rule or the version of project-config change.
+    """
+    definition = json.dumps(rule, sort_keys=True, default=str)
+    digest = hashlib.sha256(
+        f"{__version__}:{rule_index}:{definition}".encode(),
+    ).hexdigest()
+    return f"ic://{os.path.abspath(rootdir)}#{digest}"
+
+
+def rule_JMESPath_functions(rule: Rule) -> set[str]:
+    """Get the JMESPath functions called by the expressions of a rule.
+
+    Every string of the rule definition that calls a function is
+    analyzed as a JMESPath expression, so keys and values that only
+    contain the name of a function are not taken into account.
+
+    Args:
+        rule (dict): Definition of the rule.
+
+    Returns:
+        set: Names of the functions called.
+    """
+    functions: set[str] = set()
+    for string in _iter_strings(rule):
+        if "(" not in string:
+            continue
+        try:
+            functions.update(analyze_JMESPath_expression(string).functions)
+        except JMESPathError:
+            # not an expression
+            continue
+    return functions
+
+
+def rule_is_recordable(rule: Rule) -> bool:
+    """Check if the errors of a rule only depend on the files it reads.
+
+    Rules using JMESPath functions that query the environment or the
+    file system can't be recorded.
+
+    Args:
+        rule (dict): Definition of the rule.
+
+    Returns:
+        bool: If the rule can be recorded.
+    """
+    return IMPURE_JMESPATH_FUNCTIONS.isdisjoint(rule_JMESPath_functions(rule))
+
+
+def _iter_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _iter_strings(key)
+            yield from _iter_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_strings(item)
+
+
+def rule_paths(rule: Rule) -> set[str]:
+    """Get the strings of a rule definition that could be paths.
+
+    Args:
+        rule (dict): Definition of the rule.
+
+    Returns:
+        set: Strings that could be paths of local files.
+    """
+    return {
+        string
+        for string in _iter_strings(rule)
+        if string and "\0" not in string and "\n" not in string
+    }
+
+
+def local_file_state(fpath: str) -> str | None:
+    """Get the state of a local file.
+
+    Args:
+        fpath (str): Path to the file.
+
+    Returns:
+        str: Digest of the content of the file, ``"directory"`` for
+            directories or ``None`` if the file doesn't exist.
+    """
+    try:
+        fstat = os.stat(fpath)
+    except (OSError, ValueError):
+        return None
+    if stat.S_ISDIR(fstat.st_mode):
+        return "directory"
+    try:
+        return tree.local_file_digest(fpath, fstat)
+    except OSError:  # pragma: no cover
+        return None
+
+
+def create_rule_record(
+    paths: Iterable[str],
+    urls: Iterable[str],
+    errors: list[ErrorDict],
+    *,
+    interrupted: bool,
+) -> RuleRecord:
+    """Create the record of an execution of a rule.
+
+    Args:
+        paths (Iterable[str]): Local inputs of the rule.
+        urls (Iterable[str]): Remote inputs of the rule.
+        errors (list): Errors reported by the rule.
+        interrupted (bool): If the rule interrupted the check.
+
+    Returns:
+        dict: Record of the rule.
+    """
+    return {
+        "files": {fpath: local_file_state(fpath) for fpath in paths},
+        "urls": {url: tree.remote_file_digest(url) for url in urls},
+        "errors": errors,
+        "interrupted": interrupted,
+    }
+
+
+def action_results_key(  # noqa: PLR0913
+    action: str,
+    plugin_name: str,
+    plugin_version: str,
+    rule: Rule,
+    files: list[str],
+    paths: Iterable[str],
+) -> str:
+    """Get the cache key of the results of an action.
+
+    Args:
+        action (str): Name of the action.
+        plugin_name (str): Name of the plugin that defines the action.
+        plugin_version (str): Version of the plugin.
+        rule (dict): Definition of the rule, without its files.
+        files (list[str]): Files of the rule, in order. Results and the
+            indexes of the files in their messages depend on the order.
+        paths (Iterable[str]): Local inputs of the rule.
+
+    Returns:
+        str: Key of the results, which changes if the definition of the
+            rule, the plugin or the state of some input change.
+    """
+    inputs = {fpath: local_file_state(fpath) for fpath in paths}
+    definition = json.dumps(
+        [action, plugin_name, plugin_version, rule, files, inputs],
+        sort_keys=True,
+        default=str,
+    )
+    return f"rr://{hashlib.sha256(definition.encode()).hexdigest()}"
+
+
+def _is_changed(fpath: str, changed_files: set[str]) -> bool:
+    fpath = os.path.abspath(fpath)
+    if fpath in changed_files:
+        return True
+    # files inside directories read by the rule
+    directory = fpath.rstrip(os.sep) + os.sep
+    return any(changed.startswith(directory) for changed in changed_files)
+
+
+def rule_record_is_valid(
+    record: RuleRecord,
+    changed_files: Iterable[str] | None = None,
+) -> bool:
+    """Check if the inputs of a recorded rule have not changed.
+
+    Args:
+        record (dict): Record of the rule.
+        changed_files (Iterable[str]): Local files changed since the
+            record was created. If defined, the content of the local
+            inputs is not checked, only if they are between changed
+            files.
+
+    Returns:
+        bool: If the errors of the record can be reported.
+    """
+    if changed_files is not None:
+        changed = {os.path.abspath(fpath) for fpath in changed_files}
+        if any(_is_changed(fpath, changed) for fpath in record["files"]):
+            return False
+    elif any(
+        local_file_state(fpath) != state
+        for fpath, state in record["files"].items()
+    ):
+        return False
+    return all(
+        tree.remote_file_digest(url) == state
+        for url, state in record["urls"].items()
+    )
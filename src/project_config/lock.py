@@ -0,0 +1,197 @@
+"""Lock file bundling the remote resources used by a project.
+
+The ``project-config lock`` command resolves all the remote resources
+used to check a project (extended styles, remote files of rules and
+latest tags of repositories) and writes them in a lock file, compressed
+and with the digest of each resource.
+
+In frozen mode (``--frozen`` option) the HTTP/s responses are served
+only from the lock file, so checking a project doesn't require network
+access and always uses the same resources.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterator
+
+from project_config.exceptions import ProjectConfigException
+
+
+LOCK_FILENAME = "project-config.lock"
+
+# Increment it when the layout of the lock file changes
+LOCK_FORMAT_VERSION = 1
+
+# resources served in frozen mode by URL, ``None`` if not frozen
+_frozen_resources: dict[str, str] | None = None
+
+# responses recorded inside :py:func:`record_responses` contexts
+_recorded_responses: list[dict[str, str]] = []
+_recorded_responses_lock = threading.Lock()
+
+
+class ProjectConfigLockError(ProjectConfigException):
+    """The lock file is not valid or it doesn't contain a resource."""
+
+
+def _digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def write_lock_file(fpath: str, resources: dict[str, str]) -> None:
+    """Write a lock file with resources.
+
+    The file is a JSON object compressed with gzip. Its content only
+    depends on the resources, so it changes only if they change.
+
+    Args:
+        fpath (str): Path to the lock file.
+        resources (dict): Contents of the resources by URL.
+    """
+    data = {
+        "version": LOCK_FORMAT_VERSION,
+        "resources": {
+            url: {"sha256": _digest(content), "content": content}
+            for url, content in sorted(resources.items())
+        },
+    }
+    with open(fpath, "wb") as f, gzip.GzipFile(
+        filename="",
+        mode="wb",
+        fileobj=f,
+        mtime=0,
+    ) as gz:
+        gz.write(json.dumps(data, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def read_lock_file(fpath: str) -> dict[str, str]:
+    """Read the resources of a lock file checking their digests.
+
+    Args:
+        fpath (str): Path to the lock file.
+
+    Raises:
+        ProjectConfigLockError: The lock file doesn't exist, it is
+            corrupted or has been created by an incompatible version.
+
+    Returns:
+        dict: Contents of the resources by URL.
+    """
+    try:
+        with gzip.open(fpath, "rb") as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
+        raise ProjectConfigLockError(
+            f"Lock file '{fpath}' not found, execute"
+            " 'project-config lock' to create it",
+        ) from None
+    except (OSError, EOFError, ValueError):
+        raise ProjectConfigLockError(
+            f"Lock file '{fpath}' is corrupted",
+        ) from None
+
+    if not isinstance(data, dict) or data.get("version") != (
+        LOCK_FORMAT_VERSION
+    ):
+        raise ProjectConfigLockError(
+            f"Lock file '{fpath}' has been created by an incompatible"
+            " version of project-config, execute 'project-config lock'"
+            " to update it",
+        )
+
+    resources = {}
+    for url, resource in data["resources"].items():
+        if _digest(resource["content"]) != resource["sha256"]:
+            raise ProjectConfigLockError(
+                f"Lock file '{fpath}' is corrupted, the digest of"
+                f" '{url}' doesn't match its content",
+            )
+        resources[url] = resource["content"]
+    return resources
+
+
+def lock_file_path(rootdir: str) -> str:
+    """Path to the lock file of a project.
+
+    Args:
+        rootdir (str): Root directory of the project.
+
+    Returns:
+        str: Path to the lock file.
+    """
+    return os.path.join(rootdir, LOCK_FILENAME)
+
+
+def freeze(resources: dict[str, str] | None) -> None:
+    """Serve HTTP/s responses only from resources of a lock file.
+
+    Args:
+        resources (dict): Contents of the resources by URL. If ``None``,
+            the frozen mode is disabled.
+    """
+    global _frozen_resources  # noqa: PLW0603
+    _frozen_resources = resources
+
+
+def is_frozen() -> bool:
+    """Check if the frozen mode is enabled."""
+    return _frozen_resources is not None
+
+
+def frozen_response(url: str) -> str:
+    """Get the response for an URL in frozen mode.
+
+    Args:
+        url (str): URL of the resource.
+
+    Raises:
+        ProjectConfigLockError: The resource is not in the lock file.
+
+    Returns:
+        str: Content of the resource.
+    """
+    try:
+        return _frozen_resources[url]  # type: ignore
+    except KeyError:
+        raise ProjectConfigLockError(
+            f"'{url}' is not in the lock file, execute"
+            " 'project-config lock' to update it",
+        ) from None
+
+
+@contextlib.contextmanager
+def record_responses() -> Iterator[dict[str, str]]:
+    """Record the HTTP/s responses obtained in all threads.
+
+    Yields:
+        dict: Contents of the responses by URL, including the ones
+            served by the cache.
+    """
+    responses: dict[str, str] = {}
+    with _recorded_responses_lock:
+        _recorded_responses.append(responses)
+    try:
+        yield responses
+    finally:
+        with _recorded_responses_lock:
+            _recorded_responses.remove(responses)
+
+
+def record_response(url: str, content: str) -> None:
+    """Record a response inside :py:func:`record_responses` contexts.
+
+    Args:
+        url (str): URL of the resource.
+        content (str): Content of the response.
+    """
+    if not _recorded_responses:
+        return
+    with _recorded_responses_lock:
+        for responses in _recorded_responses:
+            responses[url] = content
@@ -10,7 +10,7 @@ import inspect
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from project_config.compat import importlib_metadata
+from project_config.compat import cached_function, importlib_metadata
 from project_config.exceptions import ProjectConfigException
 from project_config.types_ import ActionsContext
 
@@ -27,6 +27,17 @@ if TYPE_CHECKING:
     ]
 
 
+@cached_function
+def _plugins_entry_points() -> tuple[importlib_metadata.EntryPoint, ...]:
+    # discovering entry points requires to read the metadata of all
+    # installed distributions, so is done once per process
+    return tuple(
+        importlib_metadata.entry_points(
+            group=PROJECT_CONFIG_PLUGINS_ENTRYPOINTS_GROUP,
+        ),
+    )
+
+
 class InvalidPluginFunction(ProjectConfigException):
     """Exception raised when a method of a plugin class is not valid."""
 
@@ -54,6 +65,12 @@ class Plugins:
         # map from actions to static methods
         self.actions_static_methods: dict[str, PluginMethod] = {}
 
+        # map from plugin names to the versions of their distributions
+        self.plugins_versions: dict[str, str | None] = {}
+
+        # names of the plugins distributed with project-config
+        self.builtin_plugin_names: set[str] = set()
+
         if prepare_all:
             # prepare all plugins cache, default and third party,
             # useful in tasks like plugins listing
@@ -130,9 +147,7 @@ class Plugins:
         return action in self.actions_plugin_names
 
     def _prepare_default_plugins_cache(self) -> None:
-        for plugin in importlib_metadata.entry_points(
-            group=PROJECT_CONFIG_PLUGINS_ENTRYPOINTS_GROUP,
-        ):
+        for plugin in _plugins_entry_points():
             if not plugin.value.startswith(
                 f"{PROJECT_CONFIG_PLUGINS_ENTRYPOINTS_GROUP}.",
             ):
@@ -141,9 +156,7 @@ class Plugins:
             self._add_plugin_to_cache(plugin)
 
     def _prepare_all_plugins_cache(self) -> None:
-        for plugin in importlib_metadata.entry_points(
-            group=PROJECT_CONFIG_PLUGINS_ENTRYPOINTS_GROUP,
-        ):
+        for plugin in _plugins_entry_points():
             self._add_plugin_to_cache(plugin)
 
     def prepare_3rd_party_plugin(self, plugin_name: str) -> None:
@@ -154,10 +167,9 @@ class Plugins:
         Args:
             plugin_name (str): Name of the entry point of the plugin.
         """
-        for plugin in importlib_metadata.entry_points(
-            group=PROJECT_CONFIG_PLUGINS_ENTRYPOINTS_GROUP,
-            name=plugin_name,
-        ):
+        for plugin in _plugins_entry_points():
+            if plugin.name != plugin_name:
+                continue
             # Allow third party plugins to override default plugins
             if plugin.value.startswith(
                 f"{PROJECT_CONFIG_PLUGINS_ENTRYPOINTS_GROUP}.",
@@ -174,6 +186,14 @@ class Plugins:
             return
         plugin = plugin_entry_point.load()
         self.loaded_plugins[plugin_entry_point.name] = plugin
+        distribution = getattr(plugin_entry_point, "dist", None)
+        self.plugins_versions[plugin_entry_point.name] = (
+            None if distribution is None else distribution.version
+        )
+        if plugin_entry_point.value.startswith(
+            f"{PROJECT_CONFIG_PLUGINS_ENTRYPOINTS_GROUP}.",
+        ):
+            self.builtin_plugin_names.add(plugin_entry_point.name)
 
         for action in dir(plugin):
             if action.startswith("_"):
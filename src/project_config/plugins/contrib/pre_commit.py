@@ -154,7 +154,8 @@ class PreCommitPlugin:
                     "file": f"{fpath}",
                 }
 
-            instance = tree.cached_local_file(fpath)
+            # the instance is edited below, so copy the cached one
+            instance = copy.deepcopy(tree.cached_local_file(fpath))
             if not isinstance(instance, dict):
                 yield InterruptingError, {
                     "message": (
@@ -138,7 +138,7 @@ class InclusionPlugin:
                         )
 
                         if not fixer_query:
-                            instance.append(expected_line)
+                            instance = [*instance, expected_line]
                             tree.edit_local_file(fpath, instance)
                             fixed = True
                         else:
@@ -373,6 +373,7 @@ class InclusionPlugin:
                         )
 
                         if not fixer_query:
+                            instance = list(instance)
                             instance.remove(expected_line)
                             tree.edit_local_file(fpath, instance)
                             fixed = True
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import json
 import os
 import pprint
 import stat
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from project_config import (
@@ -21,6 +23,11 @@ from project_config import (
 if TYPE_CHECKING:
     from project_config import Results, Rule
 
+from project_config.cache import Cache
+from project_config.constants import (
+    PARALLEL_FILES_THRESHOLD,
+    PARTIAL_PARSING_MIN_SIZE,
+)
 from project_config.fetchers import FetchError
 from project_config.serializers import SerializerError
 from project_config.utils.jmespath import (
@@ -32,10 +39,184 @@ from project_config.utils.jmespath import (
     evaluate_JMESPath_or_expected_value_error,
     fix_tree_serialized_file_by_jmespath,
     is_literal_jmespath_expression,
+    jmespath_top_level_keys,
     smart_fixer_by_expected_value,
 )
 
 
+def _expressions_top_level_keys(value: list[list[Any]]) -> set[str] | None:
+    keys: set[str] = set()
+    for expression, _, _ in value:
+        try:
+            expression_keys = jmespath_top_level_keys(
+                compile_JMESPath_expression_or_error(expression),
+            )
+        except JMESPathError:
+            # the error is reported evaluating the expression
+            return None
+        if expression_keys is None:
+            return None
+        keys.update(expression_keys)
+    return keys
+
+
+def _JMESPathsMatch_file(
+    value: list[list[Any]],
+    f: int,
+    fpath: str,
+    context: ActionsContext,
+) -> Results:
+    try:
+        fstat = os.stat(fpath)
+    except FileNotFoundError:
+        return
+    if stat.S_ISDIR(fstat.st_mode):
+        yield InterruptingError, {
+            "message": "A JMES path can not be applied to a directory",
+            "definition": f".files[{f}]",
+            "file": f'{fpath.rstrip("/")}/',
+        }
+
+    # big files are parsed only for the top level keys read by the
+    # expressions, but fixers need the complete content
+    keys = (
+        _expressions_top_level_keys(value)
+        if not context.fix and fstat.st_size >= PARTIAL_PARSING_MIN_SIZE
+        else None
+    )
+    instance = (
+        tree.cached_local_file(fpath)
+        if keys is None
+        else tree.cached_local_file_keys(fpath, keys)
+    )
+    instance_key = tree.cached_local_file_key(fpath)
+
+    for e, (expression, expected_value, fixer_query) in enumerate(
+        value,
+    ):
+        try:
+            compiled_expression = compile_JMESPath_or_expected_value_error(
+                expression,
+                expected_value,
+            )
+        except JMESPathError as exc:
+            yield InterruptingError, {
+                "message": exc.message,
+                "definition": f".JMESPathsMatch[{e}][0]",
+                "file": fpath,
+            }
+
+        try:
+            expression_result = evaluate_JMESPath_or_expected_value_error(
+                compiled_expression,
+                expected_value,
+                instance,
+                instance_key,
+            )
+        except JMESPathError as exc:
+            yield Error, {
+                "message": exc.message,
+                "definition": f".JMESPathsMatch[{e}]",
+                "file": fpath,
+            }
+            continue
+
+        if expression_result != expected_value:
+            if not fixer_query:
+                fixer_query = smart_fixer_by_expected_value(  # noqa: PLW2901
+                    compiled_expression,
+                    expected_value,
+                )
+            if context.fix and fixer_query:
+                try:
+                    compiled_fixer_query = compile_JMESPath_expression_or_error(
+                        fixer_query,
+                    )
+                except JMESPathError as exc:
+                    yield InterruptingError, {
+                        "message": exc.message,
+                        "definition": f".JMESPathsMatch[{e}][2]",
+                    }
+
+                try:
+                    changed = fix_tree_serialized_file_by_jmespath(
+                        compiled_fixer_query,
+                        instance,
+                        fpath,
+                    )
+                except JMESPathError as exc:
+                    yield InterruptingError, {
+                        "message": exc.message,
+                        "definition": f".JMESPathsMatch[{e}][2]",
+                    }
+                else:
+                    fixed = True
+                    if not changed:  # pragma: no cover
+                        continue
+                    # next expressions are applied to the fixed file
+                    instance = tree.cached_local_file(fpath)
+                    instance_key = tree.cached_local_file_key(fpath)
+            else:
+                fixed = False
+
+            yield Error, {
+                "message": (
+                    f"JMESPath '{expression}' does not match."
+                    f" Expected {pprint.pformat(expected_value)},"
+                    f" returned {pprint.pformat(expression_result)}"
+                ),
+                "definition": f".JMESPathsMatch[{e}]",
+                "file": fpath,
+                "fixed": fixed,
+                "fixable": bool(fixer_query),
+            }
+
+
+def _JMESPathsMatch_file_results(
+    value: list[list[Any]],
+    f: int,
+    fpath: str,
+) -> list[tuple[str, Any]]:
+    results = []
+    for breakage_type, breakage_value in _JMESPathsMatch_file(
+        value,
+        f,
+        fpath,
+        ActionsContext(fix=False),
+    ):
+        results.append((breakage_type, breakage_value))
+        if breakage_type == InterruptingError:
+            break
+    Cache.flush_stats()
+    return results
+
+
+def _JMESPathsMatch_files_in_parallel(
+    value: list[list[Any]],
+    files: list[str],
+    jobs: int,
+) -> Results:
+    """Evaluate JMESPathsMatch for files in a pool of processes.
+
+    Parsing files and evaluating expressions are CPU bound, so processes
+    are used instead of threads. Results are yielded in the order of the
+    files.
+    """
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(files)),
+        initializer=Cache.set_settings,
+        initargs=(Cache.get_settings(),),
+    ) as executor:
+        for results in executor.map(
+            _JMESPathsMatch_file_results,
+            itertools.repeat(value),
+            range(len(files)),
+            files,
+            chunksize=max(1, len(files) // (jobs * 4)),
+        ):
+            yield from results
+
+
 class JMESPathPlugin:
     @staticmethod
     def JMESPathsMatch(
@@ -86,105 +267,16 @@ class JMESPathPlugin:
                 }
 
         files = copy.copy(context.files)
-        for f, fpath in enumerate(files):
-            try:
-                fstat = os.stat(fpath)
-            except FileNotFoundError:
-                continue
-            if stat.S_ISDIR(fstat.st_mode):
-                yield InterruptingError, {
-                    "message": (
-                        "A JMES path can not be applied to a directory"
-                    ),
-                    "definition": f".files[{f}]",
-                    "file": f'{fpath.rstrip("/")}/',
-                }
-
-            instance = tree.cached_local_file(fpath)
-
-            for e, (expression, expected_value, fixer_query) in enumerate(
-                value,
-            ):
-                try:
-                    compiled_expression = (
-                        compile_JMESPath_or_expected_value_error(
-                            expression,
-                            expected_value,
-                        )
-                    )
-                except JMESPathError as exc:
-                    yield InterruptingError, {
-                        "message": exc.message,
-                        "definition": f".JMESPathsMatch[{e}][0]",
-                        "file": fpath,
-                    }
-
-                try:
-                    expression_result = (
-                        evaluate_JMESPath_or_expected_value_error(
-                            compiled_expression,
-                            expected_value,
-                            instance,
-                        )
-                    )
-                except JMESPathError as exc:
-                    yield Error, {
-                        "message": exc.message,
-                        "definition": f".JMESPathsMatch[{e}]",
-                        "file": fpath,
-                    }
-                    continue
-
-                if expression_result != expected_value:
-                    if not fixer_query:
-                        fixer_query = (  # noqa: PLW2901
-                            smart_fixer_by_expected_value(
-                                compiled_expression,
-                                expected_value,
-                            )
-                        )
-                    if context.fix and fixer_query:
-                        try:
-                            compiled_fixer_query = (
-                                compile_JMESPath_expression_or_error(
-                                    fixer_query,
-                                )
-                            )
-                        except JMESPathError as exc:
-                            yield InterruptingError, {
-                                "message": exc.message,
-                                "definition": f".JMESPathsMatch[{e}][2]",
-                            }
-
-                        try:
-                            changed = fix_tree_serialized_file_by_jmespath(
-                                compiled_fixer_query,
-                                instance,
-                                fpath,
-                            )
-                        except JMESPathError as exc:
-                            yield InterruptingError, {
-                                "message": exc.message,
-                                "definition": f".JMESPathsMatch[{e}][2]",
-                            }
-                        else:
-                            fixed = True
-                            if not changed:  # pragma: no cover
-                                continue
-                    else:
-                        fixed = False
-
-                    yield Error, {
-                        "message": (
-                            f"JMESPath '{expression}' does not match."
-                            f" Expected {pprint.pformat(expected_value)},"
-                            f" returned {pprint.pformat(expression_result)}"
-                        ),
-                        "definition": f".JMESPathsMatch[{e}]",
-                        "file": fpath,
-                        "fixed": fixed,
-                        "fixable": bool(fixer_query),
-                    }
+        jobs = min(context.jobs, os.cpu_count() or 1)
+        if (
+            jobs > 1
+            and not context.fix
+            and len(files) >= PARALLEL_FILES_THRESHOLD
+        ):
+            yield from _JMESPathsMatch_files_in_parallel(value, files, jobs)
+        else:
+            for f, fpath in enumerate(files):
+                yield from _JMESPathsMatch_file(value, f, fpath, context)
 
     @staticmethod
     def ifJMESPathsMatch(
@@ -261,6 +353,7 @@ class JMESPathPlugin:
 
             try:
                 instance = tree.cached_local_file(fpath)
+                instance_key = tree.cached_local_file_key(fpath)
             except SerializerError as exc:
                 yield InterruptingError, {
                     "message": exc.message,
@@ -291,6 +384,7 @@ class JMESPathPlugin:
                             compiled_expression,
                             expected_value,
                             instance,
+                            instance_key,
                         )
                     )
                 except JMESPathError as exc:
@@ -407,6 +501,7 @@ class JMESPathPlugin:
                     files_result = json.loads(files_expression[1:-1])
                 else:
                     files_instance = tree.cached_local_file(fpath)
+                    files_instance_key = tree.cached_local_file_key(fpath)
 
                     try:
                         files_compiled_expression = (
@@ -424,6 +519,7 @@ class JMESPathPlugin:
                         files_result = evaluate_JMESPath(
                             files_compiled_expression,
                             files_instance,
+                            files_instance_key,
                         )
                     except JMESPathError as exc:
                         yield InterruptingError, {
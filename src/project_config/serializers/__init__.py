@@ -7,11 +7,10 @@ import importlib
 import os
 import sys
 import urllib.parse
-from collections.abc import Callable
+from collections.abc import Callable, Container
 from typing import TYPE_CHECKING, Any
 
-from identify import identify
-
+from project_config.compat import cached_function
 from project_config.exceptions import ProjectConfigException
 
 
@@ -90,7 +89,7 @@ serializers: dict[
     ),
     ".toml": (
         [{"module": "project_config.serializers.toml"}],
-        [{"module": "tomlkit"}],
+        [{"module": "project_config.serializers.toml"}],
     ),
     ".ini": (
         [{"module": "project_config.serializers.ini"}],
@@ -121,6 +120,13 @@ serializers_fallback: tuple[
     [{"module": "project_config.serializers.text"}],
 )
 
+# modules of the serializers that can parse only some top level keys
+# of the documents through a function ``loads_keys``
+PARTIAL_SERIALIZERS = {
+    "json": "project_config.serializers.json",
+    "yaml": "project_config.serializers.yaml",
+}
+
 EMPTY_CONTENT_BY_SERIALIZER = {
     "json": "{}",
     "json5": "{}",
@@ -136,7 +142,19 @@ SERIALIZER_FROM_EXT_FILENAME = {
 }
 
 
+# serializer functions resolved by definitions and function names
+_resolved_serializers: dict[
+    tuple[int, str],
+    tuple[SerializerDefinitionType, SerializerFunction],
+] = {}
+
+
+@cached_function
 def _identify_serializer(filename: str) -> str:
+    # identify is imported on demand because it builds big tables of
+    # extensions at import time
+    from identify import identify
+
     tag: str | None = None
     for identified_tag in identify.tags_from_filename(filename):
         if f".{identified_tag}" in serializers:
@@ -208,38 +226,10 @@ def _get_serializer_function(  # noqa: PLR0912
                 ),
             ) from None
     serializer = serializer[0 if loader_function_name == "loads" else 1]  # type: ignore
-    # prepare serializer function
-    serializer_definition, module = None, None
-    for i, serializer_def in enumerate(serializer):
-        try:
-            module = importlib.import_module(
-                serializer_def["module"],  # type: ignore
-            )
-        except ImportError:  # pragma: no cover
-            # if module for implementation is not importable, try next maybe
-            if i > len(serializer) - 1:
-                raise
-        else:
-            serializer_definition = serializer_def
-            break
-    if serializer_definition is None:  # pragma: no cover
-        raise SerializerError(
-            _file_can_not_be_serialized_as_object_error(
-                url,
-                (
-                    f"\nSerializer for url '{url}' can't be located,"
-                    " surely because the library to handle it is"
-                    " not installed."
-                ),
-            ),
-        )
-
-    loader_function: SerializerFunction = getattr(
-        module,
-        serializer_definition.get(  # type: ignore
-            "function",
-            loader_function_name,
-        ),
+    serializer_definition, loader_function = _resolve_serializer(
+        url,
+        serializer,  # type: ignore
+        loader_function_name,
     )
 
     function_kwargs: SerializerFunctionKwargs = {}
@@ -263,16 +253,65 @@ def _get_serializer_function(  # noqa: PLR0912
             function_kwargs[kwarg_name] = obj
     """
 
-    if "function_kwargs_from_url_path" in serializer_definition:  # type: ignore
+    if "function_kwargs_from_url_path" in serializer_definition:
         function_kwargs.update(
-            serializer_definition["function_kwargs_from_url_path"](  # type: ignore
+            serializer_definition["function_kwargs_from_url_path"](
                 os.path.basename(url_parts.path),
             ),
         )
 
+    if not function_kwargs:
+        return loader_function
     return functools.partial(loader_function, **function_kwargs)
 
 
+def _resolve_serializer(
+    url: str,
+    serializer: SerializerDefinitionsType,
+    loader_function_name: str,
+) -> tuple[SerializerDefinitionType, SerializerFunction]:
+    """Resolve the function of the first importable serializer definition.
+
+    The modules of the serializers are imported on first use and the
+    resolved functions memoized, so the fallback implementations are
+    only tried once. The definitions are module level constants, so
+    their identities are stable keys.
+    """
+    key = (id(serializer), loader_function_name)
+    try:
+        return _resolved_serializers[key]
+    except KeyError:
+        pass
+
+    serializer_definition, module = None, None
+    for serializer_def in serializer:
+        try:
+            module = importlib.import_module(serializer_def["module"])
+        except ImportError:  # pragma: no cover
+            # if module for implementation is not importable, try next maybe
+            continue
+        serializer_definition = serializer_def
+        break
+    if serializer_definition is None:  # pragma: no cover
+        raise SerializerError(
+            _file_can_not_be_serialized_as_object_error(
+                url,
+                (
+                    f"\nSerializer for url '{url}' can't be located,"
+                    " surely because the library to handle it is"
+                    " not installed."
+                ),
+            ),
+        )
+
+    loader_function: SerializerFunction = getattr(
+        module,
+        serializer_definition.get("function", loader_function_name),
+    )
+    _resolved_serializers[key] = (serializer_definition, loader_function)
+    return serializer_definition, loader_function
+
+
 def guess_preferred_serializer(url: str) -> tuple[str, str]:
     """Guess preferred serializer for URL.
 
@@ -327,6 +366,7 @@ def serialize_for_url(
     url: str,
     string: str,
     prefer_serializer: str | None = None,
+    keys: Container[str] | None = None,
 ) -> Any:
     """Serializes to JSON a string according to the given URI.
 
@@ -335,6 +375,9 @@ def serialize_for_url(
             either using the extension or through `identify`_.
         string (str): File content to serialize.
         prefer_serializer (str): Preferred serializer.
+        keys (Container[str]): Top level keys to serialize. Only
+            honoured by the serializers of :py:data:`PARTIAL_SERIALIZERS`
+            when they are preferred, other serializers return all keys.
 
     Returns:
         dict: Result of the object serialization.
@@ -343,12 +386,17 @@ def serialize_for_url(
     """
     try:
         # serialize
-        result = _get_serializer_function(
-            url,
-            prefer_serializer=prefer_serializer,
-        )(
-            string,
-        )
+        if keys is not None and prefer_serializer in PARTIAL_SERIALIZERS:
+            result = importlib.import_module(
+                PARTIAL_SERIALIZERS[prefer_serializer],
+            ).loads_keys(string, keys)
+        else:
+            result = _get_serializer_function(
+                url,
+                prefer_serializer=prefer_serializer,
+            )(
+                string,
+            )
     except Exception:
         # handle exceptions in third party packages without importing them
         exc_class, exc, _ = sys.exc_info()
@@ -357,6 +405,7 @@ def serialize_for_url(
             "json",  # json.serializer.JSONDecodeError
             "pyjson5",  # pyjson5.Json5IllegalCharacter
             "tomli",  # tomli.TOMLDecodeError
+            "tomllib",  # tomllib.TOMLDecodeError
             "tomlkit",  # tomlkit.exceptions.UnexpectedEofError
         ):
             raise SerializerError(
@@ -365,7 +414,10 @@ def serialize_for_url(
                     f" {exc.args[0]}",  # type: ignore
                 ),
             ) from None
-        if package_name == "ruamel":
+        if package_name in (
+            "ruamel",  # ruamel.yaml.scanner.ScannerError
+            "yaml",  # yaml.scanner.ScannerError
+        ):
             raise SerializerError(
                 _file_can_not_be_serialized_as_object_error(
                     url,
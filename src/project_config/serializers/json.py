@@ -3,8 +3,70 @@
 from __future__ import annotations
 
 import json
+import re
+from collections.abc import Container
 from typing import Any
 
 
+_decoder = json.JSONDecoder()
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
 def dumps(obj: Any, **kwargs: Any) -> str:  # noqa: D103
     return f"{json.dumps(obj, indent=2, **kwargs)}\n"
+
+
+def loads_keys(string: str, keys: Container[str]) -> Any:
+    """Converts a JSON string to an object parsing only some keys.
+
+    If the JSON document is an object, only the values of the given
+    top level keys are kept in the result, so the memory used by the
+    other ones is released while the document is decoded. Other
+    documents are returned completely.
+
+    Args:
+        string (str): JSON string to convert.
+        keys (Container[str]): Top level keys to decode.
+
+    Returns:
+        Any: Object with the given keys found in the document.
+    """
+    idx = _WHITESPACE.match(string).end()  # type: ignore
+    if string[idx : idx + 1] != "{":
+        return json.loads(string)
+
+    result: dict[str, Any] = {}
+    idx = _WHITESPACE.match(string, idx + 1).end()  # type: ignore
+    if string[idx : idx + 1] == "}":
+        return result
+    while True:
+        if string[idx : idx + 1] != '"':
+            raise json.JSONDecodeError(
+                "Expecting property name enclosed in double quotes",
+                string,
+                idx,
+            )
+        key, idx = json.decoder.scanstring(string, idx + 1)  # type: ignore
+        idx = _WHITESPACE.match(string, idx).end()  # type: ignore
+        if string[idx : idx + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", string, idx)
+        idx = _WHITESPACE.match(string, idx + 1).end()  # type: ignore
+
+        # values of other keys are decoded and discarded at once, which
+        # is faster than scanning them with regular expressions
+        value, idx = _decoder.raw_decode(string, idx)
+        if key in keys:
+            result[key] = value
+
+        idx = _WHITESPACE.match(string, idx).end()  # type: ignore
+        char = string[idx : idx + 1]
+        if char == "}":
+            break
+        if char != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", string, idx)
+        idx = _WHITESPACE.match(string, idx + 1).end()  # type: ignore
+
+    if string[idx + 1 :].strip(" \t\n\r"):
+        raise json.JSONDecodeError("Extra data", string, idx + 1)
+    return result
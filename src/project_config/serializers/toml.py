@@ -1,10 +1,21 @@
-"""TOML serializing."""
+"""TOML serializing.
+
+TOML files are read with the standard library parser (or its backport
+``tomli`` in Python < 3.11), which is much faster than ``tomlkit`` and
+returns plain Python objects. ``tomlkit`` is only imported when an
+object must be written as TOML.
+"""
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
-import tomlkit
+
+if sys.version_info < (3, 11):  # pragma: < 3.11 cover
+    import tomli as tomllib
+else:  # pragma: >=3.11 cover
+    import tomllib
 
 
 def loads(string: str) -> dict[str, Any]:
@@ -16,35 +27,18 @@ def loads(string: str) -> dict[str, Any]:
     Returns:
         dict: Conversion result.
     """
+    return tomllib.loads(string)
+
+
+def dumps(obj: dict[str, Any]) -> str:
+    """Converts an object to a TOML file string.
+
+    Args:
+        obj (dict): Object to convert.
+
+    Returns:
+        str: Conversion result.
+    """
+    import tomlkit
 
-    def iterate_key_values(obj: Any) -> Any:
-        partial_result: dict[str, Any] | list[Any]
-
-        if isinstance(obj, dict):
-            partial_result = {}
-            for k, value in obj.items():
-                key = str(k)
-                if isinstance(value, dict):
-                    partial_result[key] = iterate_key_values(dict(value))
-                elif isinstance(value, list):
-                    partial_result[key] = iterate_key_values(value)
-                elif isinstance(value, str):
-                    partial_result[key] = str(value)
-                else:
-                    partial_result[key] = value
-
-        elif isinstance(obj, list):
-            partial_result = []
-            for item in obj:
-                if isinstance(item, dict):
-                    partial_result.append(iterate_key_values(dict(item)))
-                elif isinstance(item, list):
-                    partial_result.append(iterate_key_values(item))
-                elif isinstance(item, str):
-                    partial_result.append(str(item))
-                else:
-                    partial_result.append(item)
-
-        return partial_result
-
-    return iterate_key_values(dict(tomlkit.loads(string)))  # type: ignore
+    return tomlkit.dumps(obj)
@@ -1,12 +1,124 @@
-"""YAML to JSON converter."""
+"""YAML to JSON converter.
+
+The ``ruamel.yaml`` instances are reused by thread, because building
+them is expensive and they are not thread safe.
+
+Setting the environment variable ``PROJECT_CONFIG_YAML_LIBYAML`` to
+``true``, YAML strings are loaded with the ``CSafeLoader`` of PyYAML,
+based on libyaml, if it is installed. PyYAML resolves scalars using the
+YAML 1.1 specification, so its resolvers of booleans, integers and
+floats are replaced by the ones of the YAML 1.2 core schema. For
+example, the key ``on`` of GitHub workflows is loaded as a string.
+"""
 
 from __future__ import annotations
 
 import io
+import os
+import re
+import threading
+from collections.abc import Container
 from typing import Any
 
 import ruamel.yaml
 
+from project_config.compat import cached_function
+
+
+LIBYAML_ENVVAR = "PROJECT_CONFIG_YAML_LIBYAML"
+
+# lines that start a new top level node of a document
+_TOP_LEVEL_LINE = re.compile(r"^[^\s#].*$", re.M)
+
+# plain key of a top level mapping entry
+_TOP_LEVEL_PLAIN_KEY = re.compile(
+    r"([^\s'\"#&*!|>%@`?:,\[\]{}-][^#\n]*?)[ \t]*:(?:\s|$)",
+)
+
+# anchors and aliases could reference nodes of other top level entries
+_ANCHOR_OR_ALIAS = re.compile(r"(?:^|[\s\[{,])[&*][^\s\[\]{},]")
+
+_local = threading.local()
+
+
+def _yaml_instance(typ: str) -> ruamel.yaml.YAML:
+    try:
+        return getattr(_local, typ)  # type: ignore
+    except AttributeError:
+        pass
+
+    yaml = ruamel.yaml.YAML(typ=typ, pure=True)
+    if typ == "rt":
+        yaml.default_flow_style = False
+        yaml.width = 88888
+        yaml.indent(mapping=2, sequence=4, offset=2)
+    setattr(_local, typ, yaml)
+    return yaml
+
+
+@cached_function
+def _libyaml_loader() -> Any:
+    """Build a libyaml based loader that resolves scalars as YAML 1.2.
+
+    Returns ``None`` if PyYAML is not installed or has been built
+    without libyaml bindings.
+    """
+    try:
+        from yaml import CSafeLoader
+    except ImportError:
+        return None
+
+    class YAML12CSafeLoader(CSafeLoader):
+        pass
+
+    replaced_tags = {
+        "tag:yaml.org,2002:bool",
+        "tag:yaml.org,2002:int",
+        "tag:yaml.org,2002:float",
+    }
+    YAML12CSafeLoader.yaml_implicit_resolvers = {
+        first_char: [
+            (tag, regexp)
+            for tag, regexp in resolvers
+            if tag not in replaced_tags
+        ]
+        for first_char, resolvers in (
+            CSafeLoader.yaml_implicit_resolvers.items()
+        )
+    }
+    YAML12CSafeLoader.add_implicit_resolver(
+        "tag:yaml.org,2002:bool",
+        re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+        list("tTfF"),
+    )
+    YAML12CSafeLoader.add_implicit_resolver(
+        "tag:yaml.org,2002:int",
+        re.compile(r"^(?:[-+]?[0-9]+|0o[0-7]+|0x[0-9a-fA-F]+)$"),
+        list("-+0123456789"),
+    )
+    YAML12CSafeLoader.add_implicit_resolver(
+        "tag:yaml.org,2002:float",
+        re.compile(
+            r"""^(?:[-+]?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?)(?:[eE][-+]?[0-9]+)?
+            |[-+]?\.(?:inf|Inf|INF)
+            |\.(?:nan|NaN|NAN))$""",
+            re.X,
+        ),
+        list("-+0123456789."),
+    )
+
+    def construct_yaml12_int(loader: Any, node: Any) -> int:
+        # leading zeros don't define octal numbers in YAML 1.2
+        value = loader.construct_scalar(node)
+        base = 16 if "0x" in value else 8 if "0o" in value else 10
+        return int(value, base)
+
+    YAML12CSafeLoader.add_constructor(
+        "tag:yaml.org,2002:int",
+        construct_yaml12_int,
+    )
+    return YAML12CSafeLoader
+
 
 def dumps(
     obj: dict[str, Any],
@@ -15,15 +127,92 @@ def dumps(
 ) -> str:
     """Deserializes an object converting it to string in YAML format."""
     f = io.StringIO()
-    yaml = ruamel.yaml.YAML(typ="rt", pure=True)
-    yaml.default_flow_style = False
-    yaml.width = 88888
-    yaml.indent(mapping=2, sequence=4, offset=2)
-    yaml.dump(obj, f, *args, **kwargs)
+    _yaml_instance("rt").dump(obj, f, *args, **kwargs)
     return f.getvalue()
 
 
 def loads(string: str, *args: Any, **kwargs: Any) -> Any:
     """Deserializes a YAML string to a dictionary."""
-    yaml = ruamel.yaml.YAML(typ="safe", pure=True)
-    return yaml.load(string, *args, **kwargs)
+    if os.environ.get(LIBYAML_ENVVAR) == "true" and not args and not kwargs:
+        loader = _libyaml_loader()
+        if loader is not None:
+            import yaml
+
+            return yaml.load(string, Loader=loader)  # noqa: S506
+    return _yaml_instance("safe").load(string, *args, **kwargs)
+
+
+def _top_level_chunks(string: str) -> list[tuple[str | None, str]] | None:
+    """Split a YAML document by the entries of its top level mapping.
+
+    Returns:
+        list: Plain key, if it can be known without parsing, and text
+            of each entry or ``None`` if the document can't be split.
+    """
+    if _ANCHOR_OR_ALIAS.search(string):
+        return None
+
+    starts = []
+    for i, match in enumerate(_TOP_LEVEL_LINE.finditer(string)):
+        line = match.group(0)
+        if line.startswith(("---", "...")):
+            # only an explicit start of the first document is supported
+            if i == 0 and line[3:].strip() == "":
+                continue
+            return None
+        if line.startswith(("-", "%", "[", "{", "?")):
+            return None
+        starts.append(match.start())
+
+    chunks = []
+    for start, end in zip(starts, [*starts[1:], len(string)]):
+        chunk = string[start:end]
+        key_match = _TOP_LEVEL_PLAIN_KEY.match(chunk)
+        chunks.append((key_match.group(1) if key_match else None, chunk))
+    return chunks
+
+
+def loads_keys(string: str, keys: Container[str]) -> Any:
+    """Deserializes a YAML string parsing only some keys.
+
+    If the YAML document is a block mapping, only the entries of the
+    given top level keys are parsed. Other documents, like the ones
+    with anchors or aliases, are parsed completely.
+
+    Args:
+        string (str): YAML string to deserialize.
+        keys (Container[str]): Top level keys to parse.
+
+    Returns:
+        Any: Object with the given keys found in the document.
+    """
+    chunks = _top_level_chunks(string)
+    if chunks is not None:
+        result: dict[str, Any] = {}
+        for key, chunk in chunks:
+            if key is not None and key not in keys:
+                continue
+            try:
+                value = loads(chunk)
+            except Exception:
+                # the split was not valid, like for flow collections
+                # with lines without indentation
+                break
+            if not isinstance(value, dict):
+                break
+            result.update(
+                (entry_key, entry_value)
+                for entry_key, entry_value in value.items()
+                if entry_key in keys
+            )
+        else:
+            return result
+
+    value = loads(string)
+    if isinstance(value, dict):
+        return {
+            entry_key: entry_value
+            for entry_key, entry_value in value.items()
+            if entry_key in keys
+        }
+    return value
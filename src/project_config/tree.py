@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import hashlib
+import json
 import os
 import stat
-from collections.abc import Iterable
+import threading
+import time
+from collections.abc import Iterable, Iterator
 from typing import Any
 from urllib.parse import SplitResult
 
@@ -15,7 +19,9 @@ from project_config.fetchers import (
     download_file_from_urlsplit_scheme,
     urlsplit_with_scheme,
 )
+from project_config.lock import is_frozen
 from project_config.serializers import (
+    PARTIAL_SERIALIZERS,
     SerializerError,
     deserialize_for_url,
     guess_preferred_serializer,
@@ -25,10 +31,15 @@ from project_config.utils.crypto import hash_file
 
 
 __all__ = (
+    "local_file_digest",
     "cache_file",
     "cached_local_file",
+    "cached_local_file_keys",
+    "cached_local_file_key",
     "fetch_remote_file",
+    "remote_file_digest",
     "edit_local_file",
+    "record_inputs",
 )
 
 
@@ -37,6 +48,113 @@ IGNORE_SERIALIZATION_ERRORS_CTX = functools.partial(
     SerializerError,
 )
 
+# Files modified more recently than this window could be modified again
+# without changing their stat signature in filesystems with coarse
+# timestamps, so their fingerprints are not stored.
+RACY_FINGERPRINT_WINDOW_NS = 2_000_000_000
+
+# files read by each thread inside :py:func:`record_inputs` contexts
+_inputs_recorder = threading.local()
+
+
+@contextlib.contextmanager
+def record_inputs() -> Iterator[dict[str, set[str]]]:
+    """Record the files read through this module in the current thread.
+
+    Yields:
+        dict: Paths of local files (``files``) and URLs of remote files
+            (``urls``) read inside the context.
+    """
+    inputs: dict[str, set[str]] = {"files": set(), "urls": set()}
+    previous_inputs = getattr(_inputs_recorder, "inputs", None)
+    _inputs_recorder.inputs = inputs
+    try:
+        yield inputs
+    finally:
+        _inputs_recorder.inputs = previous_inputs
+        if previous_inputs is not None:
+            previous_inputs["files"].update(inputs["files"])
+            previous_inputs["urls"].update(inputs["urls"])
+
+
+def _record_input(kind: str, name: str) -> None:
+    inputs = getattr(_inputs_recorder, "inputs", None)
+    if inputs is not None:
+        inputs[kind].add(name)
+
+
+def local_file_digest(
+    fpath: str,
+    fstat: os.stat_result | None = None,
+) -> str:
+    """Get the content digest of a local file.
+
+    The digest is stored in the cache indexed by the path and the stat
+    signature (modification time, size and inode) of the file, so it is
+    only computed again when the file changes.
+
+    Args:
+        fpath (str): The file path.
+        fstat (os.stat_result, optional): Result of ``os.stat`` for the
+            file, if already known.
+
+    Returns:
+        str: The hexadecimal digest of the file content.
+    """
+    if fstat is None:
+        fstat = os.stat(fpath)
+    signature = (fstat.st_mtime_ns, fstat.st_size, fstat.st_ino)
+    key = f"fp://{os.path.abspath(fpath)}"
+
+    fingerprint = Cache.get(key)
+    if fingerprint is not None and fingerprint[0] == signature:
+        return fingerprint[1]  # type: ignore
+
+    digest = hash_file(fpath)
+    if time.time_ns() - fstat.st_mtime_ns > RACY_FINGERPRINT_WINDOW_NS:
+        Cache.set(key, (signature, digest))
+    return digest
+
+
+def _cached_local_file_content(fname: str, fhash: str) -> str:
+    fcontent: str | None = Cache.get(fhash)
+    if fcontent is None:
+        with open(fname, encoding="utf-8") as f:
+            fcontent = f.read()
+        Cache.set(fhash, fcontent)
+    return fcontent
+
+
+def _cached_local_file_serialization(
+    fname: str,
+    fhash: str,
+    serializer: str,
+) -> Any:
+    """Get the serialized content of a local file, caching it.
+
+    Each pair of content digest and serializer is stored as its own
+    entry, so identical files in different projects are only parsed
+    once and adding a serializer doesn't rewrite other entries.
+    """
+    if serializer == "_plain":
+        return _cached_local_file_content(fname, fhash)
+
+    key = f"{fhash}?{serializer}"
+    result = Cache.get(key)
+    if result is None:
+        result = serialize_for_url(
+            fname,
+            _cached_local_file_content(fname, fhash),
+            prefer_serializer=serializer,
+        )
+        # Don't serialize Python files because some types like
+        # modules can't be serialized by pickle
+        #
+        # TODO: Manage this in a better way
+        if serializer != "py":
+            Cache.set(key, result)
+    return result
+
 
 def _split_fname_preferred_serializer(
     fpath: str,
@@ -62,6 +180,22 @@ def _split_fpath_parts(
     return (fname, preferred_serializer, uri_parts, scheme)
 
 
+def _cached_remote_file(fname: str) -> dict[str, Any] | None:
+    # in frozen mode the remote files are read from the lock file, not
+    # from the cache, which could contain other versions of them
+    if is_frozen():
+        return None
+    value = Cache.get(fname)
+    if value is None:
+        return None
+    if isinstance(value, str):
+        # HTTP/s responses are cached by URL when they are downloaded
+        return {"_plain": value}
+    # entries are shared through the memory cache, so they are copied
+    # to add serializations to them
+    return dict(value)
+
+
 def cache_file(  # noqa: PLR0912, PLR0915
     fpath: str,
     serializers: list[str] | None = None,
@@ -70,9 +204,10 @@ def cache_file(  # noqa: PLR0912, PLR0915
 ) -> None:
     """Cache the file content and its serialized version.
 
-    If the file is local, the cache key is the file path, its last
-    modification time and root directory name. If the file is remote,
-    the cache key is the file URL.
+    If the file is local, its content and each of its serialized
+    versions are cached by the digest of the content, so they are shared
+    between identical files. If the file is remote, the cache key is the
+    file URL.
 
     Args:
         fpath (str): The file path or URL.
@@ -90,6 +225,7 @@ def cache_file(  # noqa: PLR0912, PLR0915
         scheme,
     ) = _split_fpath_parts(fpath)
     is_local_file = scheme == "file"
+    _record_input("files" if is_local_file else "urls", fname)
 
     if serializers is None:
         serializers = []
@@ -112,8 +248,6 @@ def cache_file(  # noqa: PLR0912, PLR0915
         else contextlib.nullcontext
     )
 
-    previous_value_in_cache: dict[str, str] | None = None
-
     if is_local_file:
         # the file is local, check if exists in the cache unmodified
         try:
@@ -125,44 +259,16 @@ def cache_file(  # noqa: PLR0912, PLR0915
             # the file is a directory, skip caching
             return
 
-        # use hashes for files with multiple serializers
-        fhash = hash_file(fname)
-
-        previous_value_in_cache = Cache.get(fhash)
-        if previous_value_in_cache is None:
-            # if not, cache the file content
-            with open(fname, encoding="utf-8") as f:
-                plain_fcontent = f.read()
-
-            new_cache_value = {"_plain": plain_fcontent}
-
-            with serialization_context():  # type: ignore
-                for serializer in serializers or []:
-                    new_cache_value[serializer] = serialize_for_url(
-                        fname,
-                        plain_fcontent,
-                        prefer_serializer=serializer,
-                    )
-
-            Cache.set(fhash, new_cache_value)
-        else:
-            # file is already cached, just update serialized versions
-            _changed = False
-            with serialization_context():  # type: ignore
-                for serializer in serializers or []:
-                    if serializer not in previous_value_in_cache:
-                        previous_value_in_cache[serializer] = serialize_for_url(
-                            fname,
-                            previous_value_in_cache["_plain"],
-                            prefer_serializer=serializer,
-                        )
-                        _changed = True
+        # local files are addressed by the digest of their content
+        fhash = local_file_digest(fname, fstat)
 
-            if _changed:
-                Cache.set(fhash, previous_value_in_cache)
+        _cached_local_file_content(fname, fhash)
+        with serialization_context():  # type: ignore
+            for serializer in serializers or []:
+                _cached_local_file_serialization(fname, fhash, serializer)
     else:
         # the file is remote, check if resides in the cache
-        previous_value_in_cache = Cache.get(fname)
+        previous_value_in_cache = _cached_remote_file(fname)
 
         if previous_value_in_cache is None:
             # TODO: What happens trying to download a directory?
@@ -181,7 +287,9 @@ def cache_file(  # noqa: PLR0912, PLR0915
                         prefer_serializer=serializer,
                     )
 
-            Cache.set(fname, new_cache_value)
+            # frozen contents must not leak into not frozen executions
+            if not is_frozen():
+                Cache.set(fname, new_cache_value)
         else:
             # file is already cached, just update serialized versions
             _changed = False
@@ -199,6 +307,19 @@ def cache_file(  # noqa: PLR0912, PLR0915
                 Cache.set(fname, previous_value_in_cache)
 
 
+def _resolve_local_file_serializer(
+    fpath: str,
+    serializer: str | None = None,
+) -> tuple[str, str]:
+    fname, preferred_serializer = _split_fname_preferred_serializer(fpath)
+
+    if serializer is None:
+        if preferred_serializer is None:
+            preferred_serializer = guess_preferred_serializer(fname)[1]
+        serializer = preferred_serializer
+    return fname, serializer
+
+
 def cached_local_file(
     fpath: str,
     serializer: str | None = None,
@@ -212,48 +333,83 @@ def cached_local_file(
     Returns:
         str: The cached file content.
     """
-    fname, preferred_serializer = _split_fname_preferred_serializer(fpath)
+    fname, serializer = _resolve_local_file_serializer(fpath, serializer)
+    _record_input("files", fname)
 
-    if serializer is None:
-        if preferred_serializer is None:
-            preferred_serializer = guess_preferred_serializer(fname)[1]
-        serializer = preferred_serializer
+    # A file could be requested but is not inside `files`
+    # object, so it could not be cached yet
+    return _cached_local_file_serialization(
+        fname,
+        local_file_digest(fname),
+        serializer,
+    )
 
-    fhash = hash_file(fname)
-    previous_value_in_cache: dict[str, str] | None = Cache.get(fhash)
 
-    if previous_value_in_cache is None:
-        # A file could be requested but is not inside `files`
-        # object, so it is not cached yet
-        cache_file(
-            fpath,
-            serializers=(
-                [serializer] if serializer not in ("_plain", None) else []
-            ),
-        )
-        return cached_local_file(fpath, serializer=serializer)
+def cached_local_file_keys(
+    fpath: str,
+    keys: Iterable[str],
+    serializer: str | None = None,
+) -> Any:
+    """Get the cached file content serialized only for some keys.
+
+    For the serializers that support it, only the given top level keys
+    of the document are parsed and cached, which is faster and needs
+    less memory for big files whose queries read a few keys. Other
+    serializers return the complete content, like
+    :py:func:`cached_local_file`.
+
+    Args:
+        fpath (str): The file path.
+        keys (Iterable[str]): Top level keys to serialize.
+        serializer (str, optional): The serializer to use reading the file.
 
-    if serializer not in previous_value_in_cache:
-        previous_value_in_cache[serializer] = serialize_for_url(
+    Returns:
+        Any: The cached file content with the given keys.
+    """
+    fname, serializer = _resolve_local_file_serializer(fpath, serializer)
+    if serializer not in PARTIAL_SERIALIZERS:
+        return cached_local_file(fpath, serializer)
+    _record_input("files", fname)
+
+    keys = set(keys)
+    fhash = local_file_digest(fname)
+    key = f"{fhash}?{serializer}#{json.dumps(sorted(keys))}"
+    result = Cache.get(key)
+    if result is None:
+        result = serialize_for_url(
             fname,
-            previous_value_in_cache["_plain"],
+            _cached_local_file_content(fname, fhash),
             prefer_serializer=serializer,
+            keys=keys,
         )
-
-        # Don't serialize Python files because some types like
-        # modules can't be serialized by pickle
-        #
-        # TODO: Manage this in a better way
-        if serializer == "py":
-            result = previous_value_in_cache.pop("py")
-        else:
-            result = previous_value_in_cache[serializer]
-        Cache.set(fhash, previous_value_in_cache)
-    else:
-        result = previous_value_in_cache[serializer]
+        Cache.set(key, result)
     return result
 
 
+def cached_local_file_key(
+    fpath: str,
+    serializer: str | None = None,
+) -> str | None:
+    """Get a stable key for the serialized content of a local file.
+
+    The key only changes when the content of the file changes, so it can
+    be used to cache computations made over the object returned by
+    :py:func:`cached_local_file`.
+
+    Args:
+        fpath (str): The file path.
+        serializer (str, optional): The serializer to use reading the file.
+
+    Returns:
+        str: The key or ``None`` if the serialized content is not cached,
+            like for Python files.
+    """
+    fname, serializer = _resolve_local_file_serializer(fpath, serializer)
+    if serializer == "py":
+        return None
+    return f"{local_file_digest(fname)}?{serializer}"
+
+
 def fetch_remote_file(
     uri: str,
     serializer: str | None = None,
@@ -273,35 +429,54 @@ def fetch_remote_file(
     if scheme == "file":
         cache_file(uri)
         return cached_local_file(uri)
+    _record_input("urls", fname)
 
     if serializer is None:
         if preferred_serializer is None:
             _, serializer = guess_preferred_serializer(fname)
         serializer = preferred_serializer
 
-    previous_value_in_cache: dict[str, str] | None = Cache.get(fname)
+    new_cache_value = _cached_remote_file(fname)
 
-    if previous_value_in_cache is None:
+    if new_cache_value is None:
         plain_fcontent = download_file_from_urlsplit_scheme(
             fname,
             uri_parts,
             scheme,
         )
         new_cache_value = {"_plain": plain_fcontent}
-    else:
-        new_cache_value = previous_value_in_cache
 
     if serializer not in new_cache_value:
         new_cache_value[serializer] = serialize_for_url(  # type: ignore
             fname,
-            plain_fcontent,
+            new_cache_value["_plain"],
             prefer_serializer=serializer,
         )
 
-        Cache.set(fname, new_cache_value)
+        # frozen contents must not leak into not frozen executions
+        if not is_frozen():
+            Cache.set(fname, new_cache_value)
     return new_cache_value[serializer]  # type: ignore
 
 
+def remote_file_digest(url: str) -> str | None:
+    """Get the content digest of a remote file stored in the cache.
+
+    Args:
+        url (str): The file URL.
+
+    Returns:
+        str: The hexadecimal digest of the file content or ``None`` if
+            the file is not in the cache.
+    """
+    value = Cache.get(url)
+    if value is None:
+        return None
+    # HTTP/s responses are cached by URL when they are downloaded
+    plain_fcontent = value if isinstance(value, str) else value["_plain"]
+    return hashlib.sha256(plain_fcontent.encode("utf-8")).hexdigest()
+
+
 def edit_local_file(fpath: str, new_content: Any) -> bool:
     """Edit the local file and update the cache.
 
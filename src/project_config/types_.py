@@ -37,6 +37,8 @@ class ActionsContext:
 
     fix: bool
     files: list[str] = dataclasses.field(default_factory=list)
+    # number of workers that actions can use to process files in parallel
+    jobs: int = 1
 
 
 __all__ = ("Rule", "Results", "ErrorDict", "ActionsContext")
@@ -1,15 +1,56 @@
-"""HTTP/s utilities."""
+"""HTTP/s utilities.
+
+Requests are performed over persistent connections that are reused
+between requests to the same host, so fetching several resources from
+the same server only pays for the TCP and TLS handshakes once per
+connection. The number of requests in flight is capped and failed
+requests are retried with exponential backoff and jitter.
+"""
 
 from __future__ import annotations
 
+import gzip
+import http.client
 import os
+import random
+import threading
 import time
-from typing import Any
+import urllib.parse
+from typing import TYPE_CHECKING, Any, NamedTuple
 from urllib.error import ContentTooShortError, HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 from project_config.cache import Cache
 from project_config.exceptions import ProjectConfigException
+from project_config.lock import frozen_response, is_frozen, record_response
+
+
+if TYPE_CHECKING:
+    from project_config.compat import TypedDict
+
+    class HTTPValidators(TypedDict):  # noqa: D101
+        etag: str | None
+        last_modified: str | None
+
+
+#: Maximum number of requests performed at the same time.
+MAX_CONCURRENT_REQUESTS = 8
+
+#: Maximum number of redirections followed by a request.
+MAX_REDIRECTIONS = 5
+
+#: Maximum time in seconds to wait between two attempts of a request.
+MAX_BACKOFF = 8.0
+
+#: Statuses of responses whose requests can be retried.
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+REDIRECTION_STATUSES = {301, 302, 303, 307, 308}
+
+NOT_MODIFIED_STATUS = 304
+
+# statuses of responses to requests rejected by rate limits
+RATE_LIMITED_STATUSES = {403, 429}
 
 
 class ProjectConfigHTTPError(ProjectConfigException):
@@ -20,35 +61,370 @@ class ProjectConfigTimeoutError(ProjectConfigHTTPError):
     """Timeout error."""
 
 
+class _RetryableError(Exception):
+    def __init__(self, reason: str, retry_after: float | None = None):
+        super().__init__(reason)
+        self.retry_after = retry_after
+
+
+class _Response(NamedTuple):
+    status: int
+    body: str
+    etag: str | None
+    last_modified: str | None
+
+
+def _response(status: int, body: str, headers: Any) -> _Response:
+    return _Response(
+        status,
+        body,
+        headers.get("ETag"),
+        headers.get("Last-Modified"),
+    )
+
+
+class ConnectionPool:
+    """Persistent HTTP/s connections grouped by host.
+
+    Connections are taken by one request at a time and given back to
+    the pool when the response has been read completely, so they can
+    be reused by the next requests to the same host.
+    """
+
+    def __init__(self, maxsize: int = MAX_CONCURRENT_REQUESTS) -> None:
+        """Connection pool initializer.
+
+        Args:
+            maxsize (int): Maximum number of requests in flight and of
+                idle connections kept for each host.
+        """
+        self.maxsize = maxsize
+        self.requests = threading.BoundedSemaphore(maxsize)
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]]
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        scheme: str,
+        netloc: str,
+        timeout: float,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Take a connection to a host.
+
+        Args:
+            scheme (str): ``http`` or ``https``.
+            netloc (str): Host and optional port of the server.
+            timeout (float): Timeout for the operations of the socket.
+
+        Returns:
+            tuple: Connection and if it has been reused.
+        """
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            connection = idle.pop() if idle else None
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+        connection_class = (
+            http.client.HTTPSConnection
+            if scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return connection_class(netloc, timeout=timeout), False
+
+    def release(
+        self,
+        scheme: str,
+        netloc: str,
+        connection: http.client.HTTPConnection,
+    ) -> None:
+        """Give back a connection to the pool.
+
+        Args:
+            scheme (str): ``http`` or ``https``.
+            netloc (str): Host and optional port of the server.
+            connection (http.client.HTTPConnection): Connection whose
+                last response has been read completely.
+        """
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.maxsize:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def clear(self) -> None:
+        """Close all the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+pool = ConnectionPool()
+
+# remaining requests and reset time of the rate limits by host
+_rate_limits: dict[str, tuple[int, float]] = {}
+_rate_limits_lock = threading.Lock()
+
+
+def _update_rate_limit(netloc: str, headers: Any) -> None:
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if (
+        remaining is None
+        or reset is None
+        or not remaining.isdigit()
+        or not reset.isdigit()
+    ):
+        return
+    with _rate_limits_lock:
+        _rate_limits[netloc] = (int(remaining), float(reset))
+
+
+def rate_limit_delay(netloc: str) -> float:
+    """Time to wait until the rate limit of a host is reset.
+
+    The rate limits are read from the ``X-RateLimit-Remaining`` and
+    ``X-RateLimit-Reset`` headers of the responses, like the ones of
+    the GitHub API.
+
+    Args:
+        netloc (str): Host and optional port of the server.
+
+    Returns:
+        float: Seconds to wait before sending a request to the host, 0
+            if its rate limit has not been exhausted.
+    """
+    with _rate_limits_lock:
+        rate_limit = _rate_limits.get(netloc)
+    if rate_limit is None or rate_limit[0] > 0:
+        return 0
+    return max(0, rate_limit[1] - time.time())
+
+
+def _rate_limit_error(netloc: str) -> _RetryableError:
+    return _RetryableError(
+        f"Rate limit of '{netloc}' exceeded",
+        rate_limit_delay(netloc),
+    )
+
+
+def _reset_pool_after_fork() -> None:
+    # sockets are shared with the parent process, which would read
+    # the responses of the requests sent by the child
+    pool._idle = {}
+    pool._lock = threading.Lock()
+    pool.requests = threading.BoundedSemaphore(pool.maxsize)
+    global _rate_limits_lock  # noqa: PLW0603
+    _rate_limits_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
+def _is_proxied(url_parts: urllib.parse.SplitResult) -> bool:
+    return url_parts.scheme in getproxies() and not proxy_bypass(
+        url_parts.hostname or "",
+    )
+
+
+def _read_response(response: http.client.HTTPResponse) -> str:
+    body = response.read()
+    if response.getheader("Content-Encoding", "").lower() == "gzip":
+        body = gzip.decompress(body)
+    return body.decode("utf-8")
+
+
+def _retry_after(response: http.client.HTTPResponse) -> float | None:
+    value = response.getheader("Retry-After")
+    if value is None or not value.strip().isdigit():
+        return None
+    return float(value)
+
+
+def _send(
+    url_parts: urllib.parse.SplitResult,
+    headers: dict[str, str],
+    timeout: float,
+) -> tuple[http.client.HTTPResponse, str]:
+    """Send a request in a pooled connection.
+
+    Returns:
+        tuple: Response and its body.
+    """
+    target = url_parts.path or "/"
+    if url_parts.query:
+        target += f"?{url_parts.query}"
+
+    connection, reused = pool.acquire(
+        url_parts.scheme,
+        url_parts.netloc,
+        timeout,
+    )
+    try:
+        connection.request("GET", target, headers=headers)
+        response = connection.getresponse()
+        body = _read_response(response)
+    except (
+        http.client.RemoteDisconnected,
+        ConnectionResetError,
+        BrokenPipeError,
+    ):
+        connection.close()
+        if not reused:
+            raise
+        # the server closed an idle connection, try in a new one
+        return _send(url_parts, headers, timeout)
+    except BaseException:
+        connection.close()
+        raise
+
+    if response.will_close:
+        connection.close()
+    else:
+        pool.release(url_parts.scheme, url_parts.netloc, connection)
+    return response, body
+
+
+def _request_through_proxy(
+    url: str,
+    headers: dict[str, str],
+    timeout: float,
+) -> _Response:
+    request = Request(url, headers=headers)
+    netloc = urllib.parse.urlsplit(url).netloc
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            _update_rate_limit(netloc, response.headers)
+            return _response(
+                response.status,
+                _read_response(response),
+                response.headers,
+            )
+    except HTTPError as exc:
+        _update_rate_limit(netloc, exc.headers)
+        if exc.code == NOT_MODIFIED_STATUS:
+            return _response(exc.code, "", exc.headers)
+        if exc.code in RATE_LIMITED_STATUSES and rate_limit_delay(netloc):
+            raise _rate_limit_error(netloc) from exc
+        if exc.code in RETRYABLE_STATUSES:
+            raise _RetryableError(str(exc)) from exc
+        raise ProjectConfigHTTPError(
+            f"Impossible to fetch '{url}': {exc}",
+        ) from exc
+    except (URLError, ContentTooShortError) as exc:
+        raise _RetryableError(str(exc)) from exc
+
+
+def _request(
+    url: str,
+    headers: dict[str, str],
+    timeout: float,
+) -> _Response:
+    """Perform a request following redirections.
+
+    Raises:
+        _RetryableError: The request can be retried.
+        ProjectConfigHTTPError: The request can't be retried.
+    """
+    headers = {"Accept-Encoding": "gzip", **headers}
+    for _ in range(MAX_REDIRECTIONS + 1):
+        url_parts = urllib.parse.urlsplit(url)
+        if url_parts.scheme not in ("http", "https"):
+            raise ProjectConfigHTTPError(
+                f"Impossible to fetch '{url}': unsupported scheme",
+            )
+        if rate_limit_delay(url_parts.netloc):
+            # don't waste requests that would be rejected
+            raise _rate_limit_error(url_parts.netloc)
+        if _is_proxied(url_parts):
+            return _request_through_proxy(url, headers, timeout)
+
+        try:
+            with pool.requests:
+                response, body = _send(url_parts, headers, timeout)
+        except (OSError, http.client.HTTPException) as exc:
+            raise _RetryableError(str(exc) or type(exc).__name__) from exc
+        _update_rate_limit(url_parts.netloc, response.headers)
+
+        if response.status in REDIRECTION_STATUSES:
+            location = response.getheader("Location")
+            if location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+        if (
+            response.status < http.HTTPStatus.MULTIPLE_CHOICES
+            or response.status == NOT_MODIFIED_STATUS
+        ):
+            return _response(response.status, body, response.headers)
+
+        if response.status in RATE_LIMITED_STATUSES and rate_limit_delay(
+            url_parts.netloc,
+        ):
+            raise _rate_limit_error(url_parts.netloc)
+        reason = f"HTTP Error {response.status}: {response.reason}"
+        if response.status in RETRYABLE_STATUSES:
+            raise _RetryableError(reason, _retry_after(response))
+        raise ProjectConfigHTTPError(f"Impossible to fetch '{url}': {reason}")
+
+    raise ProjectConfigHTTPError(
+        f"Impossible to fetch '{url}': too many redirections",
+    )
+
+
+def backoff_delay(attempt: int, base: float) -> float:
+    """Time to wait before retrying a failed request.
+
+    The delay grows exponentially with the number of attempts and it
+    is randomized (full jitter), so clients that failed at the same
+    time don't retry at the same time.
+
+    Args:
+        attempt (int): Number of failed attempts, starting at 0.
+        base (float): Delay for the first attempt.
+
+    Returns:
+        float: Seconds to wait.
+    """
+    return random.uniform(0, min(MAX_BACKOFF, base * 2**attempt))  # noqa: S311
+
+
 def _GET_impl(
     url: str,
     timeout: float | None = None,
     sleep: float = 1.0,
     headers: dict[str, str] | None = None,
-) -> str:
-    start = time.time()
+) -> _Response:
     timeout = timeout or float(
         os.environ.get("PROJECT_CONFIG_REQUESTS_TIMEOUT", 10),
     )
-    end = start + timeout
+    end = time.time() + timeout
     err = None
-    request = Request(url)
-    if headers:
-        for key, value in headers.items():
-            request.add_header(key, value)
-    while time.time() < end:
+    attempt = 0
+    while True:
+        remaining = end - time.time()
+        if remaining <= 0:
+            break
         try:
-            with urlopen(request) as req:
-                response = req.read().decode("utf-8")
-        except (
-            URLError,
-            HTTPError,
-            ContentTooShortError,
-        ) as exc:
-            err = exc.__str__()
-            time.sleep(sleep)
-        else:
-            return response  # type: ignore
+            return _request(url, headers or {}, remaining)
+        except _RetryableError as exc:
+            err = str(exc)
+            delay = (
+                exc.retry_after
+                if exc.retry_after is not None
+                else backoff_delay(attempt, sleep)
+            )
+            if delay > end - time.time():
+                # will not be able to retry before the timeout
+                break
+            time.sleep(delay)
+            attempt += 1
 
     error_reason = "" if not err else f" Possibly caused by: {err}"
     raise ProjectConfigTimeoutError(
@@ -56,6 +432,52 @@ def _GET_impl(
     )
 
 
+def _validation_headers(validators: HTTPValidators) -> dict[str, str]:
+    headers = {}
+    if validators["etag"]:
+        headers["If-None-Match"] = validators["etag"]
+    if validators["last_modified"]:
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _GET_and_revalidate(
+    url: str,
+    headers: dict[str, str] | None = None,
+    **kwargs: Any,
+) -> str:
+    """Download a resource revalidating its last response if cached.
+
+    The validators of the responses are stored in the cache, which
+    retains the expired responses while their validators live, so when
+    a response expires a conditional request is sent. If the resource
+    has not been modified, the server responds with a ``304`` without
+    content and the expired response is used again.
+    """
+    validators_key = f"hv://{url}"
+    validators: HTTPValidators | None = Cache.get(validators_key)
+    body: str | None = None
+    if validators is not None:
+        # the tree stores the serializations of the response along it
+        cached = Cache.get(url, expired=True)
+        body = cached.get("_plain") if isinstance(cached, dict) else cached
+        if body is not None:
+            headers = {**(headers or {}), **_validation_headers(validators)}
+
+    response = _GET_impl(url, headers=headers, **kwargs)
+    if response.status == NOT_MODIFIED_STATUS and body is not None:
+        return body
+    if response.etag or response.last_modified:
+        Cache.set(
+            validators_key,
+            {
+                "etag": response.etag,
+                "last_modified": response.last_modified,
+            },
+        )
+    return response.body
+
+
 def GET(
     url: str,
     use_cache: bool = True,  # noqa: FBT001, FBT002
@@ -63,18 +485,33 @@ def GET(
 ) -> Any:
     """Perform an HTTP/s GET request and return the result.
 
+    In frozen mode, the response is served from the lock file of the
+    project without performing the request.
+
+    When the cached response has expired, it is revalidated with the
+    ``ETag`` and ``Last-Modified`` headers of the previous response,
+    if any, so resources that have not been modified are not
+    downloaded again.
+
     Args:
         url (str): URL to which the request will be targeted.
         use_cache (bool): Specify if the cache must be used
             requesting the resource.
-        **kwargs: Keyword arguments ``timeout`` and ``sleep``
-            passed to the internal wrapper GET function.
+        **kwargs: Keyword arguments ``timeout``, ``sleep`` and
+            ``headers`` passed to the internal wrapper GET function.
+            ``sleep`` is the base delay of the exponential backoff
+            between attempts.
     """
+    if is_frozen():
+        return frozen_response(url)
+
     if use_cache:
         result = Cache.get(url)  # this could return Any
         if result is None:
-            result = _GET_impl(url, **kwargs)
+            result = _GET_and_revalidate(url, **kwargs)
             Cache.set(url, result)
     else:
-        result = _GET_impl(url, **kwargs)
+        result = _GET_impl(url, **kwargs).body
+    if isinstance(result, str):
+        record_response(url, result)
     return result
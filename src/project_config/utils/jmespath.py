@@ -3,18 +3,19 @@
 from __future__ import annotations
 
 import builtins
+import copy
+import dataclasses
 import glob
 import json
 import operator
 import os
-import pickle
 import pprint
 import re
 import shlex
 import shutil
 import sys
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any
 
 import deepmerge
@@ -37,12 +38,16 @@ from jmespath.parser import (
 
 from project_config import tree
 from project_config.cache import Cache
-from project_config.compat import removeprefix, removesuffix
+from project_config.compat import (
+    cached_function,
+    removeprefix,
+    removesuffix,
+)
 from project_config.exceptions import ProjectConfigException
 
 
 if TYPE_CHECKING:
-    pass
+    from project_config.compat import TypeAlias
 
 
 class JMESPathError(ProjectConfigException):
@@ -115,11 +120,11 @@ JMESPATH_READABLE_ERRORS = {
     "UnknownFunctionError": "unknown function error",
 }
 
-# JMESPath variables that can not be cached in evaluations
-# as are not deterministic
-UNCACHEABLE_JMESPATH_VARIABLES = {
-    "rootdir",  # rootdir_name()
-    "listdir",  # ...
+# JMESPath functions whose results don't depend only on their arguments,
+# so the evaluations of expressions calling them can't be cached
+IMPURE_JMESPATH_FUNCTIONS = {
+    "rootdir_name",
+    "listdir",
     "isfile",
     "isdir",
     "exists",
@@ -127,13 +132,17 @@ UNCACHEABLE_JMESPATH_VARIABLES = {
     "rmdir",
     "glob",
     "getenv",
-    # other useful
-    "dirname",
-    "basename",
-    "extname",
+    "setenv",
+    "gh_tags",
+    # deprecated functions must warn in each evaluation
+    "regex_matchall",
 }
 
 
+# JMESPath functions that modify the environment or the file system
+SIDE_EFFECTS_JMESPATH_FUNCTIONS = {"mkdir", "rmdir", "setenv"}
+
+
 def _create_simple_transform_function_for_string(
     func_name: str,
 ) -> Callable[[type, str], str]:
@@ -489,8 +498,8 @@ class JMESPathProjectConfigFunctions(JMESPathFunctions):
                 *strategies[1:],
             )
 
-        merger.merge(base, nxt)
-        return base
+        # instances could be shared by the cache, so merge over a copy
+        return merger.merge(copy.deepcopy(base), nxt)
 
     @jmespath_func_signature({"types": ["object"]}, {"types": ["object"]})
     def _func_update(
@@ -498,8 +507,7 @@ class JMESPathProjectConfigFunctions(JMESPathFunctions):
         base: dict[str, Any],
         nxt: dict[str, Any],
     ) -> dict[str, Any]:
-        base.update(nxt)
-        return base
+        return {**base, **nxt}
 
     @jmespath_func_signature(
         {"types": ["array"]},
@@ -512,8 +520,9 @@ class JMESPathProjectConfigFunctions(JMESPathFunctions):
         index: int,
         item: Any,
     ) -> list[Any]:
-        base.insert(index, item)
-        return base
+        result = list(base)
+        result.insert(index, item)
+        return result
 
     @jmespath_func_signature(
         {"types": ["object"]},
@@ -526,8 +535,7 @@ class JMESPathProjectConfigFunctions(JMESPathFunctions):
         key: str,
         value: Any,
     ) -> dict[str, Any]:
-        base[key] = value
-        return base
+        return {**base, key: value}
 
     @jmespath_func_signature(
         {"types": ["object"]},
@@ -538,9 +546,7 @@ class JMESPathProjectConfigFunctions(JMESPathFunctions):
         base: dict[str, Any],
         key: str,
     ) -> dict[str, Any]:
-        if key in base:
-            del base[key]
-        return base
+        return {k: v for k, v in base.items() if k != key}
 
     @jmespath_func_signature(
         {"types": ["string"]},
@@ -750,6 +756,178 @@ def compile_JMESPath_expression(expression: str) -> JMESPathParsedResult:
     return compiled_expression
 
 
+# Key of the paths of JMESPath analyses that matches any key or index
+ANY_JMESPATH_KEY = None
+
+if TYPE_CHECKING:
+    JMESPathPath: TypeAlias = tuple[str | int | None, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class JMESPathAnalysis:
+    """Result of the static analysis of a JMESPath expression."""
+
+    #: Paths of the subtrees of the instance that the expression can
+    #: read or ``None`` if it can read the whole instance. The keys
+    #: :py:data:`ANY_JMESPATH_KEY` of the paths match any key or index.
+    paths: frozenset[JMESPathPath] | None
+    #: Names of the functions called by the expression.
+    functions: frozenset[str]
+
+    @property
+    def impure(self) -> bool:
+        """Whether the expression calls impure functions."""
+        return not self.functions.isdisjoint(IMPURE_JMESPATH_FUNCTIONS)
+
+    @property
+    def top_level_keys(self) -> set[str] | None:
+        """Top level keys of the instance that the expression can read.
+
+        ``None`` if the expression can read the whole instance or index
+        its root.
+        """
+        if self.paths is None:
+            return None
+        keys = set()
+        for path in self.paths:
+            if not isinstance(path[0], str):
+                return None
+            keys.add(path[0])
+        return keys
+
+
+class _JMESPathAnalyzer:
+    """Walks a JMESPath AST tracking the paths of the instance read.
+
+    Each node is analyzed with the path of its current node in the
+    instance and returns the path of its result or ``None`` if the
+    result is computed, in which case the paths of all the values used
+    to compute it have been recorded as read.
+    """
+
+    def __init__(self) -> None:
+        self.paths: set[JMESPathPath] = set()
+        self.whole_instance = False
+        self.functions: set[str] = set()
+
+    def read(self, path: JMESPathPath | None) -> None:
+        if path is None:
+            return
+        if not path:
+            self.whole_instance = True
+        else:
+            self.paths.add(path)
+
+    def read_children(
+        self,
+        children: list[Mapping[str, Any]],
+        path: JMESPathPath | None,
+    ) -> None:
+        for child in children:
+            self.read(self.visit(child, path))
+
+    def visit(  # noqa: PLR0911, PLR0912
+        self,
+        node: Mapping[str, Any],
+        path: JMESPathPath | None,
+    ) -> JMESPathPath | None:
+        node_type = node["type"]
+        children = node["children"]
+
+        if node_type == "field":
+            return None if path is None else (*path, node["value"])
+        if node_type in ("current", "identity"):
+            return path
+        if node_type == "literal":
+            return None
+        if node_type == "expref":
+            # expression references are evaluated against the values
+            # passed to the functions, which are read completely
+            self.read_children(children, None)
+            return None
+        if node_type == "index":
+            return None if path is None else (*path, node["value"])
+        if node_type == "slice":
+            # slices are projected, so their elements are read after
+            return path
+        if node_type in ("subexpression", "index_expression", "pipe"):
+            # each child is evaluated against the result of the previous
+            for child in children:
+                path = self.visit(child, path)
+            return path
+        if node_type in ("projection", "value_projection", "filter_projection"):
+            left = self.visit(children[0], path)
+            elements = None if left is None else (*left, ANY_JMESPATH_KEY)
+            if node_type == "filter_projection":
+                self.read(self.visit(children[2], elements))
+            self.read(self.visit(children[1], elements))
+            return None
+        if node_type == "function_expression":
+            self.functions.add(node["value"])
+            self.read_children(children, path)
+            return None
+        if node_type in (
+            "flatten",
+            "comparator",
+            "and_expression",
+            "or_expression",
+            "not_expression",
+            "multi_select_list",
+            "multi_select_dict",
+            "key_val_pair",
+        ):
+            self.read_children(children, path)
+            return None
+
+        # unknown nodes could read anything
+        self.whole_instance = True
+        return None
+
+
+@cached_function
+def analyze_JMESPath_expression(expression: str) -> JMESPathAnalysis:
+    """Analyze statically a JMESPath expression.
+
+    The analysis is conservative: the expression can read less paths
+    than the returned, but never more.
+
+    Args:
+        expression (str): JMESPath expression to analyze.
+
+    Returns:
+        :py:class:`JMESPathAnalysis`: Paths of the instance that the
+            expression can read and functions called by it.
+
+    Raises:
+        ``jmespath.exceptions.JMESPathError``: If the expression can't
+            be parsed.
+    """
+    analyzer = _JMESPathAnalyzer()
+    analyzer.read(analyzer.visit(Parser().parse(expression).parsed, ()))
+    return JMESPathAnalysis(
+        paths=None if analyzer.whole_instance else frozenset(analyzer.paths),
+        functions=frozenset(analyzer.functions),
+    )
+
+
+def jmespath_top_level_keys(
+    compiled_expression: JMESPathParsedResult,
+) -> set[str] | None:
+    """Get the top level keys of an instance read by a JMESPath expression.
+
+    Args:
+        compiled_expression (:py:class:`jmespath.parser.ParsedResult`):
+            JMESPath expression to analyze.
+
+    Returns:
+        set: Top level keys that the expression can read or ``None`` if
+            it can read the whole instance, like ``@`` or ``*``.
+    """
+    return analyze_JMESPath_expression(
+        compiled_expression.expression,
+    ).top_level_keys
+
+
 def compile_JMESPath_expression_or_error(
     expression: str,
 ) -> JMESPathParsedResult:
@@ -849,9 +1027,33 @@ def compile_JMESPath_or_expected_value_from_other_file_error(
         ) from None
 
 
+def _search_JMESPath(
+    compiled_expression: JMESPathParsedResult,
+    instance: Any,
+) -> Any:
+    try:
+        return compiled_expression.search(
+            instance,
+            options=jmespath_options,
+        )
+    except OriginalJMESPathError as exc:
+        formatted_expression = pprint.pformat(
+            compiled_expression.expression,
+        )
+        error_type = JMESPATH_READABLE_ERRORS.get(
+            exc.__class__.__name__,
+            "error",
+        )
+        raise JMESPathError(
+            f"Invalid JMESPath {formatted_expression}."
+            f" Raised JMESPath {error_type}: {str(exc)}",
+        ) from None
+
+
 def evaluate_JMESPath(
     compiled_expression: JMESPathParsedResult,
     instance: Any,
+    instance_key: str | None = None,
 ) -> Any:
     """Evaluate a JMESPath expression against a instance.
 
@@ -859,6 +1061,11 @@ def evaluate_JMESPath(
         compiled_expression (:py:class:`jmespath.parser.ParsedResult`): JMESPath
             expression to evaluate.
         instance (any): Instance to evaluate the expression against.
+        instance_key (str, optional): Stable key that identifies the
+            content of the instance, like the one returned by
+            :py:func:`project_config.tree.cached_local_file_key`. If
+            passed, the result of the evaluation is cached by expression
+            and instance key.
 
     Returns:
         any: Result of the evaluation.
@@ -866,64 +1073,31 @@ def evaluate_JMESPath(
     Raises:
         ``JMESPathError``: If the expression cannot be evaluated.
     """
-    # This caching is a bit tricky, because some things as if a
-    # directory exists can not be cached, can change.
-    #
-    # Also, Python modules can't be pickled, so we can't cache them.
-    #
-    # TODO: This needs to be properly tested, currently a cache
-    #       inconsistency is affecting the example 008.
-    is_cacheable_expression = True
-    for uncacheable_variable in UNCACHEABLE_JMESPATH_VARIABLES:
-        if uncacheable_variable in compiled_expression.expression:
-            is_cacheable_expression = False
-            break
-    if is_cacheable_expression is False:
+    # Some functions, like the ones that query the file system, are not
+    # deterministic, so expressions using them can't be cached.
+    if analyze_JMESPath_expression(compiled_expression.expression).impure:
         return compiled_expression.search(
             instance,
             options=jmespath_options,
         )
 
-    try:
-        pickled_instance = pickle.dumps(instance)
-    except TypeError:
-        return compiled_expression.search(
-            instance,
-            options=jmespath_options,
-        )
+    if instance_key is None:
+        return _search_JMESPath(compiled_expression, instance)
 
-    result = Cache.get(
-        f"jm://E?{compiled_expression.expression}:{hash(pickled_instance)}",
-    )
-    if result is None:
-        try:
-            result = compiled_expression.search(
-                instance,
-                options=jmespath_options,
-            )
-        except OriginalJMESPathError as exc:
-            formatted_expression = pprint.pformat(
-                compiled_expression.expression,
-            )
-            error_type = JMESPATH_READABLE_ERRORS.get(
-                exc.__class__.__name__,
-                "error",
-            )
-            raise JMESPathError(
-                f"Invalid JMESPath {formatted_expression}."
-                f" Raised JMESPath {error_type}: {str(exc)}",
-            ) from None
-        Cache.set(
-            f"jm://E?{compiled_expression.expression}:{str(instance)}",
-            result,
-        )
-    return result
+    cache_key = f"jm://E?{instance_key}:{compiled_expression.expression}"
+    # results are wrapped in a tuple to cache ``None`` results too
+    cached_result = Cache.get(cache_key)
+    if cached_result is None:
+        cached_result = (_search_JMESPath(compiled_expression, instance),)
+        Cache.set(cache_key, cached_result)
+    return cached_result[0]
 
 
 def evaluate_JMESPath_or_expected_value_error(
     compiled_expression: JMESPathParsedResult,
     expected_value: Any,
     instance: Any,
+    instance_key: str | None = None,
 ) -> Any:
     """Evaluate a JMESPath expression against a instance or raise a ``JMESPathError``.
 
@@ -935,6 +1109,8 @@ def evaluate_JMESPath_or_expected_value_error(
             expression to evaluate.
         expected_value (any): Value that was expected to match against expression.
         instance (any): Instance to evaluate the expression against.
+        instance_key (str, optional): Stable key that identifies the
+            content of the instance to cache the evaluation.
 
     Returns:
         any: Result of the evaluation.
@@ -944,7 +1120,7 @@ def evaluate_JMESPath_or_expected_value_error(
             expression cannot be evaluated.
     """  # noqa: E501
     try:
-        return evaluate_JMESPath(compiled_expression, instance)
+        return evaluate_JMESPath(compiled_expression, instance, instance_key)
     except OriginalJMESPathError as exc:
         formatted_expression = pprint.pformat(compiled_expression.expression)
         error_type = JMESPATH_READABLE_ERRORS.get(
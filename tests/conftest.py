@@ -8,6 +8,8 @@ import pytest
 from contextlib_chdir import chdir as chdir_ctx
 
 from project_config.__main__ import parse_args
+from project_config.fetchers import _fetchers_entry_points, get_fetcher
+from project_config.plugins import _plugins_entry_points
 from project_config.tests.pytest_plugin.helpers import (
     create_files as _create_files,
     create_tree as _create_tree,
@@ -30,6 +32,19 @@ from testing_helpers import (  # noqa: E402
 DEFAULT_ARGPARSE_NAMESPACE = parse_args(["check"])
 
 
+@pytest.fixture(autouse=True)
+def _clear_plugins_entry_points():
+    # tests patch entry points to inject plugins
+    _plugins_entry_points.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_fetchers_registry():
+    # tests patch entry points to inject fetchers
+    _fetchers_entry_points.cache_clear()
+    get_fetcher.cache_clear()
+
+
 @pytest.fixture
 def chdir():
     return chdir_ctx
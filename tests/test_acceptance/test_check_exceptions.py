@@ -92,7 +92,7 @@ def test_check_invalid_breakage_types(
     )
 
     style = {
-        "plugins": ["invalid-no-staticmethod"],
+        "plugins": ["invalid-breakage-type-yielder"],
         "rules": [{"files": [".project-config.toml"], method_name: "foo"}],
     }
     style_file = tmp_path / "style.json"
@@ -153,6 +153,33 @@ def test_examples(
     )
 
 
+@pytest.mark.parametrize(
+    ("example_dir", "expected_exitcode", "expected_stderr", "fixable"),
+    _collect_examples(),
+)
+def test_examples_parallel_check(
+    example_dir,
+    expected_exitcode,
+    expected_stderr,
+    fixable,
+    capsys,
+):
+    if (
+        os.path.basename(example_dir).startswith(
+            "_005-conditional-files-existence-fails",
+        )
+        and "win" in sys.platform
+    ):
+        pytest.skip("This example is not supported on Windows")
+    exitcode = run(
+        ["--nocolor", "--rootdir", example_dir, "--jobs", "4", "check"],
+    )
+    out, err = capsys.readouterr()
+    assert exitcode == expected_exitcode, err
+    assert err == expected_stderr
+    assert out == ""
+
+
 @mark_end2end
 @pytest.mark.parametrize("interface", ("CLI", "API"))
 @pytest.mark.parametrize(
@@ -0,0 +1,390 @@
+import datetime
+import multiprocessing
+import os
+import sqlite3
+import sys
+
+import pytest
+
+from project_config.cache import (
+    CACHE_DB_FILENAME,
+    CACHE_SCHEMA_VERSION,
+    Cache,
+    CacheStore,
+    MemoryCacheTier,
+    decode_cache_value,
+    encode_cache_value,
+    namespace_from_tree_entry,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CacheStore(str(tmp_path / "cache"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def cache(store, monkeypatch):
+    monkeypatch.setattr(Cache, "_store", store)
+    monkeypatch.setattr(Cache, "_memory", MemoryCacheTier(maxsize=2))
+    monkeypatch.setattr(Cache, "_expiration_time", 30)
+    monkeypatch.setattr(Cache, "_namespaces_expiration_times", {})
+    monkeypatch.setattr(Cache, "_max_size", None)
+    monkeypatch.setattr(Cache, "hits", {"memory": 0, "disk": 0})
+    monkeypatch.setattr(Cache, "misses", {"memory": 0, "disk": 0})
+    monkeypatch.setattr(Cache, "_stats", {})
+    return Cache
+
+
+def test_store_single_file(store):
+    for i in range(10):
+        store.set(f"key-{i}", "remote", 0, "pickle", b"value")
+
+    assert os.listdir(store.dirpath)[0].startswith(CACHE_DB_FILENAME)
+    assert not [
+        fname
+        for fname in os.listdir(store.dirpath)
+        if not fname.startswith(CACHE_DB_FILENAME)
+    ]
+
+
+def test_store_get_set_delete(store):
+    assert store.get("foo") is None
+
+    store.set("foo", "remote", 5, "pickle", b"bar")
+    assert store.get("foo") == (5, "pickle", b"bar")
+
+    store.set("foo", "remote", 6, "pickle", b"baz")
+    assert store.get("foo") == (6, "pickle", b"baz")
+
+    store.delete("foo")
+    assert store.get("foo") is None
+
+
+def test_store_reopens_after_close(store):
+    store.set("foo", "remote", 5, "pickle", b"bar")
+    store.close()
+    assert store.get("foo") == (5, "pickle", b"bar")
+
+
+def test_cache_get_set(cache):
+    assert cache.get("foo") is None
+    cache.set("foo", {"bar": ["baz"]})
+    assert cache.get("foo") == {"bar": ["baz"]}
+
+    # living entries are updated
+    cache.set("foo", {"bar": ["qux"]})
+    assert cache.get("foo") == {"bar": ["qux"]}
+
+
+def test_cache_expired_entries_are_removed(cache, store):
+    cache.set("foo", "bar")
+    key = cache.generate_unique_key_from_tree_entry("foo")
+    cache._memory.clear()
+    store.set(key, "remote", 0, *store.get(key)[1:])
+
+    assert cache.get("foo") is None
+    assert store.get(key) is None
+
+
+def test_memory_tier_lru():
+    memory = MemoryCacheTier(maxsize=2)
+    memory.set("foo", 0, 1)
+    memory.set("bar", 0, 2)
+    assert memory.get("foo") == (0, 1)
+
+    memory.set("baz", 0, 3)
+    assert memory.get("bar") is None
+    assert memory.get("foo") == (0, 1)
+    assert memory.get("baz") == (0, 3)
+
+
+def test_cache_memory_tier_counters(cache):
+    value = {"bar": ["baz"]}
+    cache.set("foo", value)
+
+    # served by the memory tier without unpickling
+    assert cache.get("foo") is value
+    assert cache.hits == {"memory": 1, "disk": 0}
+
+    # served by the disk tier, then promoted to memory
+    cache._memory.clear()
+    assert cache.get("foo") == value
+    assert cache.get("foo") == value
+    assert cache.hits == {"memory": 2, "disk": 1}
+    assert cache.misses == {"memory": 1, "disk": 0}
+
+    assert cache.get("bar") is None
+    assert cache.misses == {"memory": 2, "disk": 1}
+
+
+def test_store_discards_other_schema_versions(store):
+    store.set("foo", "remote", 5, "pickle", b"bar")
+    store.connection.execute(
+        f"PRAGMA user_version = {CACHE_SCHEMA_VERSION - 1}",
+    )
+    store.close()
+    assert store.get("foo") is None
+
+
+@pytest.mark.parametrize(
+    ("tree_entry", "expected_namespace"),
+    (
+        ("jm://E?foo:bar", "jmespath-evaluation"),
+        ("jm://foo", "jmespath"),
+        ("fp:///home/foo/package.json", "fingerprint"),
+        ("ic:///home/foo#3", "incremental"),
+        ("rr://e3b0c44298fc1c149afbf4c8996fb924", "rule-result"),
+        ("hv://https://example.com/style.json", "http-validation"),
+        ("gh://mondeja/project-config-styles/python/base.json5", "remote"),
+        ("https://example.com/style.json", "remote"),
+        ("e3b0c44298fc1c149afbf4c8996fb924", "local-file"),
+    ),
+)
+def test_namespace_from_tree_entry(tree_entry, expected_namespace):
+    assert namespace_from_tree_entry(tree_entry) == expected_namespace
+
+
+def test_cache_namespaces_expiration_times(cache, store):
+    cache.set_namespaces_expiration_times({"jmespath": 1000})
+    cache.set("jm://foo", "bar")
+    cache.set("https://example.com/style.json", "baz")
+    cache._memory.clear()
+    for tree_entry in ("jm://foo", "https://example.com/style.json"):
+        key = cache.generate_unique_key_from_tree_entry(tree_entry)
+        created, codec, value = store.get(key)
+        namespace = namespace_from_tree_entry(tree_entry)
+        store.set(key, namespace, created - 100, codec, value)
+
+    assert cache.get("jm://foo") == "bar"
+    assert cache.get("https://example.com/style.json") is None
+
+
+@pytest.mark.parametrize(
+    ("expiration_times", "retained"),
+    (
+        pytest.param({"http-validation": 1000}, True, id="validated"),
+        pytest.param({}, False, id="global-expiration"),
+    ),
+)
+def test_cache_retains_expired_remote_entries(
+    cache,
+    store,
+    expiration_times,
+    retained,
+):
+    cache.set_namespaces_expiration_times(expiration_times)
+    cache.set("https://example.com/style.json", "foo")
+    key = cache.generate_unique_key_from_tree_entry(
+        "https://example.com/style.json",
+    )
+    created, codec, value = store.get(key)
+    store.set(key, "remote", created - 100, codec, value)
+    cache._memory.clear()
+
+    assert cache.prune() == (0 if retained else 1)
+    assert cache.get("https://example.com/style.json") is None
+    assert cache.get("https://example.com/style.json", expired=True) == (
+        "foo" if retained else None
+    )
+
+
+def test_cache_prune_stale_entries(cache, store):
+    cache.set("https://example.com/style.json", "foo")
+    cache.set("https://example.com/other-style.json", "bar")
+    key = cache.generate_unique_key_from_tree_entry(
+        "https://example.com/style.json",
+    )
+    store.set(key, "remote", 0, *store.get(key)[1:])
+
+    assert cache.prune(vacuum=True) == 1
+    assert store.get(key) is None
+    assert cache.get("https://example.com/other-style.json") == "bar"
+    assert store.get_meta("last_prune") is not None
+
+
+def test_cache_prune_overweight_entries(cache, store):
+    for i in range(5):
+        cache.set(f"https://example.com/style-{i}.json", "x" * 100)
+        key = cache.generate_unique_key_from_tree_entry(
+            f"https://example.com/style-{i}.json",
+        )
+        store.touch(key, i)
+
+    cache.set_max_size(store.size() - 1)
+    assert cache.prune() == 1
+    assert cache.get("https://example.com/style-0.json") is None
+    assert cache.get("https://example.com/style-1.json") == "x" * 100
+
+
+def test_cache_prune_if_due(cache, store, mocker):
+    prune_spy = mocker.spy(cache, "prune")
+    cache.prune_if_due()
+    cache.prune_if_due()
+    assert prune_spy.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_codec"),
+    (
+        ({"foo": ["bar", 1, 2.5, None, True]}, "marshal"),
+        ("foo", "marshal"),
+        (datetime.date(2022, 1, 1), "pickle"),
+        ({"foo": datetime.date(2022, 1, 1)}, "pickle"),
+    ),
+)
+def test_cache_codecs(value, expected_codec):
+    codec_name, encoded_value = encode_cache_value(value)
+    assert codec_name == expected_codec
+    assert decode_cache_value(codec_name, encoded_value) == value
+
+
+def test_cache_unknown_codec():
+    with pytest.raises(ValueError, match="Unknown cache codec 'foo'"):
+        decode_cache_value("foo", b"")
+
+
+def test_cache_get_set_pickle_fallback(cache, store):
+    cache.set("foo", datetime.date(2022, 1, 1))
+    cache._memory.clear()
+    key = cache.generate_unique_key_from_tree_entry("foo")
+    assert store.get(key)[1] == "pickle"
+    assert cache.get("foo") == datetime.date(2022, 1, 1)
+
+
+def test_store_recovers_corrupted_database(tmp_path):
+    dirpath = tmp_path / "cache"
+    dirpath.mkdir()
+    (dirpath / CACHE_DB_FILENAME).write_bytes(b"not a database" * 100)
+
+    store = CacheStore(str(dirpath))
+    assert store.get("foo") is None
+    store.set("foo", "remote", 5, "pickle", b"bar")
+    assert store.get("foo") == (5, "pickle", b"bar")
+    store.close()
+
+
+def test_cache_recovers_corrupted_database(cache, store):
+    cache.set("foo", "bar")
+    cache._memory.clear()
+    store.close()
+    with open(store.path, "r+b") as f:
+        f.write(b"\0" * 4096)
+
+    assert cache.get("foo") is None
+    cache.set("foo", "baz")
+    cache._memory.clear()
+    assert cache.get("foo") == "baz"
+
+
+def test_cache_deletes_corrupted_entries(cache, store):
+    cache.set("foo", {"bar": "baz"})
+    cache._memory.clear()
+    key = cache.generate_unique_key_from_tree_entry("foo")
+    created, codec, value = store.get(key)
+    store.set(key, "remote", created, codec, value[: len(value) // 2])
+
+    assert cache.get("foo") is None
+    assert store.get(key) is None
+
+
+def test_cache_busy_database_is_not_an_error(cache, store, monkeypatch):
+    monkeypatch.setattr(store, "timeout", 0.05)
+    store.close()
+    cache.set("foo", "bar")
+    cache._memory.clear()
+
+    locker = sqlite3.connect(store.path, isolation_level=None)
+    locker.execute("BEGIN EXCLUSIVE")
+    try:
+        assert cache.get("foo") is None
+        cache.set("baz", "qux")
+        cache.prune_if_due()
+    finally:
+        locker.execute("ROLLBACK")
+        locker.close()
+    cache._memory.clear()
+    assert cache.get("foo") == "bar"
+
+
+def _set_entries_in_store(dirpath, worker):
+    store = CacheStore(dirpath)
+    for i in range(50):
+        store.set(f"{worker}-{i}", "remote", 0, "pickle", b"x" * 100)
+    store.close()
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="fork start method is not available on Windows",
+)
+def test_store_concurrent_writers(store):
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(
+            target=_set_entries_in_store,
+            args=(store.dirpath, worker),
+        )
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    for worker in range(4):
+        for i in range(50):
+            assert store.get(f"{worker}-{i}") == (0, "pickle", b"x" * 100)
+
+
+def test_cache_recovers_malformed_database(cache, store, mocker):
+    mocker.patch.object(
+        store,
+        "get",
+        side_effect=sqlite3.DatabaseError("database disk image is malformed"),
+    )
+    recover_spy = mocker.spy(store, "recover")
+
+    assert cache.get("foo") is None
+    assert recover_spy.call_count == 1
+
+
+def test_cache_stats(cache, store):
+    cache.set("jm://foo", "bar")
+    cache._memory.clear()
+    assert cache.get("jm://foo") == "bar"
+    assert cache.get("jm://foo") == "bar"
+    assert cache.get("https://example.com/style.json") is None
+
+    stats = cache.get_stats()
+    assert cache._stats == {}
+    assert stats["jmespath"]["hits"] == 2
+    assert stats["jmespath"]["misses"] == 0
+    assert stats["jmespath"]["bytes_written"] > 0
+    assert stats["jmespath"]["bytes_read"] == (
+        stats["jmespath"]["bytes_written"]
+    )
+    assert stats["jmespath"]["decode_time"] > 0
+    assert stats["jmespath"]["entries"] == 1
+    assert stats["jmespath"]["size"] == store.size()
+    assert stats["remote"]["misses"] == 1
+
+    # statistics are accumulated between flushes
+    cache.get("https://example.com/style.json")
+    assert cache.get_stats()["remote"]["misses"] == 2
+
+
+def test_cache_stats_evictions(cache, store):
+    cache.set("https://example.com/style.json", "foo")
+    key = cache.generate_unique_key_from_tree_entry(
+        "https://example.com/style.json",
+    )
+    store.set(key, "remote", 0, *store.get(key)[1:])
+    cache.prune()
+
+    stats = cache.get_stats()
+    assert stats["remote"]["evictions"] == 1
+    assert stats["remote"]["entries"] == 0
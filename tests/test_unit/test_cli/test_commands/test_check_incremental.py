@@ -0,0 +1,101 @@
+from project_config.__main__ import run
+from project_config.commands.check import ProjectConfigChecker
+
+
+STYLE = """{rules: [
+  {files: ["foo.json"], JMESPathsMatch: [["a", 1]]},
+  {files: ["bar.json"], JMESPathsMatch: [["a", 1]]},
+  {files: ["baz.json"]},
+]}"""
+
+EXPECTED_STDERR = """bar.json
+  - (FIXABLE) JMESPath 'a' does not match. Expected 1, returned 0 rules[1].JMESPathsMatch[0]
+baz.json
+  - (FIXABLE) Expected existing file does not exists rules[2].files[0]
+"""  # noqa: E501
+
+
+def _create_project(tmp_path):
+    (tmp_path / ".project-config.toml").write_text(
+        'style = "style.json5"\ncache_expirations = { incremental = "1 day" }',
+    )
+    (tmp_path / "style.json5").write_text(STYLE)
+    (tmp_path / "foo.json").write_text('{"a": 1}')
+    (tmp_path / "bar.json").write_text('{"a": 0}')
+
+
+def test_check_incremental(chdir, tmp_path, capsys, mocker):
+    _create_project(tmp_path)
+    run_rule_spy = mocker.spy(ProjectConfigChecker, "_run_rule")
+
+    with chdir(tmp_path):
+        assert run(["check", "--no-color", "--incremental"]) == 1
+        assert run_rule_spy.call_count == 3
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert err == EXPECTED_STDERR
+
+        # errors of unchanged rules are reported again
+        assert run(["check", "--no-color", "--incremental"]) == 1
+        assert run_rule_spy.call_count == 3
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert err == EXPECTED_STDERR
+
+        # only rules whose inputs have changed are executed
+        (tmp_path / "bar.json").write_text('{"a": 1}')
+        (tmp_path / "baz.json").write_text("{}")
+        assert run(["check", "--no-color", "--incremental"]) == 0
+        assert run_rule_spy.call_count == 5
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert err == ""
+
+
+def test_check_incremental_changed_files(chdir, tmp_path, capsys, mocker):
+    _create_project(tmp_path)
+    run_rule_spy = mocker.spy(ProjectConfigChecker, "_run_rule")
+
+    with chdir(tmp_path):
+        assert run(["check", "--no-color", "--incremental"]) == 1
+        assert run_rule_spy.call_count == 3
+        capsys.readouterr()
+
+        (tmp_path / "bar.json").write_text('{"a": 1}')
+        assert run(["check", "--no-color", "--files", "foo.json"]) == 1
+        assert run_rule_spy.call_count == 4
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert err == EXPECTED_STDERR
+
+        assert run(["check", "--no-color", "--files", "bar.json"]) == 1
+        assert run_rule_spy.call_count == 5
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert "bar.json" not in err
+
+
+def test_check_incremental_changed_files_with_rootdir(
+    chdir,
+    tmp_path,
+    capsys,
+    mocker,
+):
+    rootdir = tmp_path / "project"
+    rootdir.mkdir()
+    _create_project(rootdir)
+    run_rule_spy = mocker.spy(ProjectConfigChecker, "_run_rule")
+
+    with chdir(tmp_path):
+        argv = ["check", "--no-color", "--rootdir", "project"]
+        assert run([*argv, "--incremental"]) == 1
+        assert run_rule_spy.call_count == 3
+        capsys.readouterr()
+
+        # changed files are relative to the working directory
+        (rootdir / "bar.json").write_text('{"a": 1}')
+        assert run([*argv, "--files", "project/bar.json"]) == 1
+        assert run_rule_spy.call_count == 4
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert "bar.json" not in err
@@ -0,0 +1,74 @@
+from project_config import tree
+from project_config.__main__ import run
+
+
+def _count_reads(spy, fpath):
+    return sum(call.args[0] == fpath for call in spy.call_args_list)
+
+
+def _create_project(tmp_path):
+    (tmp_path / ".project-config.toml").write_text('style = "style.json5"')
+    (tmp_path / "style.json5").write_text(
+        '{rules: [{files: ["foo.json"], JMESPathsMatch: [["a", 1]]}]}',
+    )
+    # results are shared by identical rules and files, so make them unique
+    (tmp_path / "foo.json").write_text(f'{{"a": 0, "id": "{tmp_path.name}"}}')
+
+
+def test_check_results_cache(chdir, tmp_path, capsys, mocker):
+    _create_project(tmp_path)
+    expected_stderr = (
+        "foo.json\n  - (FIXABLE) JMESPath 'a' does not match. Expected 1,"
+        " returned 0 rules[0].JMESPathsMatch[0]\n"
+    )
+    cached_local_file_spy = mocker.spy(tree, "cached_local_file")
+
+    with chdir(tmp_path):
+        assert run(["check", "--no-color"]) == 1
+        assert _count_reads(cached_local_file_spy, "foo.json") == 1
+        assert capsys.readouterr().err == expected_stderr
+
+        # results of the action are reported from the cache
+        assert run(["check", "--no-color"]) == 1
+        assert _count_reads(cached_local_file_spy, "foo.json") == 1
+        assert capsys.readouterr().err == expected_stderr
+
+        # the action is executed again when its files change
+        (tmp_path / "foo.json").write_text(
+            f'{{"a": 1, "id": "{tmp_path.name}"}}',
+        )
+        assert run(["check", "--no-color"]) == 0
+        assert _count_reads(cached_local_file_spy, "foo.json") == 2
+        assert capsys.readouterr().err == ""
+
+
+def test_fix_results_are_not_cached(chdir, tmp_path, capsys, mocker):
+    _create_project(tmp_path)
+    cached_local_file_spy = mocker.spy(tree, "cached_local_file")
+
+    with chdir(tmp_path):
+        assert run(["check", "--no-color"]) == 1
+        reads = _count_reads(cached_local_file_spy, "foo.json")
+        assert run(["fix", "--no-color"]) == 1
+        assert _count_reads(cached_local_file_spy, "foo.json") > reads
+        assert "(FIXED)" in capsys.readouterr().err
+
+        assert run(["check", "--no-color"]) == 0
+
+
+def test_check_results_cache_by_files_order(chdir, tmp_path, capsys):
+    (tmp_path / ".project-config.toml").write_text('style = "style.json5"')
+    for fname in ("a.json", "b.json"):
+        (tmp_path / fname).write_text(f'{{"a": 0, "id": "{tmp_path.name}"}}')
+
+    def _check(files):
+        (tmp_path / "style.json5").write_text(
+            f"{{rules: [{{files: {files}, JMESPathsMatch: [['a', 1]]}}]}}",
+        )
+        assert run(["check", "--no-color"]) == 1
+        err = capsys.readouterr().err
+        return [line for line in err.splitlines() if line.endswith(".json")]
+
+    with chdir(tmp_path):
+        assert _check('["a.json", "b.json"]') == ["a.json", "b.json"]
+        assert _check('["b.json", "a.json"]') == ["b.json", "a.json"]
@@ -1,4 +1,5 @@
 import os
+import re
 import shutil
 import sys
 
@@ -27,3 +28,14 @@ def test_clean_cache(capsys, tmp_path):
 
     if os.path.exists(CACHE_DIR):
         shutil.copytree(temp_cache_dir, CACHE_DIR)
+
+
+def test_clean_cache_prune(capsys, tmp_path, chdir):
+    with chdir(tmp_path):
+        assert run(["clean", "cache", "--prune"]) == 0
+    out, err = capsys.readouterr()
+    assert re.match(
+        r"^Cache pruned successfully! \d+ entries evicted\.\n$",
+        out,
+    )
+    assert err == ""
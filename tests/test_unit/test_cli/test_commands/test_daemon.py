@@ -0,0 +1,149 @@
+"""Tests for 'project-config daemon' command."""
+
+import json
+import os
+import socket
+import sys
+import threading
+
+import pytest
+
+from project_config import daemon as daemon_module
+from project_config.__main__ import run
+from project_config.daemon import DaemonError, serve, stop_daemon
+
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Unix sockets are required",
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    socket_path = str(tmp_path / "daemon.sock")
+    monkeypatch.setenv("PROJECT_CONFIG_DAEMON_SOCKET", socket_path)
+    return socket_path
+
+
+@pytest.fixture
+def daemon(socket_path):
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=serve,
+        args=(socket_path,),
+        kwargs={"on_ready": ready.set},
+        daemon=True,
+    )
+    thread.start()
+    assert ready.wait(10)
+    yield thread
+    stop_daemon(socket_path)
+    thread.join(10)
+
+
+@pytest.fixture
+def project(tmp_path, chdir):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / ".project-config.toml").write_text('style = "style.json"')
+    (project_dir / "style.json").write_text(
+        '{"rules": [{"files": ["package.json"],'
+        ' "JMESPathsMatch": [["name", "bar"]]}]}',
+    )
+    (project_dir / "package.json").write_text('{"name": "foo"}')
+    with chdir(project_dir):
+        yield project_dir
+
+
+def test_daemon_check(daemon, project, capsys, mocker):
+    assert run(["check", "--no-color"]) == 1
+    expected_out, expected_err = capsys.readouterr()
+    assert "does not match" in expected_err
+
+    spy = mocker.spy(sys.modules["project_config.daemon"], "execute_request")
+    assert run(["check", "--no-color", "--daemon"]) == 1
+    assert capsys.readouterr() == (expected_out, expected_err)
+    assert spy.call_count == 1
+    assert spy.call_args[0][0]["cwd"] == str(project)
+    assert "--daemon" not in spy.call_args[0][0]["argv"]
+
+
+def test_daemon_fix(daemon, project, capsys):
+    assert run(["fix", "--daemon"]) == 1
+    capsys.readouterr()
+    assert (project / "package.json").read_text() == '{\n  "name": "bar"\n}\n'
+    assert run(["check", "--daemon"]) == 0
+
+
+def test_daemon_not_listening_runs_locally(socket_path, project, capsys):
+    assert not os.path.exists(socket_path)
+    assert run(["check", "--no-color", "--daemon"]) == 1
+    assert "does not match" in capsys.readouterr().err
+
+
+def test_daemon_already_listening(daemon, socket_path):
+    with pytest.raises(DaemonError, match="already listening"):
+        serve(socket_path)
+
+
+def test_daemon_stop(daemon, socket_path, capsys):
+    assert run(["daemon", "--stop"]) == 0
+    assert capsys.readouterr().out == "Daemon stopped successfully!\n"
+    daemon.join(10)
+    assert not daemon.is_alive()
+    assert not os.path.exists(socket_path)
+
+    assert run(["daemon", "--stop"]) == 0
+    assert capsys.readouterr().out == (
+        f"No daemon is listening at '{socket_path}'\n"
+    )
+
+
+@pytest.mark.parametrize(
+    ("data", "expected_message"),
+    (
+        pytest.param(b"{", "Expecting property name", id="json"),
+        pytest.param(b"[]", "the request must be an object", id="array"),
+        pytest.param(b'{"argv": []}', "missing 'cwd'", id="missing-key"),
+    ),
+)
+def test_daemon_invalid_request(
+    daemon,
+    socket_path,
+    project,
+    capsys,
+    data,
+    expected_message,
+):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(data)
+        client.shutdown(socket.SHUT_WR)
+        response = json.loads(daemon_module._recv_all(client))
+    assert response["exit_code"] == 1
+    assert "Invalid request to the daemon" in response["stderr"]
+    assert expected_message in response["stderr"]
+
+    # the daemon keeps serving
+    assert run(["check", "--no-color", "--daemon"]) == 1
+    assert "does not match" in capsys.readouterr().err
+
+
+def test_daemon_client_not_sending_request(
+    daemon,
+    socket_path,
+    project,
+    capsys,
+    mocker,
+    monkeypatch,
+):
+    monkeypatch.setattr(daemon_module, "DAEMON_REQUEST_TIMEOUT", 0.1)
+    spy = mocker.spy(daemon_module, "execute_request")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(b'{"stop": ')
+
+        assert run(["check", "--no-color", "--daemon"]) == 1
+        assert "does not match" in capsys.readouterr().err
+    assert spy.call_count == 1
@@ -0,0 +1,72 @@
+import pytest
+
+from project_config.__main__ import run
+
+
+RULES = """{rules: [
+  {files: ["foo.json"], JMESPathsMatch: [["a", 1]]},
+  {files: ["foo.json"], JMESPathsMatch: [["b", 2]]},
+  {files: ["missing.json"]},
+  {files: ["foo.json"], JMESPathsMatch: [["c", 3]]},
+]}"""
+
+
+@pytest.mark.parametrize("jobs", ("1", "4"))
+def test_jobs_report_errors_in_rules_order(jobs, chdir, tmp_path, capsys):
+    (tmp_path / ".project-config.toml").write_text('style = "style.json5"')
+    (tmp_path / "style.json5").write_text(RULES)
+    (tmp_path / "foo.json").write_text('{"a": 0, "b": 0, "c": 0}')
+
+    with chdir(tmp_path):
+        assert run(["check", "--no-color", "--jobs", jobs]) == 1
+
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err == (
+        "foo.json\n"
+        "  - (FIXABLE) JMESPath 'a' does not match. Expected 1, returned 0"
+        " rules[0].JMESPathsMatch[0]\n"
+        "  - (FIXABLE) JMESPath 'b' does not match. Expected 2, returned 0"
+        " rules[1].JMESPathsMatch[0]\n"
+        "  - (FIXABLE) JMESPath 'c' does not match. Expected 3, returned 0"
+        " rules[3].JMESPathsMatch[0]\n"
+        "missing.json\n"
+        "  - (FIXABLE) Expected existing file does not exists"
+        " rules[2].files[0]\n"
+    )
+
+
+def test_jobs_interrupt_check(chdir, tmp_path, capsys):
+    (tmp_path / ".project-config.toml").write_text('style = "style.json5"')
+    (tmp_path / "style.json5").write_text(
+        '{rules: [{files: ["foo.json"], JMESPathsMatch: [["a", 1]]},'
+        ' {files: ["foo.json"], JMESPathsMatch: [["foo(", 1]]},'
+        ' {files: ["foo.json"], JMESPathsMatch: [["b", 2]]}]}',
+    )
+    (tmp_path / "foo.json").write_text('{"a": 0, "b": 0}')
+
+    with chdir(tmp_path):
+        assert run(["check", "--no-color", "-j", "2"]) == 1
+
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert "rules[0].JMESPathsMatch[0]" in err
+    assert "rules[1].JMESPathsMatch[0]" in err
+    assert "rules[2]" not in err
+
+
+def test_jobs_config(chdir, tmp_path, capsys):
+    (tmp_path / ".project-config.toml").write_text(
+        'style = "style.json5"\n\n[cli]\njobs = 4\n',
+    )
+    (tmp_path / "style.json5").write_text(RULES)
+    (tmp_path / "foo.json").write_text('{"a": 1, "b": 2, "c": 3}')
+    (tmp_path / "missing.json").write_text("{}")
+
+    with chdir(tmp_path):
+        assert run(["show", "config"]) == 0
+        assert run(["check"]) == 0
+
+    out, err = capsys.readouterr()
+    assert "'jobs': 4" in out
+    assert err == ""
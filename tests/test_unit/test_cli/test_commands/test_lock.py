@@ -0,0 +1,115 @@
+import contextlib
+import http.server
+import threading
+
+from project_config.__main__ import run
+from project_config.lock import LOCK_FILENAME, read_lock_file
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        body = b'{"rules": [{"files": ["foo.txt"]}]}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@contextlib.contextmanager
+def _serving():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_lock_and_check_frozen(tmp_path, chdir, capsys):
+    (tmp_path / ".project-config.toml").write_text('style = "style.json5"\n')
+    (tmp_path / "foo.txt").write_text("foo\n")
+
+    with _serving() as server_url, chdir(tmp_path):
+        url = f"{server_url}/{tmp_path.name}/style.json"
+        (tmp_path / "style.json5").write_text(f'{{extends: ["{url}"]}}')
+        assert run(["lock"]) == 0
+    out, err = capsys.readouterr()
+    assert "1 resources locked" in out
+    assert err == ""
+    assert list(read_lock_file(str(tmp_path / LOCK_FILENAME))) == [url]
+
+    # the server is not listening anymore
+    with chdir(tmp_path):
+        assert run(["check", "--frozen"]) == 0
+
+    (tmp_path / "foo.txt").unlink()
+    with chdir(tmp_path):
+        assert run(["check", "--frozen"]) == 1
+    out, err = capsys.readouterr()
+    assert "foo.txt" in err
+
+
+def test_check_frozen_without_lock_file(tmp_path, chdir, capsys):
+    (tmp_path / ".project-config.toml").write_text('style = "style.json5"\n')
+    (tmp_path / "style.json5").write_text('{rules: [{files: ["foo.txt"]}]}')
+
+    with chdir(tmp_path):
+        assert run(["check", "--frozen"]) == 1
+    out, err = capsys.readouterr()
+    assert "execute 'project-config lock' to create it" in err
+
+
+def test_check_frozen_resource_not_locked(tmp_path, chdir, capsys):
+    (tmp_path / ".project-config.toml").write_text('style = "style.json5"\n')
+    (tmp_path / "style.json5").write_text('{rules: [{files: ["foo.txt"]}]}')
+    (tmp_path / "foo.txt").write_text("foo\n")
+    with chdir(tmp_path):
+        assert run(["lock"]) == 0
+        assert run(["check", "--frozen"]) == 0
+
+        (tmp_path / "style.json5").write_text(
+            '{extends: ["https://example.com/style.json"]}',
+        )
+        assert run(["check", "--frozen"]) == 1
+    out, err = capsys.readouterr()
+    assert "'https://example.com/style.json' is not in the lock file" in err
+
+
+def test_lock_rule_with_false_conditional(tmp_path, chdir, capsys):
+    (tmp_path / ".project-config.toml").write_text('style = "style.json5"\n')
+    (tmp_path / "foo.json").write_text('{"name": "foo.txt"}')
+
+    with _serving() as server_url, chdir(tmp_path):
+        url = f"{server_url}/{tmp_path.name}/data.json"
+        (tmp_path / "style.json5").write_text(
+            f"""{{rules: [{{
+                files: ["foo.json"],
+                ifFilesExist: ["bar.txt"],
+                crossJMESPathsMatch: [
+                    [
+                        "name",
+                        ["{url}", "rules[0].files[0]"],
+                        "[0] == [1]",
+                        true,
+                    ],
+                ],
+            }}]}}""",
+        )
+        # the conditional is false, but the rule reads the remote file
+        assert run(["lock"]) == 0
+    assert list(read_lock_file(str(tmp_path / LOCK_FILENAME))) == [url]
+
+    (tmp_path / "bar.txt").write_text("bar\n")
+    with chdir(tmp_path):
+        assert run(["check", "--frozen"]) == 0
+
+        (tmp_path / "foo.json").write_text('{"name": "bar.txt"}')
+        assert run(["check", "--frozen"]) == 1
+    out, err = capsys.readouterr()
+    assert "is not in the lock file" not in err
+    assert "crossJMESPathsMatch" in err
@@ -1,8 +1,12 @@
 """Tests for 'project-config show cache' command."""
 
+import json
+
 from project_config.__main__ import run
 from project_config.cache import (
     CACHE_DIR as EXPECTED_CACHE_DIR,
+    CACHE_NAMESPACES,
+    CACHE_STATS_FIELDS,
     generate_possible_cache_dirs,
 )
 
@@ -17,3 +21,17 @@ def test_show_cache(capsys):
     cache_dir = out.rstrip("\r\n")
     assert cache_dir == EXPECTED_CACHE_DIR
     assert cache_dir in possible_cache_dirs
+
+
+def test_show_cache_stats(capsys):
+    assert run(["show", "cache", "--stats"]) == 0
+    out, err = capsys.readouterr()
+    assert err == ""
+
+    stats = json.loads(out)
+    for namespace in CACHE_NAMESPACES:
+        assert set(stats[namespace]) == {
+            *CACHE_STATS_FIELDS,
+            "entries",
+            "size",
+        }
@@ -1,3 +1,5 @@
+import json
+
 from project_config.__main__ import run
 
 
@@ -36,3 +38,19 @@ def test_show_style(capsys, tmp_path, chdir):
 """
     )
     assert err == ""
+
+
+def test_show_style_graph(capsys, tmp_path, chdir):
+    (tmp_path / ".project-config.toml").write_text('style = "foo.json5"\n')
+    (tmp_path / "foo.json5").write_text('{extends: ["bar.json5"]}')
+    (tmp_path / "bar.json5").write_text('{rules: [{files: ["bar.json5"]}]}')
+
+    with chdir(tmp_path):
+        assert run(["show", "style", "--graph"]) == 0
+    out, err = capsys.readouterr()
+    assert err == ""
+
+    graph = json.loads(out)
+    assert list(graph) == ["foo.json5", "bar.json5"]
+    assert graph["foo.json5"]["extends"] == ["bar.json5"]
+    assert graph["bar.json5"]["error"] is None
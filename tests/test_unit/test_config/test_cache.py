@@ -2,7 +2,11 @@ import re
 
 import pytest
 
-from project_config.config import CONFIG_CACHE_REGEX, _cache_string_to_seconds
+from project_config.config import (
+    CONFIG_CACHE_REGEX,
+    _cache_size_string_to_bytes,
+    _cache_string_to_seconds,
+)
 
 
 @pytest.mark.parametrize(
@@ -33,3 +37,17 @@ def test_cache_string_to_seconds(value, expected_result, maybe_raises):
         assert not re.match(CONFIG_CACHE_REGEX, value)
     else:
         assert re.match(CONFIG_CACHE_REGEX, value)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_result"),
+    (
+        ("512 B", 512),
+        ("512B", 512),
+        ("2 KB", 2048),
+        ("100 MB", 100 * 1024**2),
+        ("1 GB", 1024**3),
+    ),
+)
+def test_cache_size_string_to_bytes(value, expected_result):
+    assert _cache_size_string_to_bytes(value) == expected_result
@@ -0,0 +1,71 @@
+import pytest
+
+from project_config.config.style.graph import resolve_style_graph
+
+
+def test_resolve_style_graph(tmp_path, chdir):
+    (tmp_path / "a.json5").write_text('{extends: ["b.json5", "c.json5"]}')
+    (tmp_path / "b.json5").write_text('{extends: ["d.json5"]}')
+    (tmp_path / "c.json5").write_text('{extends: ["d.json5", "a.json5"]}')
+    (tmp_path / "d.json5").write_text('{extends: ["missing.json5", 1]}')
+
+    with chdir(tmp_path):
+        graph = resolve_style_graph(["a.json5"], str(tmp_path))
+
+    assert list(graph) == [
+        "a.json5",
+        "b.json5",
+        "c.json5",
+        "d.json5",
+        "missing.json5",
+    ]
+    assert graph["a.json5"]["extends"] == ["b.json5", "c.json5"]
+    assert graph["c.json5"]["extends"] == ["d.json5", "a.json5"]
+    assert graph["d.json5"]["extends"] == ["missing.json5"]
+    assert graph["a.json5"]["error"] is None
+    assert "missing.json5" in graph["missing.json5"]["error"]
+    for node in graph.values():
+        assert node["time"] >= 0
+
+
+def test_resolve_style_graph_remote_levels(mocker, tmp_path):
+    styles = {
+        "gh://foo/bar/a.json": '{"extends": ["b.json", "c.json"]}',
+        "gh://foo/bar/b.json": '{"extends": ["d.json"]}',
+        "gh://foo/bar/c.json": '{"extends": ["d.json"]}',
+        "gh://foo/bar/d.json": f'{{"rules": [], "id": "{tmp_path.name}"}}',
+    }
+    download = mocker.patch(
+        "project_config.tree.download_file_from_urlsplit_scheme",
+        side_effect=lambda url, *_args: styles[url],
+    )
+    mocker.patch("project_config.tree.Cache.get", return_value=None)
+    mocker.patch("project_config.tree.Cache.set")
+
+    graph = resolve_style_graph(["gh://foo/bar/a.json"], str(tmp_path))
+    assert list(graph) == list(styles)
+    assert download.call_count == len(styles)
+
+
+@pytest.mark.parametrize("max_workers", (1, 4))
+def test_resolve_style_graph_max_workers(tmp_path, chdir, max_workers):
+    (tmp_path / "a.json5").write_text("{rules: []}")
+    with chdir(tmp_path):
+        graph = resolve_style_graph(
+            ["a.json5", "a.json5"],
+            str(tmp_path),
+            max_workers=max_workers,
+        )
+    assert list(graph) == ["a.json5"]
+
+
+def test_resolve_local_style_graph_without_threads(tmp_path, chdir, mocker):
+    (tmp_path / "a.json5").write_text('{extends: ["b.json5"]}')
+    (tmp_path / "b.json5").write_text("{rules: []}")
+    executor = mocker.patch(
+        "project_config.config.style.graph.ThreadPoolExecutor",
+    )
+    with chdir(tmp_path):
+        graph = resolve_style_graph(["a.json5"], str(tmp_path))
+    assert list(graph) == ["a.json5", "b.json5"]
+    executor.assert_not_called()
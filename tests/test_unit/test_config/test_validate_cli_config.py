@@ -67,6 +67,26 @@ from project_config.config.exceptions import ProjectConfigInvalidConfigSchema
             [],
             id="valid-rootdir",
         ),
+        pytest.param(
+            {"jobs": "4"},
+            ["cli.jobs -> must be a positive integer"],
+            id="invalid-jobs-type",
+        ),
+        pytest.param(
+            {"jobs": True},
+            ["cli.jobs -> must be a positive integer"],
+            id="invalid-jobs-boolean",
+        ),
+        pytest.param(
+            {"jobs": 0},
+            ["cli.jobs -> must be a positive integer"],
+            id="invalid-jobs-zero",
+        ),
+        pytest.param(
+            {"jobs": 4},
+            [],
+            id="valid-jobs",
+        ),
     ),
 )
 def test_validate_cli_config_errors(config, expected_result):
@@ -3,6 +3,7 @@ import os
 import pytest
 
 from project_config.config import (
+    CONFIG_CACHE_MAX_SIZE_REGEX,
     CONFIG_CACHE_REGEX,
     validate_config,
     validate_config_cache,
@@ -70,6 +71,52 @@ VALIDATE_CONFIG_CACHE_CASES = (
         [f"cache -> must match the regex {CONFIG_CACHE_REGEX}"],
         id="invalid-regex",
     ),
+    pytest.param(
+        {"cache_expirations": {"remote": "1 day", "jmespath": "4 weeks"}},
+        [],
+        id="expirations",
+    ),
+    pytest.param(
+        {"cache_expirations": "1 day"},
+        ["cache_expirations -> must be of type object"],
+        id="expirations-string",
+    ),
+    pytest.param(
+        {"cache_expirations": {"foo": "1 day"}},
+        [
+            "cache_expirations.foo -> must be one of remote, jmespath,"
+            " jmespath-evaluation, local-file, fingerprint, incremental,"
+            " rule-result, http-validation",
+        ],
+        id="expirations-invalid-namespace",
+    ),
+    pytest.param(
+        {"cache_expirations": {"remote": 1}},
+        ["cache_expirations.remote -> must be of type string"],
+        id="expirations-int",
+    ),
+    pytest.param(
+        {"cache_expirations": {"remote": "1 century"}},
+        [
+            "cache_expirations.remote -> must match the regex"
+            f" {CONFIG_CACHE_REGEX}",
+        ],
+        id="expirations-invalid-regex",
+    ),
+    pytest.param({"cache_max_size": "100 MB"}, [], id="max-size"),
+    pytest.param(
+        {"cache_max_size": 100},
+        ["cache_max_size -> must be of type string"],
+        id="max-size-int",
+    ),
+    pytest.param(
+        {"cache_max_size": "100 TB"},
+        [
+            "cache_max_size -> must match the regex"
+            f" {CONFIG_CACHE_MAX_SIZE_REGEX}",
+        ],
+        id="max-size-invalid-regex",
+    ),
 )
 
 VALIDATE_CONFIG_CASES = []
@@ -137,7 +137,7 @@ from project_config.fetchers import FetchError, fetch
             None,
             (
                 "'foo.toml' can't be serialized as a valid object:"
-                " Unexpected end of file at line 1 col 10"
+                ' Expected "\'" (at end of document)'
             ),
             id=".toml (invalid object)",
         ),
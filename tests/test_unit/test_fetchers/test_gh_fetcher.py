@@ -1,8 +1,12 @@
+import json
 import urllib.parse
+import uuid
 
 import pytest
 
-from project_config.fetchers.github import fetch
+from project_config.cache import Cache
+from project_config.fetchers.github import fetch, get_latest_release_tags
+from project_config.utils.http import ProjectConfigHTTPError
 from testing_helpers import mark_end2end
 
 
@@ -22,3 +26,137 @@ from testing_helpers import mark_end2end
 )
 def test_fetch(url, expected_content):
     assert expected_content in fetch(urllib.parse.urlsplit(url))
+
+
+@pytest.fixture
+def github(mocker):
+    """Fake GitHub responses for a repository not cached yet."""
+    owner = uuid.uuid4().hex
+    tree = {
+        "tree": [
+            {"path": "README.md", "type": "blob"},
+            {"path": "styles", "type": "tree"},
+            {"path": "styles/base.json5", "type": "blob"},
+            {"path": "styles/python", "type": "tree"},
+            {"path": "styles/python/main.json5", "type": "blob"},
+        ],
+    }
+    api_url = f"https://api.github.com/repos/{owner}/styles"
+    responses = {}
+    for ref in ("v1.0.0", "main"):
+        raw_url = f"https://raw.githubusercontent.com/{owner}/styles/{ref}"
+        responses.update(
+            {
+                f"{api_url}/git/trees/{ref}?recursive=1": json.dumps(tree),
+                f"{raw_url}/README.md": "foo",
+                f"{raw_url}/styles/base.json5": "bar",
+                # added after the tree was listed
+                f"{raw_url}/new.json5": "baz",
+            },
+        )
+    return owner, mocker.patch(
+        "project_config.fetchers.github.GET",
+        side_effect=lambda url, **_kwargs: responses[url],
+    )
+
+
+def test_fetch_lists_repository_tree_once(github):
+    owner, GET = github
+
+    readme_url = f"gh://{owner}/styles@v1.0.0/README.md"
+    assert fetch(urllib.parse.urlsplit(readme_url)) == "foo"
+    style_url = f"gh://{owner}/styles@v1.0.0/styles/base.json5"
+    assert fetch(urllib.parse.urlsplit(style_url)) == "bar"
+
+    requested_urls = [call.args[0] for call in GET.call_args_list]
+    assert len(requested_urls) == 3
+    assert "/git/trees/v1.0.0" in requested_urls[0]
+    assert all(
+        url.startswith("https://raw.githubusercontent.com/")
+        for url in requested_urls[1:]
+    )
+
+
+def test_fetch_file_missing_in_tree(github):
+    owner, GET = github
+    url = f"gh://{owner}/styles@v1.0.0/new.json5"
+    assert fetch(urllib.parse.urlsplit(url)) == "baz"
+    assert GET.call_args.args[0] == (
+        f"https://raw.githubusercontent.com/{owner}/styles/v1.0.0/new.json5"
+    )
+
+
+@pytest.mark.parametrize(
+    ("ref", "cached"),
+    (
+        pytest.param("v1.0.0", True, id="tag"),
+        pytest.param("main", False, id="branch"),
+    ),
+)
+def test_fetch_caches_repository_tree_of_immutable_refs(
+    github,
+    mocker,
+    ref,
+    cached,
+):
+    owner, GET = github
+    tree_url = (
+        f"https://api.github.com/repos/{owner}/styles/git/trees/{ref}"
+        "?recursive=1"
+    )
+
+    def tree_requests():
+        return [call for call in GET.call_args_list if call.args[0] == tree_url]
+
+    readme_url = urllib.parse.urlsplit(f"gh://{owner}/styles@{ref}/README.md")
+    assert fetch(readme_url) == "foo"
+    assert fetch(readme_url) == "foo"
+    assert len(tree_requests()) == 1
+    assert tree_requests()[0].kwargs["use_cache"] is cached
+    assert (Cache.get(f"{tree_url}#paths") is not None) is cached
+
+    # trees of branches expire soon
+    mocker.patch("project_config.fetchers.github.MUTABLE_TREE_EXPIRATION", -1)
+    assert fetch(readme_url) == "foo"
+    assert len(tree_requests()) == (1 if cached else 2)
+
+
+def test_fetch_directory(github):
+    owner, _ = github
+    url = f"gh://{owner}/styles@v1.0.0/styles"
+    assert fetch(urllib.parse.urlsplit(url)) == [
+        {"name": "base.json5", "path": "styles/base.json5", "type": "file"},
+        {"name": "python", "path": "styles/python", "type": "dir"},
+    ]
+
+
+def test_fetch_without_repository_tree(mocker, tmp_path):
+    def GET(url, **_kwargs):
+        if "api.github.com" in url:
+            raise ProjectConfigHTTPError("HTTP Error 404: Not Found")
+        return url
+
+    mocker.patch("project_config.fetchers.github.GET", GET)
+    assert fetch(
+        urllib.parse.urlsplit(f"gh://{tmp_path.name}/styles/foo.json5"),
+    ) == (
+        f"https://raw.githubusercontent.com/{tmp_path.name}/styles/HEAD/foo.json5"
+    )
+
+
+@pytest.mark.parametrize("only_semver", (False, True))
+def test_get_latest_release_tags(mocker, only_semver):
+    pages = [
+        [{"name": f"v1.{i}.0"} for i in range(100)],
+        [{"name": "v2.0.0"}, {"name": "foo_bar"}, {"name": "latest"}],
+    ]
+
+    def GET(url, **_kwargs):
+        assert "per_page=100" in url
+        return json.dumps(pages[int(url.rsplit("=", 1)[1]) - 1])
+
+    mocker.patch("project_config.fetchers.github.GET", GET)
+    tags = get_latest_release_tags("foo", "bar", only_semver=only_semver)
+    assert tags[:3] == ["v2.0.0", "v1.99.0", "v1.98.0"]
+    assert tags[-1] == ("v1.0.0" if only_semver else "foo_bar")
+    assert "latest" not in tags
@@ -0,0 +1,103 @@
+import pytest
+
+from project_config.compat import importlib_metadata
+from project_config.fetchers import (
+    PROJECT_CONFIG_FETCHERS_ENTRYPOINTS_GROUP,
+    FetchError,
+    SchemeProtocolNotImplementedError,
+    fetch,
+    get_fetcher,
+)
+from project_config.fetchers.mirror import MIRROR_ENVVAR
+
+
+@pytest.mark.parametrize(
+    ("url", "mirror_path"),
+    (
+        pytest.param(
+            "gh://foo/bar@v1.0.0/styles/style.json",
+            "gh/foo/bar@v1.0.0/styles/style.json",
+            id="gh",
+        ),
+        pytest.param(
+            "https://example.com/styles/style.json",
+            "https/example.com/styles/style.json",
+            id="https",
+        ),
+        pytest.param(
+            "http://example.com/styles/style.json",
+            "https/example.com/styles/style.json",
+            id="http",
+        ),
+        pytest.param(
+            "mirror://https/example.com/styles/style.json",
+            "https/example.com/styles/style.json",
+            id="mirror",
+        ),
+    ),
+)
+def test_fetch_from_mirror_directory(tmp_path, monkeypatch, url, mirror_path):
+    fpath = tmp_path.joinpath(*mirror_path.split("/"))
+    fpath.parent.mkdir(parents=True)
+    fpath.write_text('{"rules": []}')
+    monkeypatch.setenv(MIRROR_ENVVAR, str(tmp_path))
+
+    assert fetch(url) == {"rules": []}
+
+
+def test_fetch_not_mirrored_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(MIRROR_ENVVAR, str(tmp_path))
+
+    url = "gh://foo/bar/style.json"
+    with pytest.raises(FetchError, match=f"'{url}' file not found"):
+        fetch(url)
+
+
+def test_fetch_from_mirror_without_location(monkeypatch):
+    monkeypatch.delenv(MIRROR_ENVVAR, raising=False)
+
+    with pytest.raises(FetchError, match="file not found"):
+        fetch("mirror://gh/foo/bar/style.json")
+
+
+def test_fetcher_registered_by_entry_point(mocker):
+    fetcher_entry_point = importlib_metadata.EntryPoint(
+        "fake",
+        "project_config.fetchers.file",
+        PROJECT_CONFIG_FETCHERS_ENTRYPOINTS_GROUP,
+    )
+    mocker.patch(
+        f"{importlib_metadata.__name__}.entry_points",
+        return_value=[fetcher_entry_point],
+    )
+
+    from project_config.fetchers import file
+
+    assert get_fetcher("fake") is file
+    # built-in fetchers are always available
+    assert get_fetcher("https").__name__ == "project_config.fetchers.https"
+    with pytest.raises(SchemeProtocolNotImplementedError):
+        get_fetcher("foobar")
+
+
+@pytest.mark.parametrize("builtin_first", (True, False))
+def test_fetcher_entry_point_replaces_builtin_fetcher(mocker, builtin_first):
+    builtin_entry_point = importlib_metadata.EntryPoint(
+        "https",
+        "project_config.fetchers.https",
+        PROJECT_CONFIG_FETCHERS_ENTRYPOINTS_GROUP,
+    )
+    third_party_entry_point = importlib_metadata.EntryPoint(
+        "https",
+        "project_config.utils.http",
+        PROJECT_CONFIG_FETCHERS_ENTRYPOINTS_GROUP,
+    )
+    entry_points = [builtin_entry_point, third_party_entry_point]
+    mocker.patch(
+        f"{importlib_metadata.__name__}.entry_points",
+        return_value=entry_points if builtin_first else entry_points[::-1],
+    )
+
+    from project_config.utils import http
+
+    assert get_fetcher("https") is http
@@ -0,0 +1,134 @@
+import os
+
+import pytest
+
+from project_config.incremental import (
+    create_rule_record,
+    rule_is_recordable,
+    rule_paths,
+    rule_record_is_valid,
+    rule_record_key,
+)
+
+
+def test_rule_record_key():
+    rule = {"files": ["foo.json"], "JMESPathsMatch": [["foo", 1]]}
+    key = rule_record_key("/project", 0, rule)
+    assert key.startswith("ic:///project#")
+    assert key == rule_record_key("/project", 0, dict(rule))
+    assert key != rule_record_key("/project", 1, rule)
+    assert key != rule_record_key("/other-project", 0, rule)
+    assert key != rule_record_key(
+        "/project",
+        0,
+        {"files": ["foo.json"], "JMESPathsMatch": [["foo", 2]]},
+    )
+
+
+@pytest.mark.parametrize(
+    ("rule", "expected_result"),
+    (
+        pytest.param(
+            {"files": ["foo.json"], "JMESPathsMatch": [["foo", 1]]},
+            True,
+            id="recordable",
+        ),
+        pytest.param(
+            {"files": ["foo.json"], "JMESPathsMatch": [["getenv('FOO')", 1]]},
+            False,
+            id="environment",
+        ),
+        pytest.param(
+            {"files": ["foo.json"], "JMESPathsMatch": [["glob('*')", []]]},
+            False,
+            id="file-system",
+        ),
+        pytest.param(
+            {"files": ["foo.json"], "JMESPathsMatch": [["isdir.glob", 1]]},
+            True,
+            id="keys-named-as-functions",
+        ),
+        pytest.param(
+            {
+                "files": ["foo.json"],
+                "JMESPathsMatch": [["length(foo[?isfile(@)])", 1]],
+            },
+            False,
+            id="nested-call",
+        ),
+    ),
+)
+def test_rule_is_recordable(rule, expected_result):
+    assert rule_is_recordable(rule) is expected_result
+
+
+def test_rule_paths():
+    assert rule_paths(
+        {
+            "files": ["foo.json"],
+            "ifIncludeLines": {"bar.txt": ["baz\n", ""]},
+            "JMESPathsMatch": [["foo", 1]],
+        },
+    ) == {
+        "files",
+        "foo.json",
+        "ifIncludeLines",
+        "bar.txt",
+        "JMESPathsMatch",
+        "foo",
+    }
+
+
+def test_rule_record_is_valid(tmp_path, chdir):
+    (tmp_path / "foo.json").write_text("{}")
+    (tmp_path / "directory").mkdir()
+
+    with chdir(tmp_path):
+        record = create_rule_record(
+            ["foo.json", "directory", "missing.json"],
+            [],
+            [],
+            interrupted=False,
+        )
+        assert record["files"]["directory"] == "directory"
+        assert record["files"]["missing.json"] is None
+        assert rule_record_is_valid(record)
+
+        (tmp_path / "missing.json").write_text("{}")
+        assert not rule_record_is_valid(record)
+        os.remove(tmp_path / "missing.json")
+        assert rule_record_is_valid(record)
+
+        (tmp_path / "foo.json").write_text('{"foo": 1}')
+        assert not rule_record_is_valid(record)
+
+
+@pytest.mark.parametrize(
+    ("changed_files", "expected_result"),
+    (
+        pytest.param([], True, id="no-changes"),
+        pytest.param(["bar.json"], True, id="other-file"),
+        pytest.param(["foo.json"], False, id="input"),
+        pytest.param(["directory/bar.json"], False, id="inside-directory"),
+        pytest.param(["missing.json"], False, id="created-input"),
+    ),
+)
+def test_rule_record_is_valid_changed_files(
+    changed_files,
+    expected_result,
+    tmp_path,
+    chdir,
+):
+    (tmp_path / "foo.json").write_text("{}")
+    (tmp_path / "directory").mkdir()
+
+    with chdir(tmp_path):
+        record = create_rule_record(
+            ["foo.json", "directory/", "missing.json"],
+            [],
+            [],
+            interrupted=False,
+        )
+        # contents are not checked when changed files are passed
+        (tmp_path / "foo.json").write_text('{"foo": 1}')
+        assert rule_record_is_valid(record, changed_files) is expected_result
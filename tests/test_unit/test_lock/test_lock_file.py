@@ -0,0 +1,91 @@
+import gzip
+import json
+
+import pytest
+
+from project_config.lock import (
+    ProjectConfigLockError,
+    freeze,
+    frozen_response,
+    is_frozen,
+    read_lock_file,
+    record_response,
+    record_responses,
+    write_lock_file,
+)
+
+
+def test_write_read_lock_file(tmp_path):
+    fpath = tmp_path / "project-config.lock"
+    resources = {
+        "https://example.com/b.json": '{"rules": []}',
+        "https://example.com/a.json": "foo",
+    }
+    write_lock_file(str(fpath), resources)
+    content = fpath.read_bytes()
+    assert read_lock_file(str(fpath)) == resources
+
+    # the content of the file only depends on the resources
+    write_lock_file(str(fpath), dict(reversed(resources.items())))
+    assert fpath.read_bytes() == content
+
+
+@pytest.mark.parametrize(
+    ("data", "expected_message"),
+    (
+        pytest.param(
+            None,
+            "not found, execute 'project-config lock' to create it",
+            id="not-found",
+        ),
+        pytest.param(b"foo", "is corrupted", id="not-gzip"),
+        pytest.param(
+            gzip.compress(b'{"version": 0, "resources": {}}'),
+            "has been created by an incompatible version",
+            id="version",
+        ),
+        pytest.param(
+            gzip.compress(
+                json.dumps(
+                    {
+                        "version": 1,
+                        "resources": {
+                            "https://example.com/a.json": {
+                                "sha256": "bar",
+                                "content": "foo",
+                            },
+                        },
+                    },
+                ).encode(),
+            ),
+            "the digest of 'https://example.com/a.json' doesn't match",
+            id="digest",
+        ),
+    ),
+)
+def test_read_invalid_lock_file(tmp_path, data, expected_message):
+    fpath = tmp_path / "project-config.lock"
+    if data is not None:
+        fpath.write_bytes(data)
+    with pytest.raises(ProjectConfigLockError, match=expected_message):
+        read_lock_file(str(fpath))
+
+
+def test_frozen_response():
+    freeze({"https://example.com/a.json": "foo"})
+    try:
+        assert is_frozen()
+        assert frozen_response("https://example.com/a.json") == "foo"
+        with pytest.raises(ProjectConfigLockError, match="is not in the"):
+            frozen_response("https://example.com/b.json")
+    finally:
+        freeze(None)
+    assert not is_frozen()
+
+
+def test_record_responses():
+    record_response("https://example.com/a.json", "foo")
+    with record_responses() as responses:
+        record_response("https://example.com/b.json", "bar")
+    record_response("https://example.com/c.json", "baz")
+    assert responses == {"https://example.com/b.json": "bar"}
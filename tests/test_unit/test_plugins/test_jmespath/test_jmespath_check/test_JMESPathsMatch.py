@@ -1,6 +1,7 @@
 import pytest
 
-from project_config import Error, InterruptingError
+from project_config import ActionsContext, Error, InterruptingError, tree
+from project_config.constants import PARALLEL_FILES_THRESHOLD
 from project_config.plugins.jmespath import JMESPathPlugin
 
 
@@ -229,3 +230,95 @@ def test_JMESPathsMatch(
         rule,
         expected_results,
     )
+
+
+def test_JMESPathsMatch_files_in_parallel(tmp_path, chdir, mocker):
+    mocker.patch("os.cpu_count", return_value=4)
+    files = []
+    for i in range(PARALLEL_FILES_THRESHOLD + 8):
+        fname = f"package-{i}.json"
+        (tmp_path / fname).write_text(f'{{"version": "{i % 3}"}}')
+        files.append(fname)
+
+    def value():
+        return [["version", "0"], ["type(version)", "string"]]
+
+    with chdir(tmp_path):
+        serial_results = list(
+            JMESPathPlugin.JMESPathsMatch(
+                value(),
+                {},
+                ActionsContext(fix=False, files=files),
+            ),
+        )
+        parallel_results = list(
+            JMESPathPlugin.JMESPathsMatch(
+                value(),
+                {},
+                ActionsContext(fix=False, files=files, jobs=4),
+            ),
+        )
+
+    assert len(serial_results) == len(files) * 2 // 3
+    assert parallel_results == serial_results
+
+
+def test_JMESPathsMatch_files_in_parallel_interrupted(
+    tmp_path,
+    chdir,
+    mocker,
+):
+    mocker.patch("os.cpu_count", return_value=4)
+    files = []
+    for i in range(PARALLEL_FILES_THRESHOLD):
+        fname = f"package-{i}.json"
+        (tmp_path / fname).write_text('{"version": "1"}')
+        files.append(fname)
+    (tmp_path / "directory").mkdir()
+    files.insert(2, "directory")
+
+    with chdir(tmp_path):
+        results = []
+        for result in JMESPathPlugin.JMESPathsMatch(
+            [["version", "0"]],
+            {},
+            ActionsContext(fix=False, files=files, jobs=4),
+        ):
+            results.append(result)
+            if result[0] == InterruptingError:
+                break
+
+    assert [breakage_type for breakage_type, _ in results] == [
+        Error,
+        Error,
+        InterruptingError,
+    ]
+    assert results[-1][1]["definition"] == ".files[2]"
+
+
+def test_JMESPathsMatch_big_files_parsed_partially(tmp_path, chdir, mocker):
+    mocker.patch(
+        "project_config.plugins.jmespath.PARTIAL_PARSING_MIN_SIZE",
+        0,
+    )
+    cached_local_file_keys = mocker.spy(tree, "cached_local_file_keys")
+    (tmp_path / "package.json").write_text(
+        '{"name": "foo", "version": "1.0.0", "dependencies": {"bar": "1"}}',
+    )
+
+    with chdir(tmp_path):
+        results = list(
+            JMESPathPlugin.JMESPathsMatch(
+                [["name", "foo"], ["version", "2.0.0"]],
+                {},
+                ActionsContext(fix=False, files=["package.json"]),
+            ),
+        )
+    assert len(results) == 1
+    assert results[0][1]["message"] == (
+        "JMESPath 'version' does not match. Expected '2.0.0', returned '1.0.0'"
+    )
+    cached_local_file_keys.assert_called_once_with(
+        "package.json",
+        {"name", "version"},
+    )
@@ -106,3 +106,29 @@ def test_invalid_plugin_function_type(mocker):
         ),
     ):
         plugins.get_function_for_action("bar")
+
+
+def test_builtin_plugin_names(mocker):
+    fake_plugin = importlib_metadata.EntryPoint(
+        "fake-plugin",
+        "testing_helpers:FakePlugin",
+        PROJECT_CONFIG_PLUGINS_ENTRYPOINTS_GROUP,
+    )
+    mocker.patch(
+        f"{importlib_metadata.__name__}.entry_points",
+        return_value=[
+            fake_plugin,
+            *importlib_metadata.entry_points(
+                group=PROJECT_CONFIG_PLUGINS_ENTRYPOINTS_GROUP,
+            ),
+        ],
+    )
+
+    plugins = Plugins()
+    plugins.prepare_3rd_party_plugin("fake-plugin")
+
+    assert "fake-plugin" in plugins.plugin_names
+    assert "fake-plugin" not in plugins.builtin_plugin_names
+    assert {"inclusion", "jmespath", "existence"} <= (
+        plugins.builtin_plugin_names
+    )
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from project_config.serializers.json import loads_keys
+
+
+@pytest.mark.parametrize(
+    ("string", "keys", "expected_result"),
+    (
+        pytest.param(
+            '{"name": "foo", "packages": {"a": ["[", "{"]}, "version": 3}',
+            {"name", "version"},
+            {"name": "foo", "version": 3},
+            id="scalars",
+        ),
+        pytest.param(
+            '{"name": "foo", "packages": {"a": ["[", "{"]}, "version": 3}',
+            {"packages", "unexistent"},
+            {"packages": {"a": ["[", "{"]}},
+            id="object",
+        ),
+        pytest.param(" { } ", {"name"}, {}, id="empty object"),
+        pytest.param("[1, 2]", {"name"}, [1, 2], id="array"),
+    ),
+)
+def test_loads_keys(string, keys, expected_result):
+    assert loads_keys(string, keys) == expected_result
+
+
+@pytest.mark.parametrize(
+    "string",
+    (
+        '{"name": "foo"',
+        '{"name" "foo"}',
+        '{"name": "foo",}',
+        '{"name": "foo"} []',
+        '{"name": [1, 2}',
+    ),
+)
+def test_loads_keys_invalid(string):
+    with pytest.raises(json.JSONDecodeError):
+        loads_keys(string, {"name"})
@@ -1,4 +1,7 @@
+import importlib
 import re
+import subprocess
+import sys
 
 import pytest
 
@@ -224,3 +227,28 @@ def test_guess_serializer_for_path(
     serializers, serializer_name = guess_serializer_for_path(path)
     assert serializers[0][0]["module"] == expected_loads
     assert serializers[1][0]["module"] == expected_dumps
+
+
+def test_serializer_functions_are_resolved_once(mocker):
+    serialize_for_url("foo.json", "{}")
+
+    import_module = mocker.spy(importlib, "import_module")
+    assert serialize_for_url("bar.json", '{"foo": 1}') == {"foo": 1}
+    import_module.assert_not_called()
+
+
+def test_serializers_import_backends_on_demand():
+    code = (
+        "import sys; import project_config.serializers;"
+        " print(','.join(sorted(set(sys.modules) & {MODULES})))"
+    ).replace(
+        "{MODULES}",
+        repr({"identify", "json5", "pyjson5", "ruamel", "tomlkit"}),
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,55 @@
+import datetime
+
+import pytest
+
+from project_config.serializers.toml import dumps, loads
+
+
+@pytest.mark.parametrize(
+    ("string", "expected_result"),
+    (
+        pytest.param("", {}, id="empty"),
+        pytest.param(
+            '[project]\nname = "foo"\nkeywords = ["a", "b"]\n',
+            {"project": {"name": "foo", "keywords": ["a", "b"]}},
+            id="basic",
+        ),
+        pytest.param(
+            '[[package]]\nname = "foo"\n\n[[package]]\nname = "bar"\n'
+            "dependencies = [{ name = 'baz' }]\n",
+            {
+                "package": [
+                    {"name": "foo"},
+                    {"name": "bar", "dependencies": [{"name": "baz"}]},
+                ],
+            },
+            id="array of tables",
+        ),
+        pytest.param(
+            "date = 1979-05-27",
+            {"date": datetime.date(1979, 5, 27)},
+            id="date",
+        ),
+    ),
+)
+def test_loads(string, expected_result):
+    result = loads(string)
+    assert result == expected_result
+    # plain Python objects are returned, not tomlkit items
+    assert type(result) is dict
+
+
+@pytest.mark.parametrize(
+    ("obj", "expected_result"),
+    (
+        pytest.param({}, "", id="empty"),
+        pytest.param(
+            {"project": {"name": "foo", "keywords": ["a", "b"]}},
+            '[project]\nname = "foo"\nkeywords = ["a", "b"]\n',
+            id="basic",
+        ),
+    ),
+)
+def test_dumps(obj, expected_result):
+    assert dumps(obj) == expected_result
+    assert loads(dumps(obj)) == obj
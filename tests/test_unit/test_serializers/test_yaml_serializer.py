@@ -0,0 +1,115 @@
+import threading
+
+import pytest
+
+from project_config.serializers.yaml import (
+    LIBYAML_ENVVAR,
+    dumps,
+    loads,
+    loads_keys,
+)
+
+
+WORKFLOW = """on:
+  push:
+    branches: [master]
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    timeout-minutes: 010
+    continue-on-error: off
+    steps:
+      - run: echo 1:20
+      - run: exit 0
+        if: true
+"""
+
+EXPECTED_WORKFLOW = {
+    "on": {"push": {"branches": ["master"]}},
+    "jobs": {
+        "test": {
+            "runs-on": "ubuntu-latest",
+            "timeout-minutes": 10,
+            "continue-on-error": "off",
+            "steps": [
+                {"run": "echo 1:20"},
+                {"run": "exit 0", "if": True},
+            ],
+        },
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "libyaml",
+    (pytest.param(False, id="ruamel.yaml"), pytest.param(True, id="libyaml")),
+)
+def test_loads_yaml_1_2(monkeypatch, libyaml):
+    if libyaml:
+        yaml = pytest.importorskip("yaml")
+        if not hasattr(yaml, "CSafeLoader"):
+            pytest.skip("PyYAML built without libyaml bindings")
+        monkeypatch.setenv(LIBYAML_ENVVAR, "true")
+    else:
+        monkeypatch.delenv(LIBYAML_ENVVAR, raising=False)
+
+    assert loads(WORKFLOW) == EXPECTED_WORKFLOW
+    assert loads("foo: 0o17\nbar: 0x1F") == {"foo": 15, "bar": 31}
+
+
+def test_yaml_instances_by_thread():
+    results = []
+
+    def load():
+        for _ in range(20):
+            results.append(loads(WORKFLOW))
+            results.append(loads(dumps(EXPECTED_WORKFLOW)))
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 160
+    assert all(result == EXPECTED_WORKFLOW for result in results)
+
+
+@pytest.mark.parametrize(
+    ("string", "keys", "expected_result"),
+    (
+        pytest.param(
+            WORKFLOW,
+            {"on"},
+            {"on": EXPECTED_WORKFLOW["on"]},
+            id="block mapping",
+        ),
+        pytest.param(
+            f"---\n# comment\n{WORKFLOW}",
+            {"jobs", "unexistent"},
+            {"jobs": EXPECTED_WORKFLOW["jobs"]},
+            id="explicit document start",
+        ),
+        pytest.param(
+            '"name": foo\ndescription: |\n  bar: baz\n',
+            {"name", "description"},
+            {"name": "foo", "description": "bar: baz\n"},
+            id="quoted key and block scalar",
+        ),
+        pytest.param(
+            "foo: &anchor 1\nbar: *anchor\n",
+            {"bar"},
+            {"bar": 1},
+            id="aliases",
+        ),
+        pytest.param(
+            "foo: [1,\n2]\nbar: 3\n",
+            {"foo"},
+            {"foo": [1, 2]},
+            id="flow collection without indentation",
+        ),
+        pytest.param("- 1\n- 2\n", {"foo"}, [1, 2], id="sequence"),
+    ),
+)
+def test_loads_keys(string, keys, expected_result):
+    assert loads_keys(string, keys) == expected_result
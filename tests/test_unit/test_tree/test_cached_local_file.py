@@ -0,0 +1,86 @@
+import pytest
+
+from project_config import tree
+from project_config.cache import Cache, CacheStore, MemoryCacheTier
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    store = CacheStore(str(tmp_path / "cache"))
+    monkeypatch.setattr(Cache, "_store", store)
+    monkeypatch.setattr(Cache, "_memory", MemoryCacheTier())
+    monkeypatch.setattr(Cache, "_expiration_time", 30)
+    yield
+    store.close()
+
+
+def test_identical_files_are_parsed_once(tmp_path, mocker):
+    content = '{"name": "foo"}'
+    for project in ("foo", "bar"):
+        (tmp_path / project).mkdir()
+        (tmp_path / project / "package.json").write_text(content)
+
+    serialize_spy = mocker.spy(tree, "serialize_for_url")
+    for project in ("foo", "bar"):
+        assert tree.cached_local_file(
+            str(tmp_path / project / "package.json"),
+        ) == {"name": "foo"}
+    assert serialize_spy.call_count == 1
+
+
+def test_serializations_are_separate_entries(tmp_path, mocker):
+    fpath = tmp_path / "package.json"
+    fpath.write_text('{"name": "foo"}')
+    tree.cache_file(str(fpath))
+    fhash = tree.local_file_digest(str(fpath))
+
+    set_spy = mocker.spy(Cache, "set")
+    assert tree.cached_local_file(str(fpath), serializer="text") == [
+        '{"name": "foo"}',
+    ]
+    set_spy.assert_called_once_with(
+        f"{fhash}?text",
+        ['{"name": "foo"}'],
+    )
+
+    assert Cache.get(fhash) == '{"name": "foo"}'
+    assert Cache.get(f"{fhash}?json") == {"name": "foo"}
+    assert tree.cached_local_file(str(fpath), serializer="_plain") == (
+        '{"name": "foo"}'
+    )
+
+
+def test_cached_local_file_key(tmp_path):
+    fpath = tmp_path / "package.json"
+    fpath.write_text('{"name": "foo"}')
+    fhash = tree.local_file_digest(str(fpath))
+
+    assert tree.cached_local_file_key(str(fpath)) == f"{fhash}?json"
+    assert tree.cached_local_file_key(f"{fpath}?text") == f"{fhash}?text"
+    assert tree.cached_local_file_key(str(fpath), serializer="py") is None
+
+    fpath.write_text('{"name": "bar"}')
+    assert tree.cached_local_file_key(str(fpath)) != f"{fhash}?json"
+
+
+def test_cached_local_file_keys(tmp_path, mocker):
+    fpath = tmp_path / "package.json"
+    fpath.write_text('{"name": "foo", "dependencies": {"bar": "1.0.0"}}')
+    fhash = tree.local_file_digest(str(fpath))
+
+    serialize_spy = mocker.spy(tree, "serialize_for_url")
+    for _ in range(2):
+        assert tree.cached_local_file_keys(str(fpath), ["name"]) == {
+            "name": "foo",
+        }
+    assert serialize_spy.call_count == 1
+    assert Cache.get(f'{fhash}?json#["name"]') == {"name": "foo"}
+    # the complete serialization is not cached
+    assert Cache.get(f"{fhash}?json") is None
+
+    # other serializers return the complete content
+    assert tree.cached_local_file_keys(
+        str(fpath),
+        ["name"],
+        serializer="text",
+    ) == ['{"name": "foo", "dependencies": {"bar": "1.0.0"}}']
@@ -0,0 +1,58 @@
+import os
+import time
+
+import pytest
+
+from project_config import tree
+from project_config.cache import Cache, CacheStore, MemoryCacheTier
+from project_config.utils.crypto import hash_file
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    store = CacheStore(str(tmp_path / "cache"))
+    monkeypatch.setattr(Cache, "_store", store)
+    monkeypatch.setattr(Cache, "_memory", MemoryCacheTier())
+    monkeypatch.setattr(Cache, "_expiration_time", 30)
+    yield
+    store.close()
+
+
+def _write_old_file(fpath, content):
+    fpath.write_text(content)
+    old_time = time.time() - 60
+    os.utime(fpath, (old_time, old_time))
+
+
+def test_unchanged_file_is_not_rehashed(tmp_path, mocker):
+    fpath = tmp_path / "package.json"
+    _write_old_file(fpath, '{"name": "foo"}')
+
+    hash_file_spy = mocker.spy(tree, "hash_file")
+    digest = tree.local_file_digest(str(fpath))
+    assert digest == hash_file(str(fpath))
+    assert tree.local_file_digest(str(fpath)) == digest
+    assert hash_file_spy.call_count == 1
+
+
+def test_changed_file_is_rehashed(tmp_path, mocker):
+    fpath = tmp_path / "package.json"
+    _write_old_file(fpath, '{"name": "foo"}')
+    digest = tree.local_file_digest(str(fpath))
+
+    hash_file_spy = mocker.spy(tree, "hash_file")
+    _write_old_file(fpath, '{"name": "foobar"}')
+    new_digest = tree.local_file_digest(str(fpath))
+    assert new_digest != digest
+    assert new_digest == hash_file(str(fpath))
+    assert hash_file_spy.call_count == 1
+
+
+def test_recently_modified_file_fingerprint_not_stored(tmp_path, mocker):
+    fpath = tmp_path / "package.json"
+    fpath.write_text('{"name": "foo"}')
+
+    hash_file_spy = mocker.spy(tree, "hash_file")
+    tree.local_file_digest(str(fpath))
+    tree.local_file_digest(str(fpath))
+    assert hash_file_spy.call_count == 2
@@ -0,0 +1,32 @@
+import threading
+
+from project_config import tree
+
+
+def test_record_inputs(tmp_path, chdir):
+    (tmp_path / "foo.json").write_text("{}")
+    (tmp_path / "bar.json").write_text("{}")
+
+    with chdir(tmp_path):
+        tree.cached_local_file("foo.json")
+        with tree.record_inputs() as inputs:
+            tree.cache_file("foo.json")
+            with tree.record_inputs() as nested_inputs:
+                tree.cached_local_file("bar.json")
+
+    assert inputs == {"files": {"foo.json", "bar.json"}, "urls": set()}
+    assert nested_inputs == {"files": {"bar.json"}, "urls": set()}
+
+
+def test_record_inputs_by_thread(tmp_path, chdir):
+    (tmp_path / "foo.json").write_text("{}")
+
+    with chdir(tmp_path), tree.record_inputs() as inputs:
+        thread = threading.Thread(
+            target=tree.cached_local_file,
+            args=("foo.json",),
+        )
+        thread.start()
+        thread.join()
+
+    assert inputs == {"files": set(), "urls": set()}
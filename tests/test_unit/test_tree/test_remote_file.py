@@ -0,0 +1,59 @@
+import hashlib
+
+import pytest
+
+from project_config import tree
+from project_config.cache import Cache, CacheStore, MemoryCacheTier
+from project_config.lock import freeze
+
+
+URL = "https://example.com/style.json"
+CONTENT = '{"rules": []}'
+DIGEST = hashlib.sha256(CONTENT.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    store = CacheStore(str(tmp_path / "cache"))
+    monkeypatch.setattr(Cache, "_store", store)
+    monkeypatch.setattr(Cache, "_memory", MemoryCacheTier())
+    monkeypatch.setattr(Cache, "_expiration_time", 30)
+    yield
+    store.close()
+
+
+@pytest.mark.parametrize(
+    "cached_value",
+    (
+        pytest.param(CONTENT, id="http-response"),
+        pytest.param({"_plain": CONTENT}, id="tree-entry"),
+    ),
+)
+def test_remote_file_digest(cached_value):
+    assert tree.remote_file_digest(URL) is None
+    Cache.set(URL, cached_value)
+    assert tree.remote_file_digest(URL) == DIGEST
+
+
+def test_cache_file_from_http_response():
+    Cache.set(URL, CONTENT)
+    tree.cache_file(URL, serializers=["json"])
+    assert Cache.get(URL) == {"_plain": CONTENT, "json": {"rules": []}}
+
+
+def test_cache_file_does_not_mutate_cached_entries():
+    cached_value = {"_plain": CONTENT}
+    Cache.set(URL, cached_value)
+    tree.cache_file(URL, serializers=["json"])
+    assert cached_value == {"_plain": CONTENT}
+    assert Cache.get(URL) == {"_plain": CONTENT, "json": {"rules": []}}
+
+
+def test_frozen_remote_files_are_not_cached():
+    freeze({URL: CONTENT})
+    try:
+        assert tree.fetch_remote_file(URL) == {"rules": []}
+        tree.cache_file(URL, serializers=["json"])
+    finally:
+        freeze(None)
+    assert Cache.get(URL) is None
@@ -0,0 +1,150 @@
+import http.server
+import threading
+import time
+
+import pytest
+
+from project_config.cache import Cache
+from project_config.utils.http import (
+    GET,
+    MAX_BACKOFF,
+    ProjectConfigHTTPError,
+    ProjectConfigTimeoutError,
+    backoff_delay,
+)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self.server.clients.add(self.client_address)
+        self.server.requests.append(dict(self.headers))
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = self.path.encode()
+        if self.headers.get("If-None-Match") == '"v1"':
+            status, body = 304, b""
+        self.send_response(status)
+        self.send_header("ETag", '"v1"')
+        if self.server.rate_limit is not None:
+            remaining, reset = self.server.rate_limit
+            self.send_header("X-RateLimit-Remaining", str(remaining))
+            self.send_header("X-RateLimit-Reset", str(reset))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.clients = set()
+    server.statuses = []
+    server.requests = []
+    server.rate_limit = None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_GET_reuses_connections(server):
+    for i in range(5):
+        assert GET(_url(server, f"/{i}"), use_cache=False) == f"/{i}"
+    assert len(server.clients) == 1
+
+
+def test_GET_retries_transient_errors(server):
+    server.statuses = [503, 502]
+    assert GET(_url(server, "/foo"), use_cache=False, sleep=0) == "/foo"
+    assert server.statuses == []
+
+
+def test_GET_does_not_retry_client_errors(server):
+    server.statuses = [404, 200]
+    with pytest.raises(ProjectConfigHTTPError, match="HTTP Error 404") as exc:
+        GET(_url(server, "/foo"), use_cache=False, sleep=0)
+    assert not isinstance(exc.value, ProjectConfigTimeoutError)
+    assert server.statuses == [200]
+
+
+def test_GET_timeout(server):
+    server.statuses = [503] * 1000
+    with pytest.raises(ProjectConfigTimeoutError, match="after 0.2 seconds"):
+        GET(_url(server, "/foo"), use_cache=False, timeout=0.2, sleep=0.01)
+
+
+@pytest.mark.parametrize("attempt", (0, 1, 5, 100))
+def test_backoff_delay(attempt):
+    for _ in range(50):
+        delay = backoff_delay(attempt, 0.5)
+        assert 0 <= delay <= min(MAX_BACKOFF, 0.5 * 2**attempt)
+
+
+@pytest.mark.parametrize(
+    ("expiration_times", "revalidated"),
+    (
+        pytest.param({"http-validation": 60}, True, id="validated"),
+        pytest.param({}, False, id="global-expiration"),
+    ),
+)
+def test_GET_revalidates_expired_responses(
+    server,
+    tmp_path,
+    monkeypatch,
+    expiration_times,
+    revalidated,
+):
+    monkeypatch.setattr(Cache, "_expiration_time", 0)
+    monkeypatch.setattr(
+        Cache,
+        "_namespaces_expiration_times",
+        expiration_times,
+    )
+    url = _url(server, f"/{tmp_path.name}")
+    assert GET(url) == f"/{tmp_path.name}"
+    assert "If-None-Match" not in server.requests[-1]
+
+    # the validators are stored without the response
+    assert Cache.get(f"hv://{url}") == (
+        {"etag": '"v1"', "last_modified": None} if revalidated else None
+    )
+
+    # the cached response has expired
+    assert GET(url) == f"/{tmp_path.name}"
+    assert len(server.requests) == 2
+    if revalidated:
+        assert server.requests[-1]["If-None-Match"] == '"v1"'
+    else:
+        assert "If-None-Match" not in server.requests[-1]
+
+
+def test_GET_waits_for_rate_limit_reset(server):
+    server.statuses = [403]
+    server.rate_limit = (0, int(time.time()) + 1)
+
+    start = time.time()
+    assert GET(_url(server, "/foo"), use_cache=False, sleep=0) == "/foo"
+    assert time.time() >= server.rate_limit[1] - 1
+    assert time.time() - start < 3
+    assert len(server.requests) == 2
+
+
+def test_GET_rate_limit_exceeded_until_after_timeout(server):
+    server.rate_limit = (0, int(time.time()) + 100)
+    assert GET(_url(server, "/foo"), use_cache=False) == "/foo"
+
+    # the next request is not sent because would be rejected
+    start = time.time()
+    with pytest.raises(ProjectConfigTimeoutError, match="Rate limit of"):
+        GET(_url(server, "/bar"), use_cache=False, timeout=5)
+    assert time.time() - start < 1
+    assert len(server.requests) == 1
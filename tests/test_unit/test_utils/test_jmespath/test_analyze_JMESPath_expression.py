@@ -0,0 +1,85 @@
+import pytest
+
+from project_config.utils.jmespath import (
+    ANY_JMESPATH_KEY as ANY,
+    analyze_JMESPath_expression,
+)
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected_paths"),
+    (
+        ("foo", {("foo",)}),
+        ("foo.bar[0].baz", {("foo", "bar", 0, "baz")}),
+        ("foo[1:].bar", {("foo", ANY, "bar")}),
+        ("foo[*].bar", {("foo", ANY, "bar")}),
+        ("foo.*.bar", {("foo", ANY, "bar")}),
+        (
+            "foo[?bar == `1`].baz",
+            {("foo", ANY, "bar"), ("foo", ANY, "baz")},
+        ),
+        ("foo[].bar | [0]", {("foo",)}),
+        ("foo | bar", {("foo", "bar")}),
+        ("foo || bar.baz", {("foo",), ("bar", "baz")}),
+        ("{a: foo, b: bar}", {("foo",), ("bar",)}),
+        ("[foo, bar[1:2]]", {("foo",), ("bar", ANY)}),
+        ("sort_by(foo, &bar)[0]", {("foo",)}),
+        ("contains(foo, `1`) && !bar", {("foo",), ("bar",)}),
+        ("length(foo).bar", {("foo",)}),
+        ("`1`", set()),
+        ("rootdir_name()", set()),
+        ("[0]", {(0,)}),
+        ("*.foo", {(ANY, "foo")}),
+        ("@", None),
+        ("keys(@)", None),
+        ("foo || @", None),
+    ),
+)
+def test_analyze_JMESPath_expression_paths(expression, expected_paths):
+    analysis = analyze_JMESPath_expression(expression)
+    assert analysis.paths == (
+        None if expected_paths is None else frozenset(expected_paths)
+    )
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected_result"),
+    (
+        ("foo.bar[0]", {"foo"}),
+        ("foo || bar.baz", {"foo", "bar"}),
+        ("`1`", set()),
+        ("[0]", None),
+        ("*.foo", None),
+        ("@", None),
+    ),
+)
+def test_analyze_JMESPath_expression_top_level_keys(
+    expression,
+    expected_result,
+):
+    analysis = analyze_JMESPath_expression(expression)
+    assert analysis.top_level_keys == expected_result
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected_functions", "expected_impure"),
+    (
+        ("foo", set(), False),
+        ("glob", set(), False),
+        ("isdir.enabled", set(), False),
+        ("length(foo) > `1`", {"length"}, False),
+        ("foo[?starts_with(@, 'a')]", {"starts_with"}, False),
+        ("glob('*.py')", {"glob"}, True),
+        ("map(&isfile(@), foo)", {"map", "isfile"}, True),
+        ("getenv('FOO') || `null`", {"getenv"}, True),
+        ("rootdir_name()", {"rootdir_name"}, True),
+    ),
+)
+def test_analyze_JMESPath_expression_functions(
+    expression,
+    expected_functions,
+    expected_impure,
+):
+    analysis = analyze_JMESPath_expression(expression)
+    assert analysis.functions == expected_functions
+    assert analysis.impure is expected_impure
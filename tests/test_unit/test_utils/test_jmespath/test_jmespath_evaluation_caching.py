@@ -14,18 +14,80 @@ ROOTDIR_NAME = os.path.basename(os.getcwd())
     ("expression", "instance", "expected_result"),
     (
         pytest.param("rootdir_name()", {}, ROOTDIR_NAME, id="rootdir_name"),
-        pytest.param(
-            "rootdir",
-            {"rootdir": "foobarbaz"},
-            "foobarbaz",
-            id="rootdir",
-        ),
         pytest.param(
             "getenv('PROJECT_CONFIG')",
             "{}",
             "true",
             id="getenv(...)",
         ),
+        pytest.param(
+            "isfile(foo)",
+            {"foo": "foo.json"},
+            True,
+            id="isfile(...)",
+        ),
+        pytest.param(
+            "isdir(foo)",
+            {"foo": "foo.json"},
+            False,
+            id="isdir(...)",
+        ),
+        pytest.param(
+            "exists(foo)",
+            {"foo": "foo.json"},
+            True,
+            id="exists(...)",
+        ),
+        pytest.param(
+            "length(glob('*.json')) == `1`",
+            {},
+            True,
+            id="glob(...)",
+        ),
+        pytest.param(
+            "foo[?isfile(@)]",
+            {"foo": ["foo.json", "bar.json"]},
+            ["foo.json"],
+            id="filter",
+        ),
+    ),
+)
+def test_excluded_expressions_from_caching_are_not_cached(
+    expression,
+    instance,
+    expected_result,
+    mocker,
+    monkeypatch,
+    tmp_path,
+):
+    """Assert that excluded expressions are not cached."""
+    # set environment variables used by tests
+    monkeypatch.setenv("PROJECT_CONFIG", "true")
+    monkeypatch.setenv("PROJECT_CONFIG_ROOTDIR", ROOTDIR_NAME)
+
+    # files read by the expressions
+    tmp_path.joinpath("foo.json").write_text("{}")
+    monkeypatch.chdir(tmp_path)
+
+    cache_spy = mocker.spy(jmespath_utils.Cache, "get")
+    result = jmespath_utils.evaluate_JMESPath(
+        jmespath_utils.jmespath_compile(expression),
+        instance,
+        "e3b0c44298fc1c149afbf4c8996fb924?json",
+    )
+    assert result == expected_result
+    assert cache_spy.call_count == 0, "Cache.get() has been called"
+
+
+@pytest.mark.parametrize(
+    ("expression", "instance", "expected_result"),
+    (
+        pytest.param(
+            "rootdir",
+            {"rootdir": "foobarbaz"},
+            "foobarbaz",
+            id="rootdir",
+        ),
         pytest.param(
             "listdir",
             {"listdir": "bar"},
@@ -86,24 +148,73 @@ ROOTDIR_NAME = os.path.basename(os.getcwd())
             "bar",
             id="glob",
         ),
+        pytest.param(
+            "regex_matchall",
+            {"regex_matchall": "bar"},
+            "bar",
+            id="regex_matchall",
+        ),
     ),
 )
-def test_excluded_expressions_from_caching_are_not_cached(
+def test_keys_named_as_impure_functions_are_cached(
     expression,
     instance,
     expected_result,
     mocker,
-    monkeypatch,
 ):
-    """Assert that excluded expressions are not cached."""
-    # set environment variables used by tests
-    monkeypatch.setenv("PROJECT_CONFIG", "true")
-    monkeypatch.setenv("PROJECT_CONFIG_ROOTDIR", ROOTDIR_NAME)
-
+    """Assert that only calls to impure functions disable the caching."""
     cache_spy = mocker.spy(jmespath_utils.Cache, "get")
     result = jmespath_utils.evaluate_JMESPath(
         jmespath_utils.jmespath_compile(expression),
         instance,
+        f"{os.urandom(16).hex()}?json",
     )
     assert result == expected_result
+    assert cache_spy.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected_result"),
+    (
+        pytest.param("foo", "bar", id="string"),
+        pytest.param("baz", None, id="null"),
+    ),
+)
+def test_evaluations_are_cached_by_instance_key(
+    expression,
+    expected_result,
+    mocker,
+):
+    """Assert that evaluations are reused for the same instance key."""
+    instance_key = f"{os.urandom(16).hex()}?json"
+    compiled_expression = jmespath_utils.jmespath_compile(expression)
+
+    search_spy = mocker.spy(jmespath_utils, "_search_JMESPath")
+    for _ in range(2):
+        assert (
+            jmespath_utils.evaluate_JMESPath(
+                compiled_expression,
+                {"foo": "bar"},
+                instance_key,
+            )
+            == expected_result
+        )
+    assert search_spy.call_count == 1
+
+    # other instances are evaluated again
+    jmespath_utils.evaluate_JMESPath(
+        compiled_expression,
+        {"foo": "bar"},
+        f"{os.urandom(16).hex()}?json",
+    )
+    assert search_spy.call_count == 2  # noqa: PLR2004
+
+
+def test_evaluations_without_instance_key_are_not_cached(mocker):
+    """Assert that evaluations without instance key are not cached."""
+    cache_spy = mocker.spy(jmespath_utils.Cache, "get")
+    jmespath_utils.evaluate_JMESPath(
+        jmespath_utils.jmespath_compile("foo"),
+        {"foo": "bar"},
+    )
     assert cache_spy.call_count == 0, "Cache.get() has been called"
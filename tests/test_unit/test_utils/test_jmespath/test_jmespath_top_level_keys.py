@@ -0,0 +1,34 @@
+import pytest
+
+from project_config.utils.jmespath import (
+    compile_JMESPath_expression,
+    jmespath_top_level_keys,
+)
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected_result"),
+    (
+        ("foo", {"foo"}),
+        ("foo.bar[0].baz", {"foo"}),
+        ("foo[?bar == `1`].baz", {"foo"}),
+        ("foo[].bar | [0]", {"foo"}),
+        ("foo || bar.baz", {"foo", "bar"}),
+        ("{a: foo, b: bar}", {"foo", "bar"}),
+        ("[foo, bar[1:2]]", {"foo", "bar"}),
+        ("sort_by(foo, &bar)[0]", {"foo"}),
+        ("contains(foo, `1`) && !bar", {"foo", "bar"}),
+        ("`1`", set()),
+        ("rootdir_name()", set()),
+        ("@", None),
+        ("[0]", None),
+        ("*.foo", None),
+        ("keys(@)", None),
+        ("foo || @", None),
+    ),
+)
+def test_jmespath_top_level_keys(expression, expected_result):
+    assert (
+        jmespath_top_level_keys(compile_JMESPath_expression(expression))
+        == expected_result
+    )